@@ -0,0 +1,8 @@
+"""
+Purpose: `python -m app serve` entry point; see app.server.
+"""
+
+from app.server import main
+
+if __name__ == "__main__":
+    main()
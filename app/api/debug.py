@@ -0,0 +1,79 @@
+import asyncio
+import cProfile
+import hmac
+import io
+import pstats
+import threading
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.service.profiler import SamplingProfiler
+from app.settings import settings
+
+# Router for opt-in diagnostics. Hidden from the OpenAPI schema and disabled
+# unless ROMAN_PROFILING_ENABLED is set.
+router = APIRouter(
+    prefix="/debug",
+    include_in_schema=False
+)
+
+# Only one profile may run at a time; overlapping profilers would skew each other.
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0, description="How long to profile live traffic"),
+    format: str = Query("collapsed", pattern="^(collapsed|pstats)$"),
+    token: Optional[str] = Header(None, alias="X-Debug-Token"),
+):
+    """
+    Profile the event loop thread against live traffic for `seconds`.
+
+    - `format=collapsed` samples stacks periodically and returns collapsed stacks
+      (one `frame;frame;frame count` line per distinct stack) for flame graphs.
+    - `format=pstats` runs cProfile on the event loop thread and returns the
+      top functions by cumulative time.
+
+    Returns 404 unless profiling is enabled, and 403 when a token is configured
+    and the `X-Debug-Token` header does not match.
+    """
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # Constant-time comparison, so response timing does not reveal how much of the token matched.
+    # Bytes rather than str: compare_digest rejects non-ASCII strings.
+    if settings.profiling_token and not hmac.compare_digest(
+        (token or "").encode("utf-8"), settings.profiling_token.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+    if seconds > settings.profiling_max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must not exceed {settings.profiling_max_seconds}"
+        )
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    async with _profile_lock:
+        if format == "pstats":
+            # cProfile hooks the current thread, which is the event loop thread,
+            # so every request served while we sleep is included.
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(50)
+            return output.getvalue()
+
+        sampler = SamplingProfiler(threading.get_ident(), settings.profiling_interval_seconds).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        return sampler.collapsed()
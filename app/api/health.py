@@ -1,9 +1,25 @@
+import threading
+
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 # Router dedicated to lightweight operational endpoints
 # such as health and readiness checks.
 router = APIRouter()
 
+# Set once the application has warmed up (see app.main.lifespan), cleared on shutdown.
+_ready = threading.Event()
+
+
+def set_ready(ready: bool) -> None:
+    """
+    Mark the process as ready (or no longer ready) to take traffic.
+    """
+    if ready:
+        _ready.set()
+    else:
+        _ready.clear()
+
 @router.get("/health")
 def health_check():
     """
@@ -14,3 +30,17 @@ def health_check():
     immediately, making it suitable for liveness probes.
     """
     return {"status": "ok"}
+
+
+@router.get("/ready")
+def readiness_check():
+    """
+    Readiness endpoint used by load balancers and orchestrators to decide
+    whether to route traffic to this process.
+
+    Unlike /health, it returns 503 until tables and caches are warmed up, and
+    again once shutdown has begun, so a cold or draining worker receives no traffic.
+    """
+    if not _ready.is_set():
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
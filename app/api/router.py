@@ -1,27 +1,321 @@
-from fastapi import APIRouter, Query, HTTPException, Request
-from typing import Optional
+from fastapi import APIRouter, Body, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from functools import partial
+from typing import AsyncIterator, List, Optional, Union
 import asyncio
+import hashlib
+import json
+import logging
 import time
 
-from app.service.roman import RomanNumeralTranslateService
+from app import __version__
+from app.service.roman import RomanNumeralTranslateService, STANDARD_MAX
+from app.service import export
+from app.service import formats
 from app.models import (
     RomanNumeralResponse,
     RomanNumeralRangeResponse,
+    IntegerResponse,
+    BatchResponse,
     ErrorResponse
 )
 from app.service.metrics import (
-    REQUEST_COUNT,
-    REQUEST_LATENCY,
-    CONVERSION_COUNT
+    CONVERSIONS_SINGLE,
+    CONVERSIONS_RANGE,
+    CONVERSIONS_REVERSE,
+    CONVERSIONS_BATCH,
+    CONVERSIONS_EXPORT,
+    BATCH_SIZE,
+    StageTimer,
+    observe_request,
+    observe_stage
 )
-from app.logs.utils import get_logger
+from app.service.cache import ResponseCache
+from app.service.compression import compress, negotiate
+from app.service.offload import RangeOffloader
+from app.logs.context import LogSampler, request_id_var
+from app.settings import settings
+
+# Request IDs are attached to records by RequestContextFilter, so a plain
+# module logger is enough; no per-request LoggerAdapter is built.
+logger = logging.getLogger(__name__)
+
+# Thins out routine success lines; warnings, errors and slow requests are always logged.
+log_sampler = LogSampler(settings.log_sample_rate, settings.log_slow_threshold_seconds)
 
 router = APIRouter(
     prefix="/v1",
     tags=["Roman Numerals"]
 )
 
-service = RomanNumeralTranslateService()
+service = RomanNumeralTranslateService(
+    max_value=settings.max_value,
+    vinculum=settings.vinculum,
+    max_range_width=settings.max_range_width,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Final JSON bytes keyed by normalized parameters; conversion output is deterministic.
+response_cache = ResponseCache(settings.response_cache_bytes)
+
+# Serialized export files keyed by (format, start, stop); kept apart so large
+# files cannot evict the small, hot conversion bodies.
+export_cache = ResponseCache(settings.export_cache_bytes, name="export")
+
+# Wide ranges are converted in chunks on a bounded pool so they do not stall the event loop.
+offloader = RangeOffloader(
+    workers=settings.offload_workers,
+    kind=settings.offload_pool,
+    chunk_size=settings.offload_chunk_size,
+    max_pending=settings.offload_max_pending,
+)
+
+
+def render_json(content) -> bytes:
+    """
+    Serialize a response body exactly as FastAPI's default JSONResponse would.
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def build_range(min_value: int, max_value: int) -> list[dict]:
+    """
+    Build the `conversions` list for an inclusive range in one synchronous pass.
+
+    The numerals come from a single table slice, so the only per-item work
+    is assembling the response dict.
+    """
+    outputs = service.convert_many(min_value, max_value + 1)
+    return [
+        {"input": str(n), "output": output}
+        for n, output in zip(range(min_value, max_value + 1), outputs)
+    ]
+
+
+def prime_response_cache() -> None:
+    """
+    Pre-render every standard single conversion and the full-domain range into the response cache.
+
+    Run before workers fork (or at startup), so the first requests are already cache hits.
+    """
+    upper = min(service.max_value, STANDARD_MAX)
+    for n in range(service.min_value, upper + 1):
+        response_cache.put(("single", n, "json"), render_json({"input": str(n), "output": service.convert(n)}))
+
+    if service.max_range_width is None or upper - service.min_value + 1 <= service.max_range_width:
+        response_cache.put(
+            ("range", service.min_value, upper, "json"),
+            render_json({"conversions": build_range(service.min_value, upper)}),
+        )
+
+
+def single_body(query: int, timer: StageTimer, fmt: str = "json") -> bytes:
+    """
+    Body of a single conversion in `fmt`, from the response cache when possible.
+
+    Shared by the HTTP and WebSocket routes so both validate and render identically.
+    """
+    CONVERSIONS_SINGLE.inc()
+    timer.mark("validation")
+
+    key = ("single", query, fmt)
+    body = response_cache.get(key)
+    if body is None:
+        output = service.convert(query)
+        timer.mark("conversion")
+        if fmt == "json":
+            body = render_json({
+                "input": str(query),
+                "output": output,
+            })
+        else:
+            body = formats.encode_single(fmt, query, output)
+        response_cache.put(key, body)
+    timer.mark("serialization")
+    return body
+
+
+async def range_body(min_value: int, max_value: int, timer: StageTimer, fmt: str = "json") -> bytes:
+    """
+    Body of a buffered inclusive range in `fmt`, from the response cache when possible.
+
+    Wide JSON ranges are converted and rendered on the offload pool; narrow ones inline.
+    Binary formats are encoded straight from one table slice.
+    """
+    key = ("range", min_value, max_value, fmt)
+    body = response_cache.get(key)
+    if body is None:
+        if fmt != "json":
+            outputs = service.convert_many(min_value, max_value + 1)
+            timer.mark("conversion")
+            body = formats.encode_range(fmt, min_value, outputs)
+        elif settings.offload_threshold and max_value - min_value + 1 > settings.offload_threshold:
+            # Conversion and rendering both happen on the pool, in ordered chunks.
+            body = await offloader.render_range(service, min_value, max_value + 1)
+            timer.mark("conversion")
+        else:
+            # Narrow ranges are cheaper inline than a round trip through the pool.
+            conversions = build_range(min_value, max_value)
+            timer.mark("conversion")
+            body = render_json({"conversions": conversions})
+        response_cache.put(key, body)
+    timer.mark("serialization")
+    return body
+
+
+def batch_body(items: list, timer: StageTimer, fmt: str = "json") -> bytes:
+    """
+    Body of a batch conversion in `fmt`; per-item failures are reported inline.
+
+    Raises ValueError for an empty or oversized batch.
+    """
+    if not items:
+        raise ValueError("Batch must contain at least one item")
+    if len(items) > settings.max_batch_size:
+        raise ValueError(f"Batch cannot contain more than {settings.max_batch_size} items")
+
+    CONVERSIONS_BATCH.inc()
+    BATCH_SIZE.observe(len(items))
+    timer.mark("validation")
+
+    results = service.convert_batch(items)
+    timer.mark("conversion")
+
+    if fmt == "json":
+        body = render_json({"results": [
+            {"input": str(item), "output": output}
+            if error is None else
+            {"input": str(item), "error": error}
+            for item, (output, error) in zip(items, results)
+        ]})
+    else:
+        body = formats.encode_batch(fmt, items, results)
+    timer.mark("serialization")
+    return body
+
+
+def record_request(request: Request, endpoint: str, start_time: float, sampled: bool, status: int):
+    """
+    Record latency, request count and the `request_completed` log line for a finished request.
+
+    The log line is written when the request was sampled at entry, failed, or was slow.
+    """
+    latency = time.perf_counter() - start_time
+
+    observe_request(request.method, endpoint, status, latency, request_id_var.get())
+
+    if log_sampler.should_log_completion(sampled, status, latency):
+        log_start = time.perf_counter()
+        logger.info(
+            "request_completed",
+            extra={"latency_seconds": latency, "status": status}
+        )
+        observe_stage(endpoint, "logging", time.perf_counter() - log_start)
+
+
+def etag_for(*params) -> str:
+    """
+    Strong ETag for a response, derived from its normalized parameters.
+
+    Output is a pure function of the parameters, the service version and the
+    configured domain, so the tag is known before any conversion or
+    serialization work is done.
+    """
+    key = repr((__version__, service.max_value, service.vinculum) + params)
+    return '"' + hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def caching_headers(etag: str) -> dict:
+    """
+    `ETag` and `Cache-Control` headers sent with successful and 304 responses.
+    """
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.cache_max_age_seconds}",
+    }
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """
+    Whether the request's `If-None-Match` matches `etag` (weak comparison, RFC 9110).
+
+    `etag` must be the tag of the representation this request would get, so a
+    compressed variant's tag only matches when the same encoding is negotiated.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def response_encoding(request: Request, body: bytes) -> str | None:
+    """
+    Content coding `body` is sent with: the client's preferred supported encoding,
+    for bodies of at least `compression_min_bytes`; None sends it as is.
+    """
+    if len(body) < settings.compression_min_bytes:
+        return None
+    return negotiate(request.headers.get("accept-encoding", ""))
+
+
+def encoded_etag(etag: str, encoding: str | None) -> str:
+    """
+    Tag of the `encoding` representation; each representation needs its own strong validator.
+    """
+    return etag if encoding is None else etag[:-1] + f'-{encoding}"'
+
+
+def encode_body(key: tuple, body: bytes, encoding: str) -> bytes:
+    """
+    Compress a cached body, compressing at most once.
+
+    The compressed bytes are cached under the plain key plus the encoding.
+    """
+    encoded_key = key + (encoding,)
+    encoded = response_cache.get(encoded_key)
+    if encoded is None:
+        encoded = compress(body, encoding)
+        response_cache.put(encoded_key, encoded)
+    return encoded
+
+
+def wants_stream(request: Request, stream: bool) -> bool:
+    """
+    A range response is streamed when asked for with `stream=true` or `Accept: application/x-ndjson`.
+    """
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def stream_range(min_value: int, max_value: int, on_complete) -> AsyncIterator[bytes]:
+    """
+    Yield an inclusive range as NDJSON, one chunk of lines at a time.
+
+    Only one chunk is held in memory, so memory stays flat regardless of the
+    range width. `on_complete` runs once the body has been fully sent (or the
+    client went away), which is when request metrics are accurate.
+    """
+    chunk_size = settings.stream_chunk_size
+    try:
+        for start in range(min_value, max_value + 1, chunk_size):
+            stop = min(start + chunk_size, max_value + 1)
+            outputs = service.convert_many(start, stop)
+            # Numerals and integers never need JSON escaping, so format lines directly.
+            yield "".join(
+                f'{{"input":"{n}","output":"{output}"}}\n'
+                for n, output in zip(range(start, stop), outputs)
+            ).encode("utf-8")
+    finally:
+        # The 200 status line was sent with the first chunk, so that is what the client saw.
+        on_complete(200)
 
 
 @router.get(
@@ -31,7 +325,10 @@ service = RomanNumeralTranslateService()
         "Convert a single integer or a range of integers into Roman numerals.\n\n"
         "- Use `query` for single conversion\n"
         "- Use `min` and `max` for range conversion\n"
-        "- Valid values: 1–255"
+        "- Add `stream=true` or `Accept: application/x-ndjson` to stream a range as NDJSON\n"
+        "- Send `Accept: application/msgpack` or `Accept: application/vnd.roman.binary` for a compact binary body\n"
+        f"- Valid values: {service.min_value}–{service.max_value}"
+        f" (buffered ranges up to {settings.max_range_width} values)"
     ),
     response_model=RomanNumeralResponse | RomanNumeralRangeResponse,
     responses={
@@ -58,11 +355,19 @@ async def convert_roman(
         description="Maximum value for range conversion",
         examples=10
     ),
+    stream: bool = Query(
+        False,
+        description="Stream a range conversion as newline-delimited JSON",
+    ),
 ):
-    logger = get_logger(__name__, request.state.request_id)
-    start_time = time.time()
+    start_time = time.perf_counter()
+    sampled = log_sampler.sample()
     endpoint = "/v1/romannumeral"
     HTTPstatus = 500  # safe default for metrics/logging
+    streaming = False  # streamed responses record metrics when the body completes
+
+    complete = partial(record_request, request, endpoint, start_time, sampled)
+    timer = StageTimer(endpoint)
 
     if query is not None and (min is not None or max is not None):
         HTTPstatus = 400
@@ -72,38 +377,74 @@ async def convert_roman(
         )
 
     try:
-        logger.info("request_received")
+        if sampled:
+            logger.info("request_received")
+        timer.mark("logging")
 
         # ---- Single conversion ----
+        fmt = formats.negotiate(request.headers.get("accept", ""))
+        media_type = formats.MEDIA_TYPES[fmt]
+
         if query is not None:
-            CONVERSION_COUNT.labels(type="single").inc()
+            # Bounds first: invalid input has no representation, so even `If-None-Match: *` gets a 400.
+            service.check_range(query, query + 1)
+            etag = etag_for("single", query, fmt)
+            headers = {**caching_headers(etag), "Vary": "Accept"}
+            # A client (or CDN) revalidating a response it already holds needs no conversion.
+            if not_modified(request, etag):
+                HTTPstatus = 304
+                return Response(status_code=304, headers=headers)
 
-            result = {
-                "input": str(query),
-                "output": service.convert(query),
-            }
+            body = single_body(query, timer, fmt)
 
             HTTPstatus = 200
-            return result
+            return Response(content=body, media_type=media_type, headers=headers)
 
         # ---- Range conversion ----
         if min is not None and max is not None:
             if min >= max:
                 raise ValueError("min must be less than max")
+            # Validated before revalidation, and up front so a streamed body never starts on bad input.
+            service.check_range(min, max + 1)
+
+            streamed = wants_stream(request, stream)
+            body, encoding = None, None
+            if not streamed and negotiate(request.headers.get("accept-encoding", "")) is not None:
+                # Whether the compressed representation (and its tag) is sent depends on the
+                # body size, so fetch the body, usually cached, before revalidating.
+                body = await range_body(min, max, timer, fmt)
+                encoding = response_encoding(request, body)
+
+            # JSON and NDJSON are different representations, and Accept selects between them.
+            etag = encoded_etag(etag_for("range", min, max, "ndjson" if streamed else fmt), encoding)
+            headers = {**caching_headers(etag), "Vary": "Accept, Accept-Encoding"}
+            if not_modified(request, etag):
+                HTTPstatus = 304
+                return Response(status_code=304, headers=headers)
+
+            CONVERSIONS_RANGE.inc()
 
-            CONVERSION_COUNT.labels(type="range").inc()
+            if streamed:
+                streaming = True
+                HTTPstatus = 200
+                return StreamingResponse(
+                    stream_range(min, max, complete),
+                    media_type=NDJSON_MEDIA_TYPE,
+                    headers=headers,
+                )
 
-            async def convert_async(n: int):
-                return {
-                    "input": str(n),
-                    "output": service.convert(n),
-                }
+            timer.mark("validation")
 
-            tasks = [convert_async(i) for i in range(min, max + 1)]
-            results = await asyncio.gather(*tasks)
+            if body is None:
+                body = await range_body(min, max, timer, fmt)
+
+            if encoding is not None:
+                body = encode_body(("range", min, max, fmt), body, encoding)
+                headers["Content-Encoding"] = encoding
+            timer.mark("compression")
 
             HTTPstatus = 200
-            return {"conversions": results}
+            return Response(content=body, media_type=media_type, headers=headers)
 
         raise ValueError("Invalid query parameters")
 
@@ -116,16 +457,263 @@ async def convert_roman(
         raise HTTPException(status_code=400, detail=str(e))
 
     finally:
-        latency = time.time() - start_time
+        if not streaming:
+            complete(HTTPstatus)
 
-        REQUEST_LATENCY.labels(endpoint=endpoint).observe(latency)
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=str(HTTPstatus),
-        ).inc()
 
-        logger.info(
-            "request_completed",
-            extra={"latency_seconds": latency, "status": HTTPstatus}
+@router.get(
+    "/integer",
+    summary="Convert a Roman numeral to an integer",
+    description=(
+        "Convert a canonical Roman numeral back into an integer.\n\n"
+        "- Use `numeral` for the value to parse\n"
+        "- Only canonical (minimal, subtractive) upper-case numerals are accepted\n"
+        f"- Valid values: {service.min_value}–{service.max_value}"
+    ),
+    response_model=IntegerResponse,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "Malformed, non-canonical or out-of-range numeral"
+        }
+    }
+)
+async def convert_integer(
+    request: Request,
+    numeral: Optional[str] = Query(
+        None,
+        description="Roman numeral to convert",
+        examples="XIV"
+    ),
+):
+    start_time = time.perf_counter()
+    sampled = log_sampler.sample()
+    endpoint = "/v1/integer"
+    HTTPstatus = 500  # safe default for metrics/logging
+    timer = StageTimer(endpoint)
+
+    try:
+        if sampled:
+            logger.info("request_received")
+        timer.mark("logging")
+
+        if numeral is None:
+            raise ValueError("Invalid query parameters")
+
+        # Parsing is a table lookup; doing it first means an invalid numeral is a 400
+        # even for `If-None-Match: *`, which would otherwise match any representation.
+        value = service.parse(numeral)
+        timer.mark("validation")
+
+        etag = etag_for("reverse", numeral)
+        headers = caching_headers(etag)
+        if not_modified(request, etag):
+            HTTPstatus = 304
+            return Response(status_code=304, headers=headers)
+
+        CONVERSIONS_REVERSE.inc()
+
+        key = ("reverse", numeral)
+        body = response_cache.get(key)
+        if body is None:
+            timer.mark("conversion")
+            body = render_json({
+                "input": numeral,
+                "output": str(value),
+            })
+            response_cache.put(key, body)
+        timer.mark("serialization")
+
+        HTTPstatus = 200
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    except ValueError as e:
+        HTTPstatus = 400
+        logger.warning(
+            "invalid_input",
+            extra={"error": str(e), "numeral": numeral}
         )
+        raise HTTPException(status_code=400, detail=str(e))
+
+    finally:
+        record_request(request, endpoint, start_time, sampled, HTTPstatus)
+
+
+@router.post(
+    "/romannumeral/batch",
+    summary="Convert a batch of integers and Roman numerals",
+    description=(
+        "Convert many non-contiguous values in one request.\n\n"
+        "- Integers are converted to Roman numerals\n"
+        "- Strings are parsed as Roman numerals and converted to integers\n"
+        "- Results are returned in request order; invalid items carry an `error` instead of an `output`\n"
+        "- Send `Accept: application/msgpack` or `Accept: application/vnd.roman.binary` for a compact binary body\n"
+        f"- At most {settings.max_batch_size} items per request"
+    ),
+    response_model=BatchResponse,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "Empty or oversized batch"
+        }
+    }
+)
+async def convert_batch(
+    request: Request,
+    items: List[Union[int, str]] = Body(
+        ...,
+        description="Integers and/or Roman numerals to convert",
+        examples=[[10, 4, "XIV", 300]]
+    ),
+):
+    start_time = time.perf_counter()
+    sampled = log_sampler.sample()
+    endpoint = "/v1/romannumeral/batch"
+    HTTPstatus = 500  # safe default for metrics/logging
+    timer = StageTimer(endpoint)
+
+    try:
+        if sampled:
+            logger.info("request_received")
+        timer.mark("logging")
+
+        fmt = formats.negotiate(request.headers.get("accept", ""))
+        body = batch_body(items, timer, fmt)
+
+        HTTPstatus = 200
+        return Response(content=body, media_type=formats.MEDIA_TYPES[fmt], headers={"Vary": "Accept"})
+
+    except ValueError as e:
+        HTTPstatus = 400
+        logger.warning(
+            "invalid_input",
+            extra={"error": str(e), "items": len(items)}
+        )
+        raise HTTPException(status_code=400, detail=str(e))
+
+    finally:
+        record_request(request, endpoint, start_time, sampled, HTTPstatus)
+
+
+@router.get(
+    "/romannumeral/export",
+    summary="Download the conversion table as CSV, Arrow or Parquet",
+    description=(
+        "Download conversions as a file with `input` and `output` columns.\n\n"
+        "- `format` is one of `csv`, `arrow` (IPC stream) or `parquet`; the last two need pyarrow\n"
+        "- Use `min` and `max` for a sub-range; the whole domain is exported by default\n"
+        f"- At most {settings.export_max_rows} rows per file\n"
+        "- Files are cached and support `ETag`/`If-None-Match` and single `Range` requests\n"
+        f"- Valid values: {service.min_value}–{service.max_value}"
+    ),
+    response_class=Response,
+    responses={
+        200: {"content": {media_type: {} for media_type in export.MEDIA_TYPES.values()}},
+        400: {
+            "model": ErrorResponse,
+            "description": "Unknown format, missing pyarrow, invalid range or too many rows"
+        },
+        416: {"description": "Requested byte range cannot be satisfied"}
+    }
+)
+async def export_table(
+    request: Request,
+    format: str = Query(
+        "csv",
+        description="Output format: csv, arrow or parquet",
+        examples="csv"
+    ),
+    min: Optional[int] = Query(
+        None,
+        description="First value to export (defaults to the smallest supported value)",
+        examples=1
+    ),
+    max: Optional[int] = Query(
+        None,
+        description="Last value to export (defaults to the largest supported value)",
+        examples=10
+    ),
+):
+    start_time = time.perf_counter()
+    sampled = log_sampler.sample()
+    endpoint = "/v1/romannumeral/export"
+    HTTPstatus = 500  # safe default for metrics/logging
+    timer = StageTimer(endpoint)
+
+    try:
+        if sampled:
+            logger.info("request_received")
+        timer.mark("logging")
+
+        if format not in export.MEDIA_TYPES:
+            raise ValueError(f"format must be one of: {', '.join(export.MEDIA_TYPES)}")
+        start = service.min_value if min is None else min
+        stop = (service.max_value if max is None else max) + 1
+        service.check_range(start, stop)
+        if stop - start > settings.export_max_rows:
+            raise ValueError(
+                f"Export cannot contain more than {settings.export_max_rows} rows; "
+                "use min and max to download it in parts"
+            )
+
+        CONVERSIONS_EXPORT.inc()
+        etag = etag_for("export", format, start, stop)
+        headers = {
+            **caching_headers(etag),
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": (
+                f'attachment; filename="roman-{start}-{stop - 1}.{export.EXTENSIONS[format]}"'
+            ),
+        }
+        timer.mark("validation")
+
+        # The tag is known up front, so a revalidation never touches the file.
+        if not_modified(request, etag):
+            HTTPstatus = 304
+            return Response(status_code=304, headers=headers)
+
+        key = (format, start, stop)
+        body = export_cache.get(key)
+        if body is None:
+            # Serializing a large file takes seconds; keep the event loop serving meanwhile.
+            body = await asyncio.get_running_loop().run_in_executor(
+                None, export.serialize, service, format, start, stop, settings.max_range_width
+            )
+            timer.mark("conversion")
+            export_cache.put(key, body)
+        timer.mark("serialization")
+
+        media_type = export.MEDIA_TYPES[format]
+        range_header = request.headers.get("range")
+        if range_header:
+            try:
+                byte_range = export.parse_range(range_header, len(body))
+            except ValueError:
+                HTTPstatus = 416
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{len(body)}"},
+                )
+            if byte_range is not None:
+                first, last = byte_range
+                HTTPstatus = 206
+                return Response(
+                    content=body[first:last + 1],
+                    status_code=206,
+                    media_type=media_type,
+                    headers={**headers, "Content-Range": f"bytes {first}-{last}/{len(body)}"},
+                )
+
+        HTTPstatus = 200
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    except ValueError as e:
+        HTTPstatus = 400
+        logger.warning(
+            "invalid_input",
+            extra={"error": str(e), "format": format, "min": min, "max": max}
+        )
+        raise HTTPException(status_code=400, detail=str(e))
+
+    finally:
+        record_request(request, endpoint, start_time, sampled, HTTPstatus)
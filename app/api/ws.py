@@ -0,0 +1,195 @@
+import asyncio
+import json
+import logging
+import time
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
+from starlette.status import WS_1009_MESSAGE_TOO_BIG
+
+from app.api.router import single_body, range_body, batch_body, render_json
+from app.service.metrics import CONVERSIONS_RANGE, StageTimer, observe_request
+from app.logs.context import request_id_var
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/v1",
+    tags=["Roman Numerals"]
+)
+
+ENDPOINT = "/v1/romannumeral/ws"
+# Method label used for per-message metrics, alongside GET/POST for the HTTP routes.
+METHOD = "WS"
+
+# Queue markers from the reader to the responder.
+_DISCONNECTED = object()
+_TOO_BIG = object()
+
+# The same (lax) pydantic coercion FastAPI applies to the HTTP route's parameters,
+# so e.g. 10.0 and "10" are accepted and 10.5 is a 422 on both transports.
+_INTEGER = TypeAdapter(Optional[int])
+_BATCH = TypeAdapter(List[Union[int, str]])
+
+
+def _integer(message: dict, name: str) -> int | None:
+    """
+    Read an optional integer field, validated like the HTTP query parameter (422 when invalid).
+    """
+    try:
+        return _INTEGER.validate_python(message.get(name))
+    except ValidationError:
+        raise HTTPException(status_code=422, detail=f"'{name}' must be an integer") from None
+
+
+async def convert_frame(message, timer: StageTimer) -> bytes:
+    """
+    Purpose: Produce the JSON body for one decoded conversion frame.
+    Args:
+        message: Decoded frame; an object with `query`, `min` and `max`, or `batch`.
+        timer (StageTimer): Stage timer for this message.
+    Returns: the same body bytes the equivalent HTTP request would return.
+    Raises: a ValueError for invalid input (400) or an HTTPException for malformed frames.
+    """
+    if not isinstance(message, dict):
+        raise HTTPException(status_code=422, detail="Frame must be a JSON object")
+
+    if "batch" in message:
+        # Validated like the HTTP request body, e.g. true -> 1 and 1.0 -> 1.
+        try:
+            items = _BATCH.validate_python(message["batch"])
+        except ValidationError:
+            raise HTTPException(status_code=422, detail="'batch' must be a list of integers and strings") from None
+        return batch_body(items, timer)
+
+    query = _integer(message, "query")
+    min_value = _integer(message, "min")
+    max_value = _integer(message, "max")
+
+    # Same checks, in the same order, as GET /v1/romannumeral.
+    if query is not None and (min_value is not None or max_value is not None):
+        raise HTTPException(status_code=400, detail="Provide either 'query' or 'min' and 'max', not both")
+    if query is not None:
+        return single_body(query, timer)
+    if min_value is not None and max_value is not None:
+        if min_value >= max_value:
+            raise ValueError("min must be less than max")
+        CONVERSIONS_RANGE.inc()
+        timer.mark("validation")
+        return await range_body(min_value, max_value, timer)
+    raise ValueError("Invalid query parameters")
+
+
+async def handle_frame(data: str | bytes, start_time: float) -> str:
+    """
+    Purpose: Answer one frame and record it in the request metrics.
+    Args:
+        data (str | bytes): Raw frame payload.
+        start_time (float): perf_counter() when the frame was received, so queueing counts.
+    Returns: the reply frame `{"id":…,"status":…,"body":…}`, where body matches the HTTP response body.
+    """
+    timer = StageTimer(ENDPOINT)
+    status = 500  # safe default for metrics
+    frame_id = b"null"
+    try:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            # A malformed HTTP request body is a 422 as well.
+            raise HTTPException(status_code=422, detail="Frame is not valid JSON") from None
+        if isinstance(message, dict):
+            # Encoded up front: the stdlib parser accepts NaN, Infinity and 1e999, which
+            # cannot be echoed as JSON, and the reply must not fail after the fact.
+            try:
+                frame_id = render_json(message.get("id"))
+            except ValueError:
+                raise HTTPException(status_code=422, detail="'id' must be a JSON-compliant value") from None
+
+        body = await convert_frame(message, timer)
+        status = 200
+
+    except ValueError as e:
+        status = 400
+        logger.warning("invalid_input", extra={"error": str(e), "transport": "websocket"})
+        body = render_json({"detail": str(e)})
+
+    except HTTPException as e:
+        status = e.status_code
+        logger.warning("invalid_input", extra={"error": e.detail, "transport": "websocket"})
+        body = render_json({"detail": e.detail})
+
+    finally:
+        observe_request(METHOD, ENDPOINT, status, time.perf_counter() - start_time, request_id_var.get())
+
+    # The body is already JSON, so splice it in rather than decoding and re-encoding it.
+    reply = b'{"id":' + frame_id + b',"status":' + str(status).encode() + b',"body":' + body + b"}"
+    return reply.decode("utf-8")
+
+
+async def read_frames(websocket: WebSocket, pending: asyncio.Queue) -> None:
+    """
+    Move incoming frames onto the bounded `pending` queue.
+
+    When the queue is full this coroutine stops reading, so the client is
+    slowed down by the transport instead of frames piling up in memory.
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            await pending.put(_DISCONNECTED)
+            return
+
+        data = message.get("text")
+        if data is None:
+            data = message.get("bytes") or b""
+            size = len(data)
+        else:
+            # The limit is in bytes; a text frame's length counts characters.
+            size = len(data.encode("utf-8"))
+        if size > settings.ws_max_message_bytes:
+            await pending.put(_TOO_BIG)
+            return
+        await pending.put((time.perf_counter(), data))
+
+
+@router.websocket("/romannumeral/ws")
+async def conversion_socket(websocket: WebSocket):
+    """
+    Pipelined conversions over one long-lived connection.
+
+    Each text (or binary) frame is a JSON object:
+    - `{"id": 1, "query": 10}` for a single conversion
+    - `{"id": 2, "min": 1, "max": 10}` for a range
+    - `{"id": 3, "batch": [10, "XIV"]}` for a batch
+
+    Replies are sent in request order as `{"id": …, "status": …, "body": …}`,
+    where `status` and `body` are what the equivalent HTTP request would return.
+    At most `ws_max_pending` frames are buffered per connection, and a frame
+    larger than `ws_max_message_bytes` closes the connection with code 1009.
+    """
+    await websocket.accept()
+    logger.info("websocket_connected")
+
+    pending: asyncio.Queue = asyncio.Queue(maxsize=settings.ws_max_pending)
+    reader = asyncio.create_task(read_frames(websocket, pending))
+    frames = 0
+    try:
+        while True:
+            item = await pending.get()
+            if item is _DISCONNECTED:
+                break
+            if item is _TOO_BIG:
+                # Earlier frames have all been answered, so closing here keeps replies in order.
+                await websocket.close(code=WS_1009_MESSAGE_TOO_BIG, reason="Message too big")
+                break
+
+            start_time, data = item
+            await websocket.send_text(await handle_frame(data, start_time))
+            frames += 1
+    except WebSocketDisconnect:
+        pass
+    finally:
+        reader.cancel()
+        logger.info("websocket_closed", extra={"frames": frames})
@@ -0,0 +1,486 @@
+"""
+Purpose: Streaming analytics over the service's JSON logs (the JsonFormatter output).
+
+Usage:
+    python -m app.logs.analyze service.log [more.log ...] [--window 60] [--top 5] [--workers 4] [--json]
+    cat service.log | python -m app.logs.analyze -
+
+For each time window and overall it reports request counts, latency
+percentiles, status breakdowns and the slowest request IDs. Memory is
+constant in the number of lines:
+    - latencies go into mergeable quantile sketches (app.logs.sketch),
+    - only `top` slowest requests are kept per window,
+    - `request_received` lines wait for their `request_completed` partner for
+      at most `horizon` seconds (and `max_pending` entries) before they are
+      counted as incomplete.
+
+Log sampling (ROMAN_LOG_SAMPLE_RATE) means a `request_completed` line may
+have no `request_received` partner; those are counted as "completed only".
+Latency is taken from the completed line, so they still feed every statistic.
+Truncated or otherwise malformed lines are counted and skipped.
+
+With --workers, files (and chunks of large files) are analysed in a process
+pool and the partial results merged; pairs split across chunk boundaries are
+reconciled during the merge.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator
+
+from app.logs.sketch import QuantileSketch
+
+try:
+    # orjson parses considerably faster than the stdlib; use it when installed.
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _loads = json.loads
+
+QUANTILES = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+RECEIVED = "request_received"
+COMPLETED = "request_completed"
+
+# Only lines mentioning a request lifecycle message are parsed; everything else is skipped cheaply.
+_MARKER = b'"request_'
+
+
+@lru_cache(maxsize=4096)
+def _epoch_second(prefix: str) -> float:
+    return datetime.strptime(prefix, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc).timestamp()
+
+
+def parse_timestamp(value) -> float | None:
+    """
+    Purpose: Convert a JsonFormatter timestamp ("2025-01-22T20:31:14.123Z") to epoch seconds.
+    Args: value: The record's timestamp field.
+    Returns: a float, or None when the value is missing or malformed.
+    """
+    if not isinstance(value, str) or len(value) < 23:
+        return None
+    try:
+        # Lines arrive in bursts within the same second, so the expensive part is cached.
+        return _epoch_second(value[:19]) + int(value[20:23]) / 1000
+    except ValueError:
+        return None
+
+
+def format_timestamp(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class WindowStats:
+    """
+    Purpose: Latency sketch, status counts and slowest requests for one time window.
+    """
+
+    __slots__ = ("sketch", "statuses", "slowest")
+
+    def __init__(self, accuracy: float):
+        self.sketch = QuantileSketch(accuracy)
+        self.statuses: dict[str, int] = {}
+        # Min-heap of (latency, request_id, timestamp) holding the slowest requests.
+        self.slowest: list[tuple[float, str, str]] = []
+
+    def add(self, latency: float, status: str, request_id: str, timestamp: str, top: int) -> None:
+        self.sketch.add(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if top:
+            entry = (latency, request_id, timestamp)
+            if len(self.slowest) < top:
+                heapq.heappush(self.slowest, entry)
+            elif entry > self.slowest[0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def merge(self, other: "WindowStats", top: int) -> None:
+        self.sketch.merge(other.sketch)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.slowest = heapq.nlargest(top, self.slowest + other.slowest)
+        heapq.heapify(self.slowest)
+
+    def to_dict(self) -> dict:
+        sketch = self.sketch
+        return {
+            "requests": sketch.count,
+            "latency_seconds": {
+                "mean": sketch.mean,
+                "max": sketch.max if sketch.count else None,
+                **{f"p{q * 100:g}": sketch.quantile(q) for q in QUANTILES},
+            },
+            "statuses": dict(sorted(self.statuses.items())),
+            "slowest": [
+                {"request_id": request_id, "latency_seconds": latency, "timestamp": timestamp}
+                for latency, request_id, timestamp in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+
+class Summary:
+    """
+    Purpose: Mergeable result of analysing one stream (a file, or a chunk of one).
+
+    Attributes:
+        lines (int): Lines read.
+        skipped (int): Lines that are not request lifecycle records.
+        malformed (int): Lifecycle lines that could not be parsed.
+        paired (int): Completed requests whose received line was seen.
+        completed_only (int): Completed requests without a received line (sampled out, or
+            received before the stream started).
+        incomplete (int): Received requests without a completed line.
+    """
+
+    def __init__(self, window: float, top: int, accuracy: float, horizon: float):
+        self.window = window
+        self.top = top
+        self.accuracy = accuracy
+        self.horizon = horizon
+        self.windows: dict[int, WindowStats] = {}
+        self.overall = WindowStats(accuracy)
+        self.lines = 0
+        self.skipped = 0
+        self.malformed = 0
+        self.paired = 0
+        self.completed_only = 0
+        self.incomplete = 0
+        self.first_time: float | None = None
+        # Received requests still waiting at the end of the stream (at most `horizon` old).
+        self.open: dict[str, float] = {}
+        # Completed-only request IDs seen within `horizon` of the stream start; the
+        # received line may be at the end of the preceding chunk.
+        self.head_orphans: set[str] = set()
+
+    def record(self, timestamp: float, stamp: str, latency: float, status: str, request_id: str) -> None:
+        key = int(timestamp // self.window)
+        stats = self.windows.get(key)
+        if stats is None:
+            stats = self.windows[key] = WindowStats(self.accuracy)
+        stats.add(latency, status, request_id, stamp, self.top)
+        self.overall.add(latency, status, request_id, stamp, self.top)
+
+    def _merge_counts(self, other: "Summary") -> None:
+        for key, stats in other.windows.items():
+            if key in self.windows:
+                self.windows[key].merge(stats, self.top)
+            else:
+                self.windows[key] = stats
+        self.overall.merge(other.overall, self.top)
+        self.lines += other.lines
+        self.skipped += other.skipped
+        self.malformed += other.malformed
+        self.paired += other.paired
+        self.completed_only += other.completed_only
+        self.incomplete += other.incomplete
+
+    def extend(self, following: "Summary") -> None:
+        """
+        Purpose: Merge the summary of the chunk that directly follows this one in the same file.
+        Args: following (Summary): Summary of the next chunk.
+
+        Requests received at the end of this chunk and completed at the start of
+        the next one are re-paired.
+        """
+        for request_id in self.open:
+            if request_id in following.head_orphans:
+                following.completed_only -= 1
+                following.paired += 1
+            else:
+                self.incomplete += 1
+        if self.first_time is None:
+            self.first_time = following.first_time
+            self.head_orphans = following.head_orphans
+        self.open = following.open
+        self._merge_counts(following)
+
+    def finalize(self) -> "Summary":
+        """
+        Purpose: Close the stream: requests still waiting for completion become incomplete.
+        Returns: self, for chaining.
+        """
+        self.incomplete += len(self.open)
+        self.open = {}
+        self.head_orphans = set()
+        return self
+
+    def merge(self, other: "Summary") -> None:
+        """
+        Purpose: Merge the finalized summary of an independent stream (another file).
+        Args: other (Summary): Finalized summary.
+        """
+        self._merge_counts(other)
+
+    def to_dict(self) -> dict:
+        return {
+            "lines": self.lines,
+            "skipped": self.skipped,
+            "malformed": self.malformed,
+            "paired": self.paired,
+            "completed_only": self.completed_only,
+            "incomplete": self.incomplete,
+            "overall": self.overall.to_dict(),
+            "windows": [
+                {"start": format_timestamp(key * self.window), **self.windows[key].to_dict()}
+                for key in sorted(self.windows)
+            ],
+        }
+
+
+def analyze_lines(
+    lines: Iterable[bytes],
+    window: float = 60.0,
+    top: int = 5,
+    accuracy: float = 0.01,
+    horizon: float = 60.0,
+    max_pending: int = 100_000,
+) -> Summary:
+    """
+    Purpose: Analyse a stream of JSON log lines in one pass.
+    Args:
+        lines (Iterable[bytes]): Raw lines, e.g. a file opened in binary mode.
+        window (float): Window length in seconds.
+        top (int): Slowest requests kept per window.
+        accuracy (float): Relative accuracy of the latency percentiles.
+        horizon (float): Seconds a received request waits for its completion line.
+        max_pending (int): Largest number of received requests waiting at once.
+    Returns: a Summary; call finalize() before reporting unless more chunks follow.
+    """
+    summary = Summary(window, top, accuracy, horizon)
+    pending: OrderedDict[str, float] = OrderedDict()
+    first_time = None
+
+    for line in lines:
+        summary.lines += 1
+        if _MARKER not in line:
+            summary.skipped += 1
+            continue
+
+        try:
+            record = _loads(line)
+            message = record.get("message")
+        except (ValueError, TypeError, AttributeError):
+            summary.malformed += 1
+            continue
+        if message != RECEIVED and message != COMPLETED:
+            summary.skipped += 1
+            continue
+
+        stamp = record.get("timestamp")
+        timestamp = parse_timestamp(stamp)
+        if timestamp is None:
+            summary.malformed += 1
+            continue
+        if first_time is None:
+            first_time = summary.first_time = timestamp
+
+        # Received requests that waited longer than the horizon will not complete in this stream.
+        while pending:
+            oldest = next(iter(pending.values()))
+            if timestamp - oldest <= horizon and len(pending) <= max_pending:
+                break
+            pending.popitem(last=False)
+            summary.incomplete += 1
+
+        request_id = record.get("request_id")
+        if message == RECEIVED:
+            if isinstance(request_id, str):
+                pending[request_id] = timestamp
+            continue
+
+        latency = record.get("latency_seconds")
+        # json.loads (without orjson) accepts NaN, Infinity and 1e999; none of them is a latency.
+        if (
+            isinstance(latency, bool)
+            or not isinstance(latency, (int, float))
+            or not math.isfinite(latency)
+            or latency < 0
+        ):
+            summary.malformed += 1
+            continue
+        if not isinstance(request_id, str):
+            request_id = ""
+
+        if request_id and pending.pop(request_id, None) is not None:
+            summary.paired += 1
+        else:
+            summary.completed_only += 1
+            if request_id and timestamp - first_time <= horizon:
+                summary.head_orphans.add(request_id)
+
+        summary.record(timestamp, stamp, float(latency), str(record.get("status")), request_id)
+
+    summary.open = dict(pending)
+    return summary
+
+
+def read_range(stream: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """
+    Purpose: Yield the lines that start within [start, end) of a seekable binary stream.
+    Args:
+        stream (BinaryIO): File opened in binary mode.
+        start (int): First byte offset of the chunk.
+        end (int): Byte offset where the chunk ends.
+    """
+    if start:
+        # Back up one byte: if `start` is a line start, this consumes only the
+        # preceding newline; otherwise it skips the line owned by the previous chunk.
+        stream.seek(start - 1)
+        position = start - 1 + len(stream.readline())
+    else:
+        stream.seek(0)
+        position = 0
+    while position < end:
+        line = stream.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line
+
+
+def _analyze_task(task: tuple) -> Summary:
+    path, start, end, options = task
+    with open(path, "rb") as stream:
+        return analyze_lines(read_range(stream, start, end), **options)
+
+
+def plan_tasks(paths: list[str], chunk_bytes: int, options: dict) -> list[tuple]:
+    """
+    Purpose: Split the input files into (path, start, end, options) tasks of at most chunk_bytes.
+    """
+    tasks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            tasks.append((path, start, min(start + chunk_bytes, size), options))
+    return tasks
+
+
+def analyze_files(
+    paths: list[str],
+    workers: int = 1,
+    chunk_bytes: int = 64 * 1024 * 1024,
+    **options,
+) -> Summary:
+    """
+    Purpose: Analyse log files, optionally in parallel across files and chunks.
+    Args:
+        paths (list[str]): Log files.
+        workers (int): Processes to use; 1 analyses everything in this process.
+        chunk_bytes (int): Size of the chunks large files are split into when workers > 1.
+        **options: Passed to analyze_lines (window, top, accuracy, horizon, max_pending).
+    Returns: a finalized Summary over all files.
+    """
+    if workers > 1:
+        tasks = plan_tasks(paths, chunk_bytes, options)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() keeps task order, so a file's chunks arrive in sequence.
+            results = list(pool.map(_analyze_task, tasks))
+    else:
+        tasks = [(path, 0, os.path.getsize(path), options) for path in paths]
+        results = [_analyze_task(task) for task in tasks]
+
+    total = None
+    current_path, current = None, None
+    for (path, *_), summary in zip(tasks, results):
+        if path == current_path:
+            current.extend(summary)
+            continue
+        if current is not None:
+            total = _combine(total, current.finalize())
+        current_path, current = path, summary
+    if current is not None:
+        total = _combine(total, current.finalize())
+    return total if total is not None else Summary(**_summary_options(options))
+
+
+def _combine(total: Summary | None, summary: Summary) -> Summary:
+    if total is None:
+        return summary
+    total.merge(summary)
+    return total
+
+
+def _summary_options(options: dict) -> dict:
+    return {
+        "window": options.get("window", 60.0),
+        "top": options.get("top", 5),
+        "accuracy": options.get("accuracy", 0.01),
+        "horizon": options.get("horizon", 60.0),
+    }
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}ms"
+
+
+def render_text(summary: Summary) -> str:
+    """
+    Purpose: Human-readable report of a finalized Summary.
+    """
+    out = [
+        f"lines {summary.lines:,}  skipped {summary.skipped:,}  malformed {summary.malformed:,}",
+        f"requests {summary.overall.sketch.count:,}  paired {summary.paired:,}  "
+        f"completed only {summary.completed_only:,}  incomplete {summary.incomplete:,}",
+    ]
+
+    def latency_columns(stats: WindowStats) -> str:
+        return "  ".join(f"p{q * 100:g} {_ms(stats.sketch.quantile(q)):>9}" for q in QUANTILES)
+
+    def statuses(stats: WindowStats) -> str:
+        return " ".join(f"{status}:{count}" for status, count in sorted(stats.statuses.items()))
+
+    out.append(f"overall  {latency_columns(summary.overall)}  max {_ms(summary.overall.sketch.max if summary.overall.sketch.count else None)}")
+    out.append(f"statuses {statuses(summary.overall)}")
+
+    for key in sorted(summary.windows):
+        stats = summary.windows[key]
+        out.append("")
+        out.append(
+            f"{format_timestamp(key * summary.window)}  requests {stats.sketch.count:,}  "
+            f"{latency_columns(stats)}  [{statuses(stats)}]"
+        )
+        for latency, request_id, timestamp in sorted(stats.slowest, reverse=True):
+            out.append(f"    {_ms(latency):>10}  {request_id or '-'}  {timestamp}")
+    return "\n".join(out)
+
+
+def main(argv=None) -> int:
+    """
+    Purpose: Command-line entry point.
+    Args: argv (list[str] | None): Arguments, defaults to sys.argv[1:].
+    Returns: the process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m app.logs.analyze",
+        description="Latency percentiles, status breakdowns and slowest requests from JSON service logs.",
+    )
+    parser.add_argument("paths", nargs="+", help="Log files, or - for standard input")
+    parser.add_argument("--window", type=float, default=60.0, help="Window length in seconds (default 60)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest requests listed per window (default 5)")
+    parser.add_argument("--accuracy", type=float, default=0.01, help="Relative percentile accuracy (default 0.01)")
+    parser.add_argument("--horizon", type=float, default=60.0,
+                        help="Seconds a received request may wait for its completion line (default 60)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes to analyse files/chunks with")
+    parser.add_argument("--chunk-mb", type=int, default=64, help="Chunk size for parallel analysis (default 64)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a text report")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    options = {"window": args.window, "top": args.top, "accuracy": args.accuracy, "horizon": args.horizon}
+    if args.paths == ["-"]:
+        summary = analyze_lines(sys.stdin.buffer, **options).finalize()
+    else:
+        summary = analyze_files(args.paths, workers=args.workers, chunk_bytes=args.chunk_mb * 1024 * 1024, **options)
+
+    print(json.dumps(summary.to_dict(), indent=2) if args.json else render_text(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
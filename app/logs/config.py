@@ -1,43 +1,218 @@
 import logging
+import os
+import queue
 import sys
 import json
-from datetime import datetime
+import threading
+import weakref
+from datetime import datetime, timezone
+
+from app.logs.context import RequestContextFilter
+from app.service.metrics import LOG_QUEUE_DEPTH, LOG_RECORDS_DROPPED
+from app.settings import settings
+
+# Attributes every LogRecord carries; anything else on a record came from `extra=`.
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+try:
+    # orjson is considerably faster than the stdlib encoder; use it when installed.
+    import orjson
+
+    def _dumps(log_record: dict) -> str:
+        try:
+            return orjson.dumps(log_record, default=str).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers beyond 64 bits without calling `default`
+            # (e.g. an oversized client query echoed in a warning); the stdlib handles them.
+            return json.dumps(log_record, default=str)
+except ImportError:  # pragma: no cover - depends on the environment
+    def _dumps(log_record: dict) -> str:
+        return json.dumps(log_record, default=str)
+
 
 class JsonFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
 
     Converts log records into JSON objects containing:
-    - timestamp: UTC ISO format
+    - timestamp: UTC ISO format with millisecond precision, e.g. 2025-01-22T20:31:14.123Z
     - level: log level name
     - logger: logger name
     - message: main log message
     - request_id (optional): included if present for request traceability
-    - extra fields: included if record.extra exists
+    - extra fields: anything passed with `extra=` (e.g. latency_seconds, status)
+    - exception (optional): formatted traceback when exc_info is set
+
+    The timestamp string is cached per millisecond and the seconds prefix per
+    second, since bursts of records share both.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_prefix = ""
+        self._cached_millisecond = None
+        self._cached_timestamp = ""
+
+    def formatTimestamp(self, created: float) -> str:
+        millisecond = int(created * 1000)
+        if millisecond != self._cached_millisecond:
+            second = millisecond // 1000
+            if second != self._cached_second:
+                self._cached_prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+                self._cached_second = second
+            self._cached_timestamp = f"{self._cached_prefix}.{millisecond % 1000:03d}Z"
+            self._cached_millisecond = millisecond
+        return self._cached_timestamp
+
     def format(self, record):
         # Base log structure
         log_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self.formatTimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Include request_id if provided via LoggerAdapter
-        if hasattr(record, "request_id"):
-            log_record["request_id"] = record.request_id
+        # Include request_id and any extra fields passed via LoggerAdapter or `extra=`.
+        # Extras become plain attributes on the record, so collect the non-standard ones.
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                log_record[key] = value
 
-        # Include any extra fields passed via LoggerAdapter or custom logging calls
-        if hasattr(record, "extra"):
-            log_record.update(record.extra)
+        if record.exc_info:
+            log_record["exception"] = self.formatException(record.exc_info)
 
         # Convert dict to JSON string for structured logging systems
-        return json.dumps(log_record)
+        return _dumps(log_record)
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Non-blocking handler that hands records to a background writer thread.
+
+    The request path only pays for a queue put; formatting and the blocking
+    write to the stream happen on the writer thread, which drains the queue
+    in batches and issues one write per batch.
 
+    A forked child inherits the handler but not its writer thread; the handler
+    is detached in the child (see _after_fork) so it can be replaced safely.
 
-def setup_logging():
+    Attributes:
+        stream: Destination for formatted lines (e.g. sys.stdout).
+        overflow (str): "drop" discards and counts records when the queue is full,
+            "block" makes the caller wait for space.
+        batch_size (int): Largest number of records written per write call.
+    """
+
+    _STOP = object()
+
+    def __init__(self, stream, maxsize: int = 10000, overflow: str = "drop", batch_size: int = 256):
+        if overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'")
+
+        super().__init__()
+        self.stream = stream
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+        _live_handlers.add(self)
+
+    def _after_fork(self):
+        # Runs in a forked child. The parent's writer thread does not exist here,
+        # and the inherited queue may be full or have its mutex held by that thread
+        # mid-operation, so a put (e.g. close() queueing the stop marker) could block
+        # forever. Records already queued are the parent's to write. Swap in an empty
+        # queue and fall back to synchronous writes until the handler is replaced.
+        self.queue = queue.Queue(self.queue.maxsize)
+        self._closed = True
+
+    def emit(self, record):
+        if self._closed:
+            # The writer has stopped (e.g. late shutdown logs): write synchronously.
+            try:
+                self.stream.write(self.format(record) + "\n")
+                self.stream.flush()
+            except Exception:
+                self.handleError(record)
+            return
+
+        if self.overflow == "block":
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                # Shedding log lines is preferable to stalling the event loop.
+                LOG_RECORDS_DROPPED.inc()
+        # Reported from the producer side too: when the stream stalls, the writer
+        # is stuck in write() and cannot report the queue filling up.
+        LOG_QUEUE_DEPTH.set(self.queue.qsize())
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            stop = False
+            for record in batch:
+                if record is self._STOP:
+                    stop = True
+                    continue
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except Exception:
+                    self.handleError(batch[-1])
+
+            LOG_QUEUE_DEPTH.set(self.queue.qsize())
+            if stop:
+                return
+
+    def close(self):
+        """
+        Flush every queued record and stop the writer thread. Safe to call more than once.
+        """
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                self.queue.put(self._STOP)
+                self._writer.join(timeout=5)
+        finally:
+            self.release()
+            super().close()
+
+
+# Async handlers that may need detaching in a forked child.
+_live_handlers: "weakref.WeakSet[AsyncLogHandler]" = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for handler in list(_live_handlers):
+        handler._after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def setup_logging(mode: str | None = None):
     """
     Configure the root logger to emit JSON logs to stdout.
 
@@ -45,13 +220,45 @@ def setup_logging():
     - All logs follow a consistent structured format
     - Logs are compatible with centralized log aggregation (ELK, Datadog, Splunk)
     - Minimal performance overhead
+
+    Args:
+        mode (str | None): "sync" writes from the calling thread; "async" queues records
+            for a background writer. Defaults to settings.log_mode.
     """
+    mode = mode or settings.log_mode
+
+    if mode == "async":
+        # Queue-backed handler: stdout backpressure no longer blocks request handling.
+        handler = AsyncLogHandler(
+            sys.stdout,
+            maxsize=settings.log_queue_size,
+            overflow=settings.log_overflow,
+            batch_size=settings.log_batch_size,
+        )
+    elif mode == "sync":
+        # StreamHandler writes logs to standard output
+        handler = logging.StreamHandler(sys.stdout)
+    else:
+        raise ValueError("log mode must be 'sync' or 'async'")
 
-    # StreamHandler writes logs to standard output
-    handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JsonFormatter())
+    # Stamp the current request ID (from the request contextvar) onto every record.
+    handler.addFilter(RequestContextFilter())
 
     # Configure the root logger
     root = logging.getLogger()
     root.setLevel(logging.INFO)  # Default to INFO; can be overridden in production
+    for previous in root.handlers:
+        if previous is not handler:
+            previous.close()
     root.handlers = [handler]  # Replace any existing handlers
+
+
+def shutdown_logging():
+    """
+    Flush and close the root logger's handlers; queued records are written before returning.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers:
+        handler.flush()
+        handler.close()
@@ -0,0 +1,59 @@
+import logging
+import random
+from contextvars import ContextVar
+
+# Request ID of the request being handled by the current task.
+# Set once per request by RequestIDMiddleware; read by RequestContextFilter,
+# so handlers log through plain module loggers without building an adapter.
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Logging filter that stamps the current request ID onto every record.
+
+    Attached to the output handler by setup_logging. Records that already
+    carry a request_id (e.g. from get_logger's adapter) are left unchanged.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            request_id = request_id_var.get()
+            if request_id is not None:
+                record.request_id = request_id
+        return True
+
+
+class LogSampler:
+    """
+    Decides which successful requests get their INFO log lines written.
+
+    Warnings and errors are always logged by the caller; this only thins out
+    routine success lines. A request is logged in full when it is sampled at
+    entry; otherwise its completion line is still written if it failed or was
+    slower than the threshold.
+
+    Attributes:
+        rate (float): Fraction of requests sampled at entry, between 0 and 1.
+        slow_threshold (float): Latency in seconds at or above which completion is always logged.
+    """
+
+    def __init__(self, rate: float = 1.0, slow_threshold: float = 0.1):
+        self.rate = rate
+        self.slow_threshold = slow_threshold
+
+    def sample(self) -> bool:
+        """
+        Returns: True if this request's routine log lines should be written.
+        """
+        if self.rate >= 1.0:
+            return True
+        if self.rate <= 0.0:
+            return False
+        return random.random() < self.rate
+
+    def should_log_completion(self, sampled: bool, status: int, latency: float) -> bool:
+        """
+        Returns: True if the request_completed line should be written.
+        """
+        return sampled or status >= 400 or latency >= self.slow_threshold
@@ -0,0 +1,97 @@
+"""
+Purpose: Mergeable quantile sketch for latency distributions (DDSketch-style).
+
+Values are counted in logarithmic buckets whose boundaries grow by a factor
+gamma = (1 + a) / (1 - a), so any quantile is returned within relative error
+`a` of the true value. Memory depends only on the range of values (about 1,000
+buckets from a microsecond to 100 seconds at 1%), not on how many are added,
+and two sketches with the same accuracy merge by adding bucket counts, so
+partial results from separate files or processes combine exactly.
+"""
+
+import math
+
+
+class QuantileSketch:
+    """
+    Purpose: Log-bucketed histogram with relative-error quantiles.
+
+    Attributes:
+        accuracy (float): Relative accuracy of quantile estimates, e.g. 0.01 for 1%.
+        count (int): Number of values added.
+        min (float): Smallest value added.
+        max (float): Largest value added.
+    """
+
+    __slots__ = ("accuracy", "_gamma_log", "_min_indexable", "buckets", "zeros", "count", "total", "min", "max")
+
+    def __init__(self, accuracy: float = 0.01):
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        self.accuracy = accuracy
+        self._gamma_log = math.log((1 + accuracy) / (1 - accuracy))
+        # Values at or below this (including 0) share one bucket; latencies this small are noise.
+        self._min_indexable = 1e-9
+        self.buckets: dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Purpose: Count one non-negative value.
+        Args: value (float): Value to add, e.g. a latency in seconds.
+        """
+        if value <= self._min_indexable:
+            self.zeros += 1
+        else:
+            index = math.ceil(math.log(value) / self._gamma_log)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Purpose: Add another sketch's counts into this one.
+        Args: other (QuantileSketch): Sketch built with the same accuracy.
+        Raises: a ValueError If the accuracies differ.
+        """
+        if other.accuracy != self.accuracy:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Purpose: Estimate the q-quantile.
+        Args: q (float): Quantile between 0 and 1, e.g. 0.99.
+        Returns: the estimate (clamped to the observed min/max), or None when empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i].
+                estimate = 2 * math.exp(index * self._gamma_log) / (1 + math.exp(self._gamma_log))
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
@@ -1,11 +1,29 @@
 import logging
 
+
+class RequestLoggerAdapter(logging.LoggerAdapter):
+    """
+    LoggerAdapter that merges per-call `extra=` fields with the adapter context.
+
+    The stock adapter replaces `extra` with its own dict, which silently drops
+    fields such as latency_seconds and status.
+    """
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return msg, kwargs
+
+
 def get_logger(name: str, request_id: str | None = None):
     """
     Retrieve a logger instance with optional request context.
 
     If a request_id is provided, the logger is wrapped in a LoggerAdapter
     to automatically inject the request_id into all log records.
+
+    Request handlers do not need this: RequestIDMiddleware publishes the
+    request ID through a contextvar that RequestContextFilter adds to every
+    record. Use an explicit request_id for work outside a request's context.
     """
 
     # Obtain (or create) a named logger.
@@ -16,7 +34,7 @@ def get_logger(name: str, request_id: str | None = None):
     # When a request ID is available, wrap the logger so that
     # the request_id is included in structured log output.
     if request_id:
-        return logging.LoggerAdapter(
+        return RequestLoggerAdapter(
             logger,
             {"request_id": request_id}
         )
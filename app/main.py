@@ -1,17 +1,80 @@
+from time import perf_counter
+
+# Taken before the application modules load; reported as app_import_seconds.
+IMPORT_STARTED = perf_counter()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from prometheus_client import make_asgi_app
-from app.api.router import router as api_router
-from app.api.health import router as health_router
-from app.logs.config import setup_logging
+from app import __version__
+from app.api.router import router as api_router, offloader, prime_response_cache
+from app.api.ws import router as ws_router
+from app.api.health import router as health_router, set_ready
+from app.api.debug import router as debug_router
+from app.logs.config import setup_logging, shutdown_logging
 from app.middleware.request import RequestIDMiddleware
+from app.middleware.admission import AdmissionControlMiddleware
+from app.service.lag import LoopLagMonitor
+from app.service.multiproc import make_metrics_app
+from app.service.metrics import APP_IMPORT_SECONDS, APP_STARTUP_SECONDS
+from app.service.roman import STANDARD_MAX, build_reverse_table, build_table
+from app.settings import settings
 
 # Initialize structured JSON logging before the application starts
 # to ensure all startup and runtime logs follow the same format.
 setup_logging()
 
+# Measures how late the event loop runs scheduled work; admission control sheds load on it.
+lag_monitor = LoopLagMonitor(settings.loop_lag_interval_seconds)
+
+_warmed = False
+
+
+def warm_up() -> None:
+    """
+    Build the lookup tables and pre-render the hottest responses.
+
+    Idempotent. The launcher (`python -m app serve`) calls it before forking so
+    workers inherit the results; otherwise it runs at startup in the lifespan.
+    """
+    global _warmed
+    if _warmed:
+        return
+    build_table(STANDARD_MAX)
+    build_reverse_table()
+    prime_response_cache()
+    _warmed = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_up()
+    lag_monitor.start()
+    APP_IMPORT_SECONDS.set(IMPORT_SECONDS)
+    APP_STARTUP_SECONDS.set(perf_counter() - IMPORT_STARTED)
+    # Only now may /ready report success; /health is live from the first request.
+    set_ready(True)
+    yield
+    set_ready(False)
+    await lag_monitor.stop()
+    # Let in-flight range chunks finish, then release the offload pool.
+    offloader.shutdown()
+    # Drain any queued log records before the process exits.
+    shutdown_logging()
+
+
 # Create the FastAPI application instance.
 # The title is used for OpenAPI documentation and operational clarity.
-app = FastAPI(title="Roman Numeral Service")
+app = FastAPI(title="Roman Numeral Service", version=__version__, lifespan=lifespan)
+
+# Admission control rejects /v1/* with 503 while the worker is overloaded.
+# Added first so it runs inside RequestIDMiddleware and shed responses still carry a request ID.
+app.add_middleware(
+    AdmissionControlMiddleware,
+    monitor=lag_monitor,
+    max_lag=settings.shed_max_lag_seconds,
+    max_in_flight=settings.shed_max_in_flight,
+    retry_after=settings.shed_retry_after_seconds,
+)
 
 # Middleware injects a unique request ID into each request lifecycle.
 # This enables end-to-end traceability across logs, metrics, and debugging sessions.
@@ -20,10 +83,19 @@ app.add_middleware(RequestIDMiddleware)
 # Register the primary API routes (business functionality).
 app.include_router(api_router)
 
+# Persistent WebSocket channel for high-frequency callers.
+app.include_router(ws_router)
+
 # Register the health check endpoint used by orchestration and monitoring systems.
 app.include_router(health_router)
 
+# Register opt-in diagnostics (profiling); disabled unless explicitly enabled.
+app.include_router(debug_router)
+
 # Expose Prometheus-compatible metrics via a dedicated ASGI application.
 # Mounted separately to avoid interfering with request middleware and routing logic.
-metrics_app = make_asgi_app()
+# With PROMETHEUS_MULTIPROC_DIR set, it aggregates every worker's metrics at scrape time.
+metrics_app = make_metrics_app()
 app.mount("/metrics", metrics_app)
+
+IMPORT_SECONDS = perf_counter() - IMPORT_STARTED
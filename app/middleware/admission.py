@@ -0,0 +1,80 @@
+import json
+import logging
+from starlette.status import WS_1013_TRY_AGAIN_LATER
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.service.metrics import IN_FLIGHT_REQUESTS, SHED_LAG, SHED_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware that sheds load before latency collapses.
+
+    Behavior:
+    - HTTP requests under `prefix` (the conversion API) are admitted only while
+      event-loop lag is at most `max_lag` seconds and fewer than `max_in_flight`
+      such requests are being processed.
+    - Otherwise it answers 503 with `Retry-After` immediately, without touching
+      the route, so an overloaded worker spends almost nothing per rejected request.
+    - WebSocket connections under `prefix` are admitted the same way and refused
+      with close code 1013 (Try Again Later) before the handshake completes. An
+      open connection counts as in flight until it closes.
+    - Everything else (/health, /metrics, docs) is always served.
+
+    A limit of 0 disables that check.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        monitor,
+        max_lag: float,
+        max_in_flight: int,
+        retry_after: int = 1,
+        prefix: str = "/v1/",
+    ):
+        self.app = app
+        self.monitor = monitor
+        self.max_lag = max_lag
+        self.max_in_flight = max_in_flight
+        self.prefix = prefix
+        self.in_flight = 0
+        self._body = json.dumps({"detail": "Service overloaded, retry later"}).encode("utf-8")
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._body)).encode("latin-1")),
+            (b"retry-after", str(retry_after).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+
+        if self.max_lag and self.monitor.lag > self.max_lag:
+            SHED_LAG.inc()
+            await self._reject(scope, receive, send)
+            return
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            SHED_IN_FLIGHT.inc()
+            await self._reject(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        IN_FLIGHT_REQUESTS.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            IN_FLIGHT_REQUESTS.dec()
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket":
+            # Take the handshake request, then refuse it without accepting.
+            await receive()
+            await send({"type": "websocket.close", "code": WS_1013_TRY_AGAIN_LATER})
+            return
+        await send({"type": "http.response.start", "status": 503, "headers": self._headers})
+        await send({"type": "http.response.body", "body": self._body})
@@ -1,12 +1,17 @@
 import uuid
 import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logs.context import request_id_var
 
 # Module-level logger used for middleware-level diagnostics if needed
 logger = logging.getLogger(__name__)
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+# ASGI header names are lower-case byte strings.
+REQUEST_ID_HEADER = b"x-request-id"
+
+
+class RequestIDMiddleware:
     """
     Middleware responsible for request traceability.
 
@@ -16,20 +21,49 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Attach the request ID to both the request lifecycle and response headers.
 
     This enables correlation of logs and metrics across distributed systems.
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware:
+    it reads and writes headers directly on the scope and the
+    `http.response.start` message, so there is no extra task or memory
+    stream per request and streaming responses pass through untouched.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
         # Use client-provided request ID when available to support upstream tracing.
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+
         # Fall back to a generated UUID to guarantee every request is traceable.
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        # Only generated when needed: uuid4() reads from the OS entropy pool.
+        if not request_id:
+            request_id = str(uuid.uuid4())
 
         # Attach request ID to request state for access by handlers and loggers.
-        request.state.request_id = request_id
+        # Starlette's `request.state` is a view over `scope["state"]`.
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Continue processing the request through the middleware chain.
-        response = await call_next(request)
+        header = (REQUEST_ID_HEADER, request_id.encode("latin-1"))
 
-        # Echo request ID back to the client for debugging and correlation.
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            # Echo request ID back to the client for debugging and correlation.
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
 
-        return response
+        # Publish the ID to loggers for the duration of this request.
+        token = request_id_var.set(request_id)
+        try:
+            # Continue processing the request through the middleware chain.
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
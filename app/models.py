@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 
 class RomanNumeralResponse(BaseModel):
@@ -25,6 +25,30 @@ class RomanNumeralRangeResponse(BaseModel):
     conversions: List[RomanNumeralItem]
 
 
+class IntegerResponse(BaseModel):
+    """
+    Response model for Roman numeral to integer conversion.
+    """
+    input: str = Field(..., json_schema_extra={"example" : "XIV"})
+    output: str = Field(..., json_schema_extra={"example" : "14"})
+
+
+class BatchItem(BaseModel):
+    """
+    Result of one item in a batch conversion; carries either an output or an error.
+    """
+    input: str = Field(..., json_schema_extra={"example" : "10"})
+    output: Optional[str] = Field(None, json_schema_extra={"example" : "X"})
+    error: Optional[str] = Field(None, json_schema_extra={"example" : None})
+
+
+class BatchResponse(BaseModel):
+    """
+    Response model for batch conversions, in request order.
+    """
+    results: List[BatchItem]
+
+
 class ErrorResponse(BaseModel):
     """
     Standard error response model.
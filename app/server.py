@@ -0,0 +1,190 @@
+"""
+Purpose: Production launcher: `python -m app serve`.
+
+The master process:
+    1. imports the application and warms tables and the response cache,
+    2. binds one listening socket,
+    3. forks N workers that each run uvicorn on that shared socket,
+    4. restarts workers that die and forwards SIGTERM/SIGINT for a graceful stop.
+
+Forking after warm-up lets every worker start with the precomputed tables and
+pre-rendered responses already in (copy-on-write) memory, so no worker takes
+traffic cold. uvloop and httptools are used when they are installed.
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from importlib.util import find_spec
+
+from app.service.multiproc import mark_dead, prepare_directory
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def pick_loop() -> str:
+    """
+    Returns: "uvloop" when installed, otherwise "asyncio".
+    """
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def pick_http() -> str:
+    """
+    Returns: "httptools" when installed, otherwise "h11".
+    """
+    return "httptools" if find_spec("httptools") else "h11"
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """
+    Purpose: Create the listening socket shared by all workers.
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free port.
+        backlog (int): Listen queue length.
+    Returns: a bound, listening, inheritable socket.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app, sock: socket.socket) -> None:
+    """
+    Purpose: Serve `app` on an already-bound socket until uvicorn exits (used in each worker).
+    Args:
+        app: ASGI application.
+        sock (socket.socket): Shared listening socket.
+    """
+    import uvicorn
+
+    config = uvicorn.Config(
+        app,
+        loop=pick_loop(),
+        http=pick_http(),
+        lifespan="on",
+        # Logging is configured by app.logs (JSON to stdout); keep uvicorn from replacing it.
+        log_config=None,
+        access_log=False,
+        # Let the transport reject oversized WebSocket frames before buffering them.
+        ws_max_size=settings.ws_max_message_bytes,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _fork_worker(app, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Child: restore default signal handling (uvicorn installs its own) and
+    # rebuild logging, since a background log writer thread does not survive fork.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    from app.logs.config import setup_logging
+    setup_logging()
+
+    code = 0
+    try:
+        run_worker(app, sock)
+    except BaseException:
+        logger.exception("worker_crashed")
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    """
+    Purpose: Warm up, bind, and run `workers` prefork workers until signalled.
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind.
+        workers (int): Number of worker processes; 0 or less means one per CPU core.
+    """
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+
+    # Must happen before any process writes metric files.
+    prepare_directory()
+
+    from app.main import app, warm_up
+
+    warm_up()
+    sock = bind_socket(host, port)
+    logger.info(
+        "server_starting",
+        extra={"host": host, "port": sock.getsockname()[1], "workers": workers,
+               "loop": pick_loop(), "http": pick_http()},
+    )
+
+    if workers == 1:
+        run_worker(app, sock)
+        return
+
+    # Move everything built so far out of the collector's generations, so the
+    # cyclic GC in workers does not touch (and un-share) the warmed pages.
+    gc.freeze()
+
+    children = {_fork_worker(app, sock) for _ in range(workers)}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        mark_dead(pid)
+        if not stopping:
+            logger.warning("worker_exited", extra={"pid": pid, "status": status})
+            time.sleep(0.1)  # avoid a tight respawn loop if workers crash on start
+            children.add(_fork_worker(app, sock))
+
+    sock.close()
+    logger.info("server_stopped")
+
+
+def main(argv=None) -> None:
+    """
+    Purpose: Command-line entry point, `python -m app serve [--host H] [--port P] [--workers N]`.
+    Args: argv (list[str] | None): Arguments, defaults to sys.argv[1:].
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m app")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Run the production server")
+    serve_parser.add_argument("--host", default=settings.host)
+    serve_parser.add_argument("--port", type=int, default=settings.port)
+    serve_parser.add_argument(
+        "--workers", type=int, default=settings.workers,
+        help="Worker processes (default: ROMAN_WORKERS, 0 = one per CPU core)",
+    )
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.workers)
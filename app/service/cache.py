@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from typing import Hashable
+
+from app.service.metrics import (
+    RESPONSE_CACHE_HITS,
+    RESPONSE_CACHE_MISSES,
+    RESPONSE_CACHE_EVICTIONS,
+    RESPONSE_CACHE_BYTES,
+)
+
+
+class ResponseCache:
+    """
+    Purpose: Bounded in-process LRU cache of pre-serialized response bodies.
+
+    Conversion output is fully deterministic for a given set of normalized
+    parameters, so the final bytes can be reused across requests without
+    rebuilding dicts or running them through pydantic again.
+
+    Attributes:
+        max_bytes (int): Total size budget for cached values. 0 disables caching.
+        name (str): Value of the `cache` label on this cache's metrics.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "response"):
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size = 0
+        # Bind the label children once; lookups are on the request path.
+        self._hits = RESPONSE_CACHE_HITS.labels(cache=name)
+        self._misses = RESPONSE_CACHE_MISSES.labels(cache=name)
+        self._evictions = RESPONSE_CACHE_EVICTIONS.labels(cache=name)
+        self._bytes = RESPONSE_CACHE_BYTES.labels(cache=name)
+
+    def get(self, key: Hashable) -> bytes | None:
+        """
+        Purpose: Look up a cached body and mark it as most recently used.
+        Args: key (Hashable): Normalized request parameters.
+        Returns: the cached bytes, or None on a miss.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._misses.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        """
+        Purpose: Store a body, evicting least recently used entries to stay within budget.
+        Args:
+            key (Hashable): Normalized request parameters.
+            value (bytes): Serialized response body.
+        """
+        # Values larger than the whole budget would evict everything and still not fit.
+        if len(value) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        self._entries[key] = value
+        self._size += len(value)
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self._evictions.inc()
+
+        self._bytes.set(self._size)
+
+    def clear(self) -> None:
+        """
+        Purpose: Drop every cached entry.
+        """
+        self._entries.clear()
+        self._size = 0
+        self._bytes.set(0)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns: the number of bytes currently held.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,71 @@
+"""
+Purpose: Content-Encoding negotiation and compression of response bodies.
+
+gzip is always available; brotli ("br") is offered when the optional
+`brotli` package is installed and is preferred over gzip on equal q-values.
+"""
+
+import gzip
+from time import perf_counter
+
+from app.service.metrics import COMPRESSION_RATIO, COMPRESSION_LATENCY
+from app.settings import settings
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Supported encodings in server preference order.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """
+    Purpose: Pick the best supported encoding for an Accept-Encoding header.
+    Args: accept_encoding (str): Raw header value, e.g. "gzip, br;q=0.8".
+    Returns: a str from ENCODINGS, or None to send the body uncompressed.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        # Strictly greater, so ties go to the earlier (preferred) encoding.
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Purpose: Compress a response body and record ratio and time.
+    Args:
+        body (bytes): Uncompressed body.
+        encoding (str): One of ENCODINGS.
+    Returns: the compressed bytes.
+    """
+    start = perf_counter()
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=settings.brotli_quality)
+    else:
+        # mtime=0 keeps the output byte-identical across workers and restarts.
+        compressed = gzip.compress(body, compresslevel=settings.gzip_level, mtime=0)
+    COMPRESSION_LATENCY.labels(encoding=encoding).observe(perf_counter() - start)
+    COMPRESSION_RATIO.labels(encoding=encoding).observe(len(body) / max(len(compressed), 1))
+    return compressed
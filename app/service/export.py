@@ -0,0 +1,110 @@
+"""
+Purpose: Serialize the conversion table (or a sub-range of it) into columnar
+download formats.
+
+Formats:
+    csv      text/csv, header "input,output"
+    arrow    Arrow IPC stream with columns input (int64) and output (string)
+    parquet  Parquet file with the same schema
+
+CSV only needs the standard library; arrow and parquet require pyarrow and
+raise ValueError when it is not installed.
+"""
+
+import io
+
+# Media type of each export format.
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# File extension used in Content-Disposition.
+EXTENSIONS = {"csv": "csv", "arrow": "arrows", "parquet": "parquet"}
+
+
+def _columns(service, start: int, stop: int, chunk_size: int):
+    """
+    Yield (inputs, outputs) blocks for start..stop-1, one convert_many call per block.
+    """
+    for block_start in range(start, stop, chunk_size):
+        block_stop = min(block_start + chunk_size, stop)
+        yield range(block_start, block_stop), service.convert_many(block_start, block_stop)
+
+
+def serialize(service, fmt: str, start: int, stop: int, chunk_size: int = 4000) -> bytes:
+    """
+    Purpose: Serialize conversions for start..stop-1 in the requested format.
+    Args:
+        service (RomanNumeralTranslateService): Source of numerals.
+        fmt (str): One of MEDIA_TYPES.
+        start (int): First value (inclusive).
+        stop (int): Value to stop at (exclusive).
+        chunk_size (int): Values converted per convert_many call.
+    Returns: the serialized bytes.
+    Raises: a ValueError If the format is unknown or needs pyarrow and it is not installed.
+    """
+    if fmt not in MEDIA_TYPES:
+        raise ValueError(f"format must be one of: {', '.join(MEDIA_TYPES)}")
+
+    if fmt == "csv":
+        # Integers and numerals never contain commas or quotes, so no CSV quoting is needed.
+        parts = ["input,output\n"]
+        for inputs, outputs in _columns(service, start, stop, chunk_size):
+            parts.append("".join(f"{n},{output}\n" for n, output in zip(inputs, outputs)))
+        return "".join(parts).encode("utf-8")
+
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ValueError(f"format '{fmt}' requires pyarrow on the server") from e
+
+    outputs: list[str] = []
+    for _, block in _columns(service, start, stop, chunk_size):
+        outputs.extend(block)
+    table = pa.table({
+        "input": pa.array(range(start, stop), type=pa.int64()),
+        "output": pa.array(outputs, type=pa.string()),
+    })
+
+    sink = io.BytesIO()
+    if fmt == "arrow":
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        import pyarrow.parquet as pq
+        pq.write_table(table, sink)
+    return sink.getvalue()
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Purpose: Parse a single-range HTTP Range header against a body of `size` bytes.
+    Args:
+        header (str): Range header value, e.g. "bytes=0-99", "bytes=100-" or "bytes=-50".
+        size (int): Length of the full body.
+    Returns: an inclusive (first, last) byte pair, or None when the header should be
+        ignored (not a bytes range, or several ranges) and the full body served.
+    Raises: a ValueError If the range cannot be satisfied (HTTP 416).
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the final N bytes.
+            length = int(last)
+            if length <= 0:
+                raise ValueError("unsatisfiable range")
+            return max(0, size - length), size - 1
+        first_byte = int(first)
+        last_byte = int(last) if last else size - 1
+    except ValueError as e:
+        raise ValueError("unsatisfiable range") from e
+
+    if first_byte >= size or last_byte < first_byte:
+        raise ValueError("unsatisfiable range")
+    return first_byte, min(last_byte, size - 1)
@@ -0,0 +1,190 @@
+"""
+Purpose: Compact binary encodings of conversion responses, selected with the Accept header.
+
+Formats:
+    json     application/json (default)
+    msgpack  application/msgpack; the same document shape as the JSON body, so
+             {"conversions": [{"input": "1", "output": "I"}, ...]} and so on
+    binary   application/vnd.roman.binary; length-prefixed records, all integers big-endian:
+               single/range  u32 count, then per item: u32 input, u8 length, numeral (UTF-8)
+               batch         u32 count, then per item: u8 flag (0 output, 1 error),
+                             u32 length + input (UTF-8), u32 length + output or error (UTF-8)
+
+Both binary formats are written straight from service output: there is no
+intermediate dict or pydantic model, and no msgpack dependency is needed
+because only strings, maps and arrays are ever written.
+"""
+
+import struct
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+BINARY_MEDIA_TYPE = "application/vnd.roman.binary"
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "msgpack": MSGPACK_MEDIA_TYPE,
+    "binary": BINARY_MEDIA_TYPE,
+}
+
+# Accept values mapped to a non-default format; msgpack has no single registered name.
+_ACCEPTED = {
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+    BINARY_MEDIA_TYPE: "binary",
+}
+_JSON_ACCEPT = ("application/json", "application/*", "*/*")
+
+
+def negotiate(accept: str) -> str:
+    """
+    Purpose: Pick the response format for an Accept header.
+    Args: accept (str): Raw header value.
+    Returns: "msgpack" or "binary" when the client prefers one of them, otherwise "json".
+    """
+    if not accept or "application/" not in accept:
+        return "json"
+
+    weights: dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[media_type.strip().lower()] = weight
+
+    best, best_weight = "json", max((weights.get(media_type, 0.0) for media_type in _JSON_ACCEPT), default=0.0)
+    for media_type, fmt in _ACCEPTED.items():
+        # Strictly greater, so JSON wins ties and stays the default.
+        if weights.get(media_type, 0.0) > best_weight:
+            best, best_weight = fmt, weights[media_type]
+    return best
+
+
+# ---- MessagePack ----
+
+def _msgpack_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    size = len(data)
+    if size < 32:
+        return bytes((0xA0 | size,)) + data
+    if size < 0x100:
+        return b"\xd9" + bytes((size,)) + data
+    if size < 0x10000:
+        return b"\xda" + size.to_bytes(2, "big") + data
+    return b"\xdb" + size.to_bytes(4, "big") + data
+
+
+def _msgpack_array(size: int) -> bytes:
+    if size < 16:
+        return bytes((0x90 | size,))
+    if size < 0x10000:
+        return b"\xdc" + size.to_bytes(2, "big")
+    return b"\xdd" + size.to_bytes(4, "big")
+
+
+_MAP1 = b"\x81"
+_MAP2 = b"\x82"
+_INPUT = _msgpack_str("input")
+_OUTPUT = _msgpack_str("output")
+_ERROR = _msgpack_str("error")
+_CONVERSIONS = _msgpack_str("conversions")
+_RESULTS = _msgpack_str("results")
+
+
+def _msgpack_pair(value: str, key: bytes, text: str) -> bytes:
+    return _MAP2 + _INPUT + _msgpack_str(value) + key + _msgpack_str(text)
+
+
+# ---- Length-prefixed binary ----
+
+_COUNT = struct.Struct(">I")
+_RECORD = struct.Struct(">IB")
+# Batch inputs are arbitrary client strings, so their length needs more than 16 bits.
+_FIELD = struct.Struct(">I")
+
+
+def _binary_record(number: int, numeral: str) -> bytes:
+    data = numeral.encode("utf-8")
+    return _RECORD.pack(number, len(data)) + data
+
+
+def _binary_field(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _FIELD.pack(len(data)) + data
+
+
+# ---- Response bodies ----
+
+def encode_single(fmt: str, number: int, numeral: str) -> bytes:
+    """
+    Purpose: Encode a single conversion in a binary format.
+    Args:
+        fmt (str): "msgpack" or "binary".
+        number (int): Input value.
+        numeral (str): Converted numeral.
+    Returns: the encoded body.
+    """
+    if fmt == "msgpack":
+        return _msgpack_pair(str(number), _OUTPUT, numeral)
+    return _COUNT.pack(1) + _binary_record(number, numeral)
+
+
+def encode_range(fmt: str, start: int, numerals) -> bytes:
+    """
+    Purpose: Encode consecutive conversions in a binary format.
+    Args:
+        fmt (str): "msgpack" or "binary".
+        start (int): Input value of the first numeral.
+        numerals (Sequence[str]): Numerals for start, start + 1, ... as returned by convert_many.
+    Returns: the encoded body.
+    """
+    numbers = range(start, start + len(numerals))
+    if fmt == "msgpack":
+        if numerals and max(map(len, numerals)) < 32:
+            try:
+                # Fast path for standard numerals (ASCII, under 32 characters): every string
+                # is a fixstr whose one-byte header is also a latin-1 character, so the body
+                # can be formatted as text and encoded once. Overlined numerals contain
+                # U+0305, which latin-1 cannot encode, and take the general path.
+                return (
+                    "\x81\xabconversions" + _msgpack_array(len(numerals)).decode("latin-1") + "".join([
+                        f"\x82\xa5input{chr(0xA0 | len(number))}{number}\xa6output{chr(0xA0 | len(numeral))}{numeral}"
+                        for number, numeral in zip(map(str, numbers), numerals)
+                    ])
+                ).encode("latin-1")
+            except UnicodeEncodeError:
+                pass
+        return b"".join([_MAP1, _CONVERSIONS, _msgpack_array(len(numerals))] + [
+            _msgpack_pair(str(n), _OUTPUT, numeral) for n, numeral in zip(numbers, numerals)
+        ])
+    return b"".join([_COUNT.pack(len(numerals))] + [
+        _binary_record(n, numeral) for n, numeral in zip(numbers, numerals)
+    ])
+
+
+def encode_batch(fmt: str, items, results) -> bytes:
+    """
+    Purpose: Encode batch results in a binary format.
+    Args:
+        fmt (str): "msgpack" or "binary".
+        items (Sequence[int | str]): Batch inputs.
+        results (Sequence[tuple[str | None, str | None]]): (output, error) pairs from convert_batch.
+    Returns: the encoded body.
+    """
+    if fmt == "msgpack":
+        return b"".join([_MAP1, _RESULTS, _msgpack_array(len(items))] + [
+            _msgpack_pair(str(item), _OUTPUT, output) if error is None else
+            _msgpack_pair(str(item), _ERROR, error)
+            for item, (output, error) in zip(items, results)
+        ])
+    return b"".join([_COUNT.pack(len(items))] + [
+        (b"\x00" + _binary_field(str(item)) + _binary_field(output)) if error is None else
+        (b"\x01" + _binary_field(str(item)) + _binary_field(error))
+        for item, (output, error) in zip(items, results)
+    ])
@@ -0,0 +1,60 @@
+"""
+Purpose: Background probe that measures event-loop lag.
+
+The probe repeatedly sleeps for a fixed interval and measures how much
+later than requested it woke up. That delay is how long a newly arrived
+request would wait before the loop gets to it.
+"""
+
+import asyncio
+import logging
+from time import perf_counter
+
+from app.service.metrics import EVENT_LOOP_LAG, EVENT_LOOP_LAG_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Purpose: Periodically sample event-loop lag into metrics and a readable attribute.
+
+    Attributes:
+        interval (float): Seconds between probes.
+        lag (float): Most recent lag measurement in seconds.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _probe(self) -> None:
+        while True:
+            start = perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, perf_counter() - start - self.interval)
+            self.lag = lag
+            EVENT_LOOP_LAG.set(lag)
+            EVENT_LOOP_LAG_SECONDS.observe(lag)
+
+    def start(self) -> None:
+        """
+        Purpose: Start probing on the running event loop; a no-op if already running.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._probe(), name="loop-lag-probe")
+
+    async def stop(self) -> None:
+        """
+        Purpose: Cancel the probe and wait for it to exit.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.lag = 0.0
@@ -1,4 +1,9 @@
-from prometheus_client import Counter, Histogram
+from time import perf_counter
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.service.multiproc import multiproc_dir
+from app.settings import settings
 
 """ 
     Purpose: Counts every HTTP request handled by the service.
@@ -21,7 +26,8 @@ REQUEST_COUNT = Counter(
 REQUEST_LATENCY = Histogram(
     "http_request_latency_seconds",
     "End-to-end latency of HTTP requests in seconds",
-    ["endpoint"]
+    ["endpoint"],
+    buckets=settings.latency_buckets  # sub-millisecond by default; conversions are fast
 )
 
 """ 
@@ -33,5 +39,281 @@ REQUEST_LATENCY = Histogram(
 CONVERSION_COUNT = Counter(
     "roman_conversions_total",
     "Total number of Roman numeral conversions performed",
-    ["type"]  # Expected values: "single" | "range"
+    ["type"]  # Expected values: "single" | "range" | "reverse" | "batch" | "export"
+)
+
+""" 
+    Purpose: Breaks request latency down by processing stage.
+    Returns: A Histogram labelled by endpoint and stage (validation, conversion, serialization, compression, logging) that shows which stage moved when end-to-end latency regresses.
+    
+"""
+
+STAGE_LATENCY = Histogram(
+    "http_request_stage_latency_seconds",
+    "Time spent in each stage of request handling in seconds",
+    ["endpoint", "stage"],
+    buckets=settings.latency_buckets
+)
+
+""" 
+    Purpose: Measures how many items each batch conversion request carries.
+    Returns: A Histogram used to size the batch limit and understand client batching behaviour.
+    
+"""
+
+BATCH_SIZE = Histogram(
+    "roman_batch_items",
+    "Number of items per batch conversion request",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+)
+
+""" 
+    Purpose: Tracks the effectiveness of the pre-serialized caches, labelled by cache ("response" or "export").
+    Returns: Hit, miss and eviction counters plus a gauge of the bytes currently held, used to size each cache budget.
+    
+"""
+
+RESPONSE_CACHE_HITS = Counter(
+    "response_cache_hits_total",
+    "Number of responses served from a pre-serialized cache",
+    ["cache"]
+)
+
+RESPONSE_CACHE_MISSES = Counter(
+    "response_cache_misses_total",
+    "Number of cache lookups that required a fresh serialization",
+    ["cache"]
+)
+
+RESPONSE_CACHE_EVICTIONS = Counter(
+    "response_cache_evictions_total",
+    "Number of entries evicted from a cache to stay within its byte budget",
+    ["cache"]
+)
+
+RESPONSE_CACHE_BYTES = Gauge(
+    "response_cache_bytes",
+    "Bytes currently held by a cache",
+    ["cache"],
+    multiprocess_mode="livesum"  # each worker has its own cache
+)
+
+""" 
+    Purpose: Tracks the asynchronous logging pipeline.
+    Returns: A gauge of records waiting to be written and a counter of records dropped because the queue was full.
+    
+"""
+
+LOG_QUEUE_DEPTH = Gauge(
+    "log_queue_depth",
+    "Number of log records waiting for the background writer",
+    multiprocess_mode="livesum"  # each worker has its own queue
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Number of log records dropped because the logging queue was full"
+)
+
+""" 
+    Purpose: Measures how well response compression pays off.
+    Returns: Histograms labelled by encoding of the uncompressed/compressed size ratio and of the time spent compressing; compressed bodies are cached, so observations only happen on a cache miss.
+    
+"""
+
+COMPRESSION_RATIO = Histogram(
+    "http_response_compression_ratio",
+    "Uncompressed size divided by compressed size of compressed responses",
+    ["encoding"],
+    buckets=(1.5, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64)
+)
+
+COMPRESSION_LATENCY = Histogram(
+    "http_response_compression_seconds",
+    "Time spent compressing a response body in seconds",
+    ["encoding"],
+    buckets=settings.latency_buckets
+)
+
+""" 
+    Purpose: Tracks the worker pool that converts wide ranges off the event loop.
+    Returns: Gauges of chunks running on the pool, chunks waiting for a free slot, and the fraction of slots in use; sustained saturation near 1 means the pool is the bottleneck.
+    
+"""
+
+OFFLOAD_IN_FLIGHT = Gauge(
+    "range_offload_in_flight",
+    "Number of range chunks submitted to the offload pool",
+    multiprocess_mode="livesum"  # each worker has its own pool
 )
+
+OFFLOAD_WAITING = Gauge(
+    "range_offload_queue_depth",
+    "Number of range chunks waiting for a free offload slot",
+    multiprocess_mode="livesum"
+)
+
+OFFLOAD_SATURATION = Gauge(
+    "range_offload_saturation",
+    "Fraction of offload slots in use",
+    multiprocess_mode="livemax"  # a ratio: report the busiest worker
+)
+
+""" 
+    Purpose: Measures event-loop lag and the admission control built on it.
+    Returns: A gauge of the latest lag, a Histogram of lag samples, a gauge of admitted in-flight API requests, and a counter of requests rejected with 503 by reason ("lag" or "in_flight").
+    
+"""
+
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Most recent event-loop lag measurement in seconds",
+    multiprocess_mode="livemax"  # report the most lagged worker
+)
+
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_sample_seconds",
+    "Distribution of event-loop lag samples in seconds",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+IN_FLIGHT_REQUESTS = Gauge(
+    "http_requests_in_flight",
+    "Number of admitted API requests currently being processed",
+    multiprocess_mode="livesum"
+)
+
+REQUESTS_SHED = Counter(
+    "http_requests_shed_total",
+    "Number of API requests rejected with 503 by admission control",
+    ["reason"]  # Expected values: "lag" | "in_flight"
+)
+
+SHED_LAG = REQUESTS_SHED.labels(reason="lag")
+SHED_IN_FLIGHT = REQUESTS_SHED.labels(reason="in_flight")
+
+""" 
+    Purpose: Measures how long a worker takes to become ready.
+    Returns: Gauges of the time spent importing the application and of the time from the start of that import until warm-up finished and the worker was ready for traffic.
+    
+"""
+
+APP_IMPORT_SECONDS = Gauge(
+    "app_import_seconds",
+    "Time spent importing the application modules in seconds",
+    multiprocess_mode="livemax"
+)
+
+APP_STARTUP_SECONDS = Gauge(
+    "app_startup_seconds",
+    "Time from the start of the application import until the worker was ready, in seconds",
+    multiprocess_mode="livemax"
+)
+
+""" 
+    Purpose: Pre-bound label children for the request hot path.
+    Returns: Children for every known route and status, so recording a request
+    skips the label validation, dict lookup and lock taken by .labels().
+    
+"""
+
+# (method, endpoint) pairs served by the conversion routes.
+ROUTES = (
+    ("GET", "/v1/romannumeral"),
+    ("GET", "/v1/integer"),
+    ("POST", "/v1/romannumeral/batch"),
+    ("GET", "/v1/romannumeral/export"),
+    ("WS", "/v1/romannumeral/ws"),  # one observation per WebSocket message
+)
+STATUSES = ("200", "304", "400", "500")
+
+_REQUEST_COUNT_CHILDREN = {
+    (method, endpoint, status): REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+    for method, endpoint in ROUTES
+    for status in STATUSES
+}
+_REQUEST_LATENCY_CHILDREN = {
+    endpoint: REQUEST_LATENCY.labels(endpoint=endpoint)
+    for _, endpoint in ROUTES
+}
+
+STAGES = ("validation", "conversion", "serialization", "compression", "logging")
+
+_STAGE_LATENCY_CHILDREN = {
+    (endpoint, stage): STAGE_LATENCY.labels(endpoint=endpoint, stage=stage)
+    for _, endpoint in ROUTES
+    for stage in STAGES
+}
+
+CONVERSIONS_SINGLE = CONVERSION_COUNT.labels(type="single")
+CONVERSIONS_RANGE = CONVERSION_COUNT.labels(type="range")
+CONVERSIONS_REVERSE = CONVERSION_COUNT.labels(type="reverse")
+CONVERSIONS_BATCH = CONVERSION_COUNT.labels(type="batch")
+CONVERSIONS_EXPORT = CONVERSION_COUNT.labels(type="export")
+
+# Exemplars are not supported by the multiprocess collector.
+EXEMPLARS_ENABLED = multiproc_dir() is None
+# Exemplar labels are limited to 128 characters in total; client request IDs are untrusted.
+_EXEMPLAR_ID_LENGTH = 64
+
+
+def observe_request(method: str, endpoint: str, status: int, latency: float, request_id: str | None = None):
+    """
+    Purpose: Record one finished request in REQUEST_COUNT and REQUEST_LATENCY.
+    Args:
+        method (str): HTTP method.
+        endpoint (str): Route path used as the endpoint label.
+        status (int): HTTP status code returned.
+        latency (float): Request duration in seconds, measured with time.perf_counter().
+        request_id (str | None): Attached as an exemplar to slow observations.
+    """
+    status_label = str(status)
+    counter = _REQUEST_COUNT_CHILDREN.get((method, endpoint, status_label))
+    if counter is None:
+        counter = REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status_label)
+    counter.inc()
+
+    histogram = _REQUEST_LATENCY_CHILDREN.get(endpoint)
+    if histogram is None:
+        histogram = REQUEST_LATENCY.labels(endpoint=endpoint)
+
+    # Link the slowest buckets to a concrete request for drill-down.
+    if request_id and EXEMPLARS_ENABLED and latency >= settings.exemplar_threshold_seconds:
+        histogram.observe(latency, exemplar={"request_id": request_id[:_EXEMPLAR_ID_LENGTH]})
+    else:
+        histogram.observe(latency)
+
+
+def observe_stage(endpoint: str, stage: str, seconds: float):
+    """
+    Purpose: Record time spent in one stage of handling a request.
+    Args:
+        endpoint (str): Route path used as the endpoint label.
+        stage (str): One of STAGES.
+        seconds (float): Time spent in the stage.
+    """
+    histogram = _STAGE_LATENCY_CHILDREN.get((endpoint, stage))
+    if histogram is None:
+        histogram = STAGE_LATENCY.labels(endpoint=endpoint, stage=stage)
+    histogram.observe(seconds)
+
+
+class StageTimer:
+    """
+    Purpose: Attribute consecutive slices of a request's time to named stages.
+
+    Each mark(stage) records the time since the previous mark (or creation)
+    under that stage, so instrumenting a handler only costs one perf_counter
+    call and one observation per stage.
+    """
+
+    __slots__ = ("endpoint", "last")
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.last = perf_counter()
+
+    def mark(self, stage: str):
+        now = perf_counter()
+        observe_stage(self.endpoint, stage, now - self.last)
+        self.last = now
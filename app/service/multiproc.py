@@ -0,0 +1,87 @@
+"""
+Purpose: Prometheus multiprocess support for multi-worker deployments.
+
+When several uvicorn/gunicorn workers serve the app, each worker keeps its own
+in-process registry, so a scrape of /metrics would only see one worker. In
+multiprocess mode prometheus_client stores every metric value in mmap-backed
+files under PROMETHEUS_MULTIPROC_DIR and the /metrics app aggregates all
+workers' files at scrape time.
+
+The directory is selected with the PROMETHEUS_MULTIPROC_DIR environment
+variable, which must be set before the process imports prometheus_client
+(i.e. in the environment of the server command, not in application code).
+
+Gunicorn usage (gunicorn.conf.py):
+    from app.service.multiproc import on_starting, child_exit
+"""
+
+import glob
+import os
+
+from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
+
+
+def multiproc_dir() -> str | None:
+    """
+    Returns: the configured multiprocess directory, or None when running single-process.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get("prometheus_multiproc_dir")
+
+
+def make_metrics_app():
+    """
+    Purpose: Build the ASGI app mounted at /metrics.
+    Returns: an app over the default registry, or over a MultiProcessCollector
+        that aggregates every worker's files when multiprocess mode is enabled.
+    """
+    if multiproc_dir() is None:
+        return make_asgi_app()
+
+    # A fresh registry that only holds the multiprocess collector: the default
+    # registry would report this worker's values a second time.
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return make_asgi_app(registry=registry)
+
+
+def prepare_directory(path: str | None = None) -> None:
+    """
+    Purpose: Create the multiprocess directory and remove files left by a previous run.
+    Args: path (str | None): Directory to prepare, defaults to PROMETHEUS_MULTIPROC_DIR.
+
+    Must run in the master process before any worker starts; stale files would
+    otherwise be aggregated into the new run's counters.
+    """
+    path = path or multiproc_dir()
+    if path is None:
+        return
+
+    os.makedirs(path, exist_ok=True)
+    for stale in glob.glob(os.path.join(path, "*.db")):
+        os.remove(stale)
+
+
+def mark_dead(pid: int) -> None:
+    """
+    Purpose: Remove a dead worker's live gauge files so they stop contributing to scrapes.
+    Args: pid (int): Process ID of the worker that exited.
+
+    Counter and histogram files are kept on purpose: their totals remain part
+    of the aggregate so rates do not drop when a worker is replaced.
+    """
+    if multiproc_dir() is not None:
+        multiprocess.mark_process_dead(pid)
+
+
+def on_starting(server) -> None:
+    """
+    Gunicorn hook: reset the metrics directory before workers are forked.
+    """
+    prepare_directory()
+
+
+def child_exit(server, worker) -> None:
+    """
+    Gunicorn hook: clean up after a worker exits.
+    """
+    mark_dead(worker.pid)
@@ -0,0 +1,138 @@
+"""
+Purpose: Run wide range conversions off the event loop, in chunks, on a bounded worker pool.
+
+Each chunk is converted and rendered to a JSON fragment in a worker; the
+fragments are joined in request order, so the result is byte-identical to
+render_json({"conversions": build_range(...)}) without the event loop doing
+per-item work.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+from app.service.metrics import OFFLOAD_IN_FLIGHT, OFFLOAD_WAITING, OFFLOAD_SATURATION
+from app.service.roman import RomanNumeralTranslateService
+
+
+@lru_cache(maxsize=None)
+def _service(max_value: int, vinculum: bool) -> RomanNumeralTranslateService:
+    """
+    One service per domain and process, so process-pool workers build their table once.
+    """
+    return RomanNumeralTranslateService(max_value=max_value, vinculum=vinculum)
+
+
+def render_chunk(max_value: int, vinculum: bool, start: int, stop: int) -> bytes:
+    """
+    Purpose: Render start..stop-1 as comma-separated JSON conversion objects.
+    Args:
+        max_value (int): Service domain, used to pick the worker's service.
+        vinculum (bool): Service notation, used to pick the worker's service.
+        start (int): First value (inclusive).
+        stop (int): Value to stop at (exclusive).
+    Returns: UTF-8 bytes of the objects, without the enclosing list brackets.
+    """
+    outputs = _service(max_value, vinculum).convert_many(start, stop)
+    # Numerals and integers never need JSON escaping, so format objects directly.
+    return ",".join(
+        f'{{"input":"{n}","output":"{output}"}}'
+        for n, output in zip(range(start, stop), outputs)
+    ).encode("utf-8")
+
+
+class RangeOffloader:
+    """
+    Purpose: Bounded pool that converts and renders wide ranges in ordered chunks.
+
+    At most `max_pending` chunks (across all requests of this process) are
+    submitted to the pool at once; further chunks wait on a semaphore, so a
+    burst of wide ranges cannot grow the executor's queue without bound.
+
+    Attributes:
+        workers (int): Pool size.
+        kind (str): "thread" or "process".
+        chunk_size (int): Values per chunk.
+        max_pending (int): Largest number of chunks submitted at once.
+    """
+
+    def __init__(self, workers: int, kind: str = "thread", chunk_size: int = 1000, max_pending: int = 64):
+        if kind not in ("thread", "process"):
+            raise ValueError("offload pool must be 'thread' or 'process'")
+        self.workers = workers
+        self.kind = kind
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self._executor: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight = 0
+        self._waiting = 0
+
+    def _pool(self) -> Executor:
+        # Created on first use, so pre-forked server workers do not inherit pool threads.
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="range-offload")
+        return self._executor
+
+    def _slots_for(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # An asyncio.Semaphore belongs to one event loop; rebuild it if the loop changes
+        # (only happens when the app is driven by successive loops, e.g. in tests).
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    def _report(self) -> None:
+        OFFLOAD_IN_FLIGHT.set(self._in_flight)
+        OFFLOAD_WAITING.set(self._waiting)
+        OFFLOAD_SATURATION.set(self._in_flight / self.max_pending)
+
+    async def _run_chunk(self, service: RomanNumeralTranslateService, start: int, stop: int) -> bytes:
+        executor = self._pool()
+        loop = asyncio.get_running_loop()
+        self._waiting += 1
+        self._report()
+        async with self._slots_for(loop):
+            self._waiting -= 1
+            self._in_flight += 1
+            self._report()
+            try:
+                return await loop.run_in_executor(
+                    executor, render_chunk, service.max_value, service.vinculum, start, stop
+                )
+            finally:
+                self._in_flight -= 1
+                self._report()
+
+    async def render_range(self, service: RomanNumeralTranslateService, start: int, stop: int) -> bytes:
+        """
+        Purpose: Build the JSON body of a range response on the pool.
+        Args:
+            service (RomanNumeralTranslateService): Service whose domain is converted; validated here.
+            start (int): First value (inclusive).
+            stop (int): Value to stop at (exclusive).
+        Returns: the same bytes as render_json({"conversions": ...}) for start..stop-1.
+        Raises: a ValueError If the range is invalid or too wide for the service.
+        """
+        # Validate on the loop so errors surface before any work is queued.
+        service.check_range(start, stop)
+        if service.max_range_width is not None and stop - start > service.max_range_width:
+            raise ValueError(f"Range cannot contain more than {service.max_range_width} values")
+
+        chunks = await asyncio.gather(*(
+            self._run_chunk(service, chunk_start, min(chunk_start + self.chunk_size, stop))
+            for chunk_start in range(start, stop, self.chunk_size)
+        ))
+        return b'{"conversions":[' + b",".join(chunks) + b"]}"
+
+    def shutdown(self) -> None:
+        """
+        Purpose: Stop the pool, waiting for running chunks to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
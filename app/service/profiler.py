@@ -0,0 +1,59 @@
+"""
+Purpose: Low-overhead sampling profiler for live traffic.
+
+A background thread periodically captures the stack of a target thread
+(normally the event loop thread) with sys._current_frames() and counts
+identical stacks. Nothing is installed in the target thread, so request
+handling runs at full speed between samples.
+"""
+
+import sys
+import threading
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    Purpose: Sample one thread's call stack at a fixed interval.
+
+    Attributes:
+        thread_id (int): Identifier of the thread to sample (threading.get_ident()).
+        interval (float): Seconds between samples.
+        samples (Counter[str]): Collapsed stack (root first, ';'-separated) to sample count.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        self._thread.join()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """
+        Returns: the samples in collapsed-stack format ("frame;frame;frame count" per line),
+            as consumed by flamegraph.pl and speedscope, most frequent first.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
@@ -3,36 +3,287 @@ Purpose: A Service class that is responsible for converting integers to Roman nu
 Attributes:
     VALUES (list[int]): Roman numeral base values in descending order.
     SYMBOLS (list[str]): Roman numeral symbols corresponding to VALUES.
+    MIN_VALUE (int): Smallest supported input.
+    MAX_VALUE (int): Default largest supported input.
+    STANDARD_MAX (int): Largest value expressible in standard notation.
+    VINCULUM_MAX (int): Largest value expressible with overline (vinculum) thousands.
+    TABLE (tuple[str, ...]): Precomputed numerals indexed by value (index 0 is unused).
+    MAX_NUMERAL_LENGTH (int): Length of the longest canonical numeral in standard notation.
 """
 
+from functools import lru_cache
+
+# Ordered Roman numeral values and symbols.
+# Order is critical: larger values and subtractive forms (e.g., 900 = CM)
+# must be evaluated first to generate canonical Roman numerals.
+VALUES = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
+SYMBOLS = ["M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"]
+
+MIN_VALUE = 1
+MAX_VALUE = 255
+STANDARD_MAX = 3999
+VINCULUM_MAX = 3_999_999
+
+# Combining overline: a symbol followed by it is worth 1000 times its usual value.
+OVERLINE = "\u0305"
+
+
+def convert_greedy(number: int) -> str:
+    """
+    Purpose: Reference implementation of the integer to Roman numeral conversion.
+    Args: number (int): Integer to convert. No range validation is performed.
+    Returns: a str of the canonical Roman numeral for the input number.
+    """
+    result: list[str] = []
+    remaining = number
+
+    # Greedy conversion algorithm:
+    # Repeatedly subtract the largest possible Roman value until the entire number has been converted.
+    for value, symbol in zip(VALUES, SYMBOLS):
+        while remaining >= value:
+            result.append(symbol)
+            remaining -= value
+
+    # Join once at the end for efficiency
+    return "".join(result)
+
+
+def overline(numeral: str) -> str:
+    """
+    Purpose: Apply the vinculum to every symbol of a numeral, multiplying its value by 1000.
+    Args: numeral (str): Standard Roman numeral.
+    Returns: a str with a combining overline after each symbol.
+    """
+    return "".join(symbol + OVERLINE for symbol in numeral)
+
+
+# Per-digit numerals for ones, tens, hundreds and thousands (0-3 only in standard notation).
+DIGITS = (
+    tuple(convert_greedy(d) for d in range(10)),
+    tuple(convert_greedy(d * 10) for d in range(10)),
+    tuple(convert_greedy(d * 100) for d in range(10)),
+    tuple(convert_greedy(d * 1000) for d in range(4)),
+)
+
+
+def convert_digits(number: int) -> str:
+    """
+    Purpose: Digit-decomposition conversion; the cost depends on the number of decimal digits.
+    Args: number (int): Integer between 1 and VINCULUM_MAX. No range validation is performed.
+    Returns: a str of the Roman numeral, using overlined thousands above STANDARD_MAX.
+    """
+    if number > STANDARD_MAX:
+        # Vinculum form: the thousands are written as an overlined numeral,
+        # followed by the standard numeral for the remainder.
+        return overline(convert_digits(number // 1000)) + convert_digits(number % 1000)
+
+    ones, tens, hundreds, thousands = DIGITS
+    return (
+        thousands[number // 1000]
+        + hundreds[number // 100 % 10]
+        + tens[number // 10 % 10]
+        + ones[number % 10]
+    )
+
+
+@lru_cache(maxsize=None)
+def build_table(max_value: int) -> tuple[str, ...]:
+    """
+    Purpose: Build the immutable lookup table used by the service.
+    Args: max_value (int): Largest value included in the table.
+    Returns: a tuple where position n holds the numeral for n (position 0 is an empty string).
+    """
+    return ("",) + tuple(convert_digits(n) for n in range(MIN_VALUE, max_value + 1))
+
+
+# Built once at import so every conversion is a bounds check plus an index.
+TABLE = build_table(MAX_VALUE)
+
+
+@lru_cache(maxsize=None)
+def build_reverse_table() -> dict[str, int]:
+    """
+    Purpose: Build the canonical numeral to integer dictionary for the standard domain.
+    Returns: a dict mapping every canonical numeral from I to MMMCMXCIX to its value.
+
+    Only canonical spellings are keys, so a single dict lookup both validates and
+    parses a numeral in time linear in its length, with no backtracking.
+    """
+    table = build_table(STANDARD_MAX)
+    return {numeral: n for n, numeral in enumerate(table) if n}
+
+
+# Longest canonical numeral in standard notation (3888 = MMMDCCCLXXXVIII).
+MAX_NUMERAL_LENGTH = max(len(numeral) for numeral in build_table(STANDARD_MAX))
+
+
 class RomanNumeralTranslateService:
-    # Ordered Roman numeral values and symbols.
-    # Order is critical: larger values and subtractive forms (e.g., 900 = CM)
-    # must be evaluated first to generate canonical Roman numerals.
-    VALUES = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
-    SYMBOLS = ["M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"]
+    # Exposed on the class for callers that introspect the conversion rules.
+    VALUES = VALUES
+    SYMBOLS = SYMBOLS
+
+    MIN_VALUE = MIN_VALUE
+    MAX_VALUE = MAX_VALUE
+
+    def __init__(
+        self,
+        max_value: int = MAX_VALUE,
+        vinculum: bool = False,
+        max_range_width: int | None = None,
+    ):
+        """
+        Purpose: Configure the supported domain.
+        Args:
+            max_value (int): Largest accepted input. Up to 3999 in standard notation.
+            vinculum (bool): Allow overline notation for values up to 3,999,999.
+            max_range_width (int | None): Largest block convert_many will materialize; None for no limit.
+        Raises: a ValueError If max_value cannot be expressed in the chosen notation.
+        """
+        limit = VINCULUM_MAX if vinculum else STANDARD_MAX
+        if max_value < MIN_VALUE or max_value > limit:
+            raise ValueError(f"max_value must be between {MIN_VALUE} and {limit}")
+
+        self.min_value = MIN_VALUE
+        self.max_value = max_value
+        self.vinculum = vinculum
+        self.max_range_width = max_range_width
+
+        # Standard-notation values come from the table; larger vinculum values
+        # fall back to the digit-decomposition engine.
+        self.table = build_table(min(max_value, STANDARD_MAX))
 
     def convert(self, number: int) -> str:
         """
         Purpose: Convert an integer to its Roman numeral representation.
-        Args: number (int): Integer to convert. Must be in the range 1 to 255.
+        Args: number (int): Integer to convert. Must be between 1 and the configured max_value.
         Returns: a str of Roman numeral that representation conversion of the input number.
         Raises: a ValueError If the input number is outside the supported range.
         """
 
         # Fail fast on invalid input to keep downstream logic simple and prevent undefined Roman numeral representations.
-        if number < 1 or number > 255:
-            raise ValueError("Input must be between 1 and 255")
+        if number < self.min_value or number > self.max_value:
+            raise ValueError(f"Input must be between {self.min_value} and {self.max_value}")
+
+        if number < len(self.table):
+            return self.table[number]
+        return convert_digits(number)
+
+    def check_range(self, start: int, stop: int) -> None:
+        """
+        Purpose: Validate a block of integers without converting it.
+        Args:
+            start (int): First integer of the block (inclusive).
+            stop (int): Integer to stop at (exclusive).
+        Raises: a ValueError If the block is empty or falls outside the supported range.
+        """
+        if start < self.min_value or stop - 1 > self.max_value:
+            raise ValueError(f"Input must be between {self.min_value} and {self.max_value}")
+        if start >= stop:
+            raise ValueError("start must be less than stop")
 
-        result: list[str] = []
-        remaining = number
+    def convert_many(self, start: int, stop: int) -> tuple[str, ...]:
+        """
+        Purpose: Convert a contiguous block of integers in a single call.
+        Args:
+            start (int): First integer to convert (inclusive).
+            stop (int): Integer to stop at (exclusive), following range() semantics.
+        Returns: a tuple of Roman numerals for start..stop-1, in ascending order.
+        Raises: a ValueError If the block is empty, too wide, or falls outside the supported range.
+        """
+        self.check_range(start, stop)
+        if self.max_range_width is not None and stop - start > self.max_range_width:
+            raise ValueError(f"Range cannot contain more than {self.max_range_width} values")
+
+        # A slice of the table: no per-item Python calls.
+        table_stop = len(self.table)
+        if stop <= table_stop:
+            return self.table[start:stop]
+
+        # Only vinculum values beyond the table need the digit engine.
+        return self.table[start:table_stop] + tuple(
+            convert_digits(n) for n in range(max(start, table_stop), stop)
+        )
+
+    def parse(self, numeral: str) -> int:
+        """
+        Purpose: Convert a canonical Roman numeral back to its integer value.
+        Args: numeral (str): Roman numeral in canonical form, optionally with overlined thousands.
+        Returns: an int value of the numeral.
+        Raises: a ValueError If the numeral is malformed, non-canonical, or outside the supported range.
+        """
+        # Bound the work before touching the input: anything longer cannot be canonical.
+        limit = MAX_NUMERAL_LENGTH * 3 if self.vinculum else MAX_NUMERAL_LENGTH
+        if not numeral or len(numeral) > limit:
+            raise ValueError("Invalid Roman numeral")
 
-        # Greedy conversion algorithm:
-        # Repeatedly subtract the largest possible Roman value until the entire number has been converted.
-        for value, symbol in zip(self.VALUES, self.SYMBOLS):
-            while remaining >= value:
-                result.append(symbol)
-                remaining -= value
+        reverse = build_reverse_table()
+        split = numeral.rfind(OVERLINE) + 1
+
+        if split == 0:
+            value = reverse.get(numeral)
+            if value is None:
+                raise ValueError("Invalid Roman numeral")
+        else:
+            # Vinculum form: an overlined thousands prefix, then an optional remainder below 1000.
+            head, tail = numeral[:split], numeral[split:]
+            symbols = head[0::2]
+            thousands = reverse.get(symbols)
+            remainder = reverse.get(tail, 0) if tail else 0
+            if (
+                not self.vinculum
+                or head[1::2] != OVERLINE * len(symbols)
+                or len(head) != 2 * len(symbols)
+                or thousands is None
+                or thousands * 1000 <= STANDARD_MAX
+                or (tail and not 0 < remainder < 1000)
+            ):
+                raise ValueError("Invalid Roman numeral")
+            value = thousands * 1000 + remainder
+
+        if value > self.max_value:
+            raise ValueError(f"Numeral must represent a value between {self.min_value} and {self.max_value}")
+        return value
+
+    def convert_batch(self, items: list[int | str]) -> list[tuple[str | None, str | None]]:
+        """
+        Purpose: Convert a mixed batch of integers and numerals in a single call.
+        Args: items (list[int | str]): Integers to convert to numerals, and numerals to convert to integers.
+        Returns: a list of (output, error) pairs in input order; exactly one of the two is None.
+        """
+        results: list[tuple[str | None, str | None]] = []
+        append = results.append
+        for item in items:
+            try:
+                if isinstance(item, str):
+                    append((str(self.parse(item)), None))
+                else:
+                    append((self.convert(item), None))
+            except ValueError as e:
+                # Per-item failures are reported without failing the whole batch.
+                append((None, str(e)))
+        return results
+
+    def convert_array(self, values):
+        """
+        Purpose: Convert a whole integer column with table gathers instead of per-element calls.
+        Args: values: NumPy integer array, or a pyarrow integer Array/ChunkedArray.
+        Returns: a same-length string column with invalid values null (masked for NumPy).
+        Raises: a TypeError If the input is not an integer column; ImportError If numpy is missing.
+        """
+        # Imported lazily so numpy/pyarrow stay optional for the HTTP service.
+        from app.service.vectorized import convert_array
+
+        return convert_array(self, values)
+
+    def convert_greedy(self, number: int) -> str:
+        """
+        Purpose: Convert an integer using the greedy reference algorithm.
+        Args: number (int): Integer to convert. Must be between 1 and min(max_value, 3999).
+        Returns: a str of Roman numeral for the input number.
+        Raises: a ValueError If the input number is outside the supported range.
+        """
+        upper = min(self.max_value, STANDARD_MAX)
+        if number < self.min_value or number > upper:
+            raise ValueError(f"Input must be between {self.min_value} and {upper}")
 
-        # Join once at the end for efficiency
-        return "".join(result)
+        return convert_greedy(number)
@@ -0,0 +1,151 @@
+"""
+Purpose: Column-at-a-time conversion for data pipelines.
+
+Converts whole NumPy or Arrow integer arrays with table gathers instead of
+per-element Python calls. Invalid values (out of range, or null in Arrow
+input) become nulls in the output rather than raising.
+
+NumPy and pyarrow are optional dependencies: this module imports them
+lazily and raises ImportError only when the corresponding path is used.
+"""
+
+from functools import lru_cache
+
+from app.service.roman import MAX_NUMERAL_LENGTH, STANDARD_MAX, build_table, overline
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise ImportError("convert_array requires numpy (pip install numpy)") from e
+    return numpy
+
+
+def _pyarrow():
+    """
+    Returns: (pyarrow, pyarrow.compute), or (None, None) when pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        return None, None
+    return pyarrow, pyarrow.compute
+
+
+@lru_cache(maxsize=None)
+def _tables(table_max: int):
+    """
+    Build the gather tables once per domain.
+
+    Returns: (table, thousands) where table[n] is the numeral for n <= table_max and
+        thousands[k] is the overlined numeral for k * 1000 (used above STANDARD_MAX).
+    """
+    table = build_table(table_max)
+    thousands = ("",) + tuple(overline(numeral) for numeral in build_table(STANDARD_MAX)[1:])
+    return table, thousands
+
+
+@lru_cache(maxsize=None)
+def _numpy_tables(table_max: int):
+    """
+    The gather tables of _tables as NumPy string arrays, built once per domain.
+    """
+    np = _numpy()
+    table, thousands = _tables(table_max)
+    return np.array(table), np.array(thousands)
+
+
+@lru_cache(maxsize=None)
+def _arrow_tables(table_max: int):
+    """
+    The gather tables of _tables as pyarrow string arrays, built once per domain.
+    """
+    pa, _ = _pyarrow()
+    table, thousands = _tables(table_max)
+    return pa.array(table, type=pa.string()), pa.array(thousands, type=pa.string())
+
+
+def _is_arrow(values) -> bool:
+    pa, _ = _pyarrow()
+    return pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray))
+
+
+def convert_array(service, values):
+    """
+    Purpose: Convert an integer column to Roman numerals in one vectorized pass.
+    Args:
+        service (RomanNumeralTranslateService): Defines the valid domain and notation.
+        values: NumPy integer array (or array-like), or a pyarrow integer Array/ChunkedArray.
+    Returns: a same-length string column with invalid entries null:
+        - NumPy input: numpy.ma.MaskedArray of str, masked where invalid.
+        - Arrow input: pyarrow StringArray (or ChunkedArray) with nulls where invalid.
+    Raises: a TypeError If the input is not an integer column.
+    """
+    if _is_arrow(values):
+        return _convert_arrow(service, values)
+    return _convert_numpy(service, values)
+
+
+def _convert_numpy(service, values):
+    np = _numpy()
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f"expected an integer array, got dtype {values.dtype}")
+
+    standard, thousands = _numpy_tables(len(service.table) - 1)
+    invalid = (values < service.min_value) | (values > service.max_value)
+    # Invalid positions gather the empty string at index 0 and are masked afterwards.
+    safe = np.where(invalid, 0, values).astype(np.int64, copy=False)
+
+    if service.max_value <= STANDARD_MAX:
+        return np.ma.MaskedArray(standard[safe], mask=invalid)
+
+    # Vinculum domain: overlined thousands joined with the standard numeral of the remainder.
+    large = safe > STANDARD_MAX
+    # Widen the string dtype so vinculum numerals are not truncated on assignment.
+    result = standard[np.where(large, 0, safe)].astype(f"<U{MAX_NUMERAL_LENGTH * 3}")
+    if large.any():
+        prefix = thousands[safe[large] // 1000]
+        suffix = standard[safe[large] % 1000]
+        result[large] = np.char.add(prefix, suffix)
+    return np.ma.MaskedArray(result, mask=invalid)
+
+
+def _convert_arrow(service, values):
+    pa, pc = _pyarrow()
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array(
+            [_convert_arrow(service, chunk) for chunk in values.chunks],
+            type=pa.string(),
+        )
+    if not pa.types.is_integer(values.type):
+        raise TypeError(f"expected an integer array, got type {values.type}")
+
+    standard, thousands = _arrow_tables(len(service.table) - 1)
+    if pa.types.is_uint64(values.type):
+        # Values above the int64 range cannot be cast; they are out of the domain anyway, so null them first.
+        in_domain = pc.less_equal(values, pa.scalar(service.max_value, values.type))
+        values = pc.if_else(in_domain, values, pa.scalar(None, values.type))
+    values = values.cast(pa.int64())
+    valid = pc.and_(
+        pc.greater_equal(values, service.min_value),
+        pc.less_equal(values, service.max_value),
+    )
+    # Null indices produce null outputs, so invalid and null inputs both come out null.
+    indices = pc.if_else(valid, values, pa.scalar(None, pa.int64()))
+
+    if service.max_value <= STANDARD_MAX:
+        return pc.take(standard, indices)
+
+    # Vinculum domain: overlined thousands joined with the standard numeral of the remainder.
+    large = pc.greater(indices, STANDARD_MAX)
+    big = pc.if_else(large, indices, 0)
+    kilo = pc.divide(big, 1000)  # integer division for int64 inputs
+    joined = pc.binary_join_element_wise(
+        pc.take(thousands, kilo),
+        pc.take(standard, pc.subtract(big, pc.multiply(kilo, 1000))),
+        "",
+    )
+    return pc.if_else(large, joined, pc.take(standard, pc.if_else(large, 0, indices)))
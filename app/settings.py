@@ -0,0 +1,122 @@
+"""
+Purpose: Central runtime configuration for the service.
+Every field can be overridden with an environment variable named
+ROMAN_<FIELD_NAME> (e.g. ROMAN_RESPONSE_CACHE_BYTES=0 disables the response cache).
+"""
+
+import os
+from dataclasses import dataclass, fields
+
+
+def _coerce(raw: str, default):
+    """
+    Convert an environment variable string to the type of the field default.
+    """
+    if isinstance(default, bool):
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(default, tuple):
+        # Comma-separated list, e.g. ROMAN_LATENCY_BUCKETS=0.0005,0.001,0.01
+        return tuple(float(item) for item in raw.split(",") if item.strip())
+    return type(default)(raw)
+
+
+@dataclass
+class Settings:
+    # Interface and port bound by `python -m app serve`.
+    host: str = "127.0.0.1"
+    port: int = 8000
+    # Worker processes forked by `python -m app serve`; 0 means one per CPU core.
+    workers: int = 0
+    # Largest accepted input. Up to 3999 in standard notation, 3999999 with vinculum enabled.
+    max_value: int = 255
+    # Opt in to overline (vinculum) notation for values above 3999.
+    vinculum: bool = False
+    # Largest number of values a buffered range response may contain.
+    max_range_width: int = 4000
+    # Largest number of items accepted by POST /v1/romannumeral/batch.
+    max_batch_size: int = 1000
+    # Largest frame, in bytes, accepted on /v1/romannumeral/ws; larger frames close the connection (1009).
+    ws_max_message_bytes: int = 64 * 1024
+    # Frames buffered per WebSocket connection before the server stops reading from it.
+    ws_max_pending: int = 32
+    # "sync" writes log lines from the request path; "async" hands them to a background writer.
+    log_mode: str = "sync"
+    # Capacity of the async logging queue.
+    log_queue_size: int = 10000
+    # What to do when the async logging queue is full: "drop" (and count) or "block".
+    log_overflow: str = "drop"
+    # Largest number of log lines written per write call in async mode.
+    log_batch_size: int = 256
+    # Fraction of successful requests whose INFO log lines are written (warnings and errors are always logged).
+    log_sample_rate: float = 1.0
+    # Requests at or above this latency, in seconds, always log their completion line.
+    log_slow_threshold_seconds: float = 0.1
+    # Upper bounds, in seconds, of the request latency histogram buckets.
+    latency_buckets: tuple = (
+        0.0001, 0.00025, 0.0005, 0.00075, 0.001, 0.0025, 0.005,
+        0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+    )
+    # Attach the request ID as an exemplar to latency observations at or above this many seconds.
+    # Exemplars are only exposed in OpenMetrics format and are disabled in multiprocess mode.
+    exemplar_threshold_seconds: float = 0.01
+    # Expose GET /debug/profile. Keep disabled unless actively investigating.
+    profiling_enabled: bool = False
+    # When set, /debug/profile requires a matching X-Debug-Token header.
+    profiling_token: str = ""
+    # Longest profile a single request may ask for, in seconds.
+    profiling_max_seconds: float = 60.0
+    # Seconds between stack samples for the collapsed-stack profiler.
+    profiling_interval_seconds: float = 0.005
+    # Upper bound, in bytes, for cached pre-serialized responses. 0 disables the cache.
+    response_cache_bytes: int = 8 * 1024 * 1024
+    # Number of conversions rendered per chunk of a streamed (NDJSON) range response.
+    stream_chunk_size: int = 256
+    # Seconds between event-loop lag probes.
+    loop_lag_interval_seconds: float = 0.1
+    # Reject /v1/* requests with 503 while event-loop lag exceeds this many seconds (0 disables).
+    shed_max_lag_seconds: float = 0.5
+    # Reject /v1/* requests with 503 while this many are already in flight (0 disables).
+    shed_max_in_flight: int = 512
+    # Retry-After value, in seconds, sent with 503 responses.
+    shed_retry_after_seconds: int = 1
+    # Buffered ranges wider than this many values are converted on a worker pool (0 disables offloading).
+    offload_threshold: int = 1000
+    # Offload pool type: "thread", or "process" to also use other CPU cores.
+    offload_pool: str = "thread"
+    # Number of offload pool workers.
+    offload_workers: int = 2
+    # Values converted per offloaded chunk.
+    offload_chunk_size: int = 1000
+    # Largest number of chunks submitted to the pool at once; further chunks wait.
+    offload_max_pending: int = 64
+    # Buffered JSON responses at least this many bytes are compressed when the client accepts it.
+    compression_min_bytes: int = 1024
+    # gzip compression level (1-9); compressed bodies are cached, so favour ratio over speed.
+    gzip_level: int = 6
+    # brotli quality (0-11), used when the optional brotli package is installed.
+    brotli_quality: int = 5
+    # max-age, in seconds, sent in Cache-Control on successful conversion responses.
+    cache_max_age_seconds: int = 86400
+    # Upper bound, in bytes, for cached bulk export files (CSV/Arrow/Parquet). 0 disables the cache.
+    export_cache_bytes: int = 64 * 1024 * 1024
+    # Largest number of rows in one export file; wider requests return 400.
+    export_max_rows: int = 1_000_000
+
+    @classmethod
+    def from_env(cls, environ=None) -> "Settings":
+        """
+        Purpose: Build settings from defaults overlaid with ROMAN_* environment variables.
+        Args: environ (Mapping | None): Source of variables, defaults to os.environ.
+        Returns: a populated Settings instance.
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        for field in fields(cls):
+            raw = environ.get(f"ROMAN_{field.name.upper()}")
+            if raw is not None:
+                values[field.name] = _coerce(raw, field.default)
+        return cls(**values)
+
+
+# Process-wide settings, loaded once at import.
+settings = Settings.from_env()
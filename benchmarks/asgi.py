@@ -0,0 +1,67 @@
+"""
+Purpose: Minimal in-process ASGI driver shared by the benchmarks.
+
+Calls an ASGI application directly, without sockets or an HTTP client,
+so measurements reflect only application and middleware cost.
+"""
+
+from urllib.parse import urlsplit
+
+
+async def call(app, method: str, target: str, headers=None, body: bytes = b"") -> tuple[int, dict, bytes]:
+    """
+    Purpose: Send one HTTP request through an ASGI application.
+    Args:
+        app: ASGI application.
+        method (str): HTTP method.
+        target (str): Path with optional query string, e.g. "/v1/romannumeral?query=10".
+        headers (dict | None): Request headers.
+        body (bytes): Request body.
+    Returns: a tuple of (status, response headers, response body).
+    """
+    url = urlsplit(target)
+    raw_headers = [(b"host", b"bench")]
+    for name, value in (headers or {}).items():
+        raw_headers.append((name.lower().encode("latin-1"), value.encode("latin-1")))
+    if body:
+        raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode("latin-1"),
+        "query_string": url.query.encode("latin-1"),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    status = 0
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", ()):
+                response_headers[name.decode("latin-1")] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
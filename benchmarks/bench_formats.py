@@ -0,0 +1,58 @@
+"""
+Purpose: Compare payload size and encode time of JSON, MessagePack and the
+length-prefixed binary format for a full-domain (1-3999) range response.
+
+Usage:
+    python -m benchmarks.bench_formats
+"""
+
+import time
+
+from app.api.router import render_json
+from app.service import formats
+from app.service.roman import RomanNumeralTranslateService, STANDARD_MAX
+
+
+def encode_json(start: int, outputs) -> bytes:
+    """
+    The buffered JSON path: build the conversions list, then serialize it.
+    """
+    return render_json({"conversions": [
+        {"input": str(n), "output": output}
+        for n, output in zip(range(start, start + len(outputs)), outputs)
+    ]})
+
+
+def best_time(encode, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        encode()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(rounds: int = 50) -> None:
+    service = RomanNumeralTranslateService(max_value=STANDARD_MAX)
+    outputs = service.convert_many(1, STANDARD_MAX + 1)
+
+    encoders = {
+        "json": lambda: encode_json(1, outputs),
+        "msgpack": lambda: formats.encode_range("msgpack", 1, outputs),
+        "binary": lambda: formats.encode_range("binary", 1, outputs),
+    }
+
+    json_size = len(encoders["json"]())
+    json_seconds = best_time(encoders["json"], rounds)
+    print(f"{'format':<10} {'bytes':>10} {'size':>7} {'encode ms':>10} {'speedup':>8}")
+    for name, encode in encoders.items():
+        size = len(encode())
+        seconds = best_time(encode, rounds)
+        print(
+            f"{name:<10} {size:>10,} {size / json_size:>6.0%} "
+            f"{seconds * 1000:>10.3f} {json_seconds / seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Purpose: Compare records per second of the original JsonFormatter with the current one.
+
+Usage:
+    python -m benchmarks.bench_logging
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+
+from app.logs.config import JsonFormatter
+
+
+class LegacyJsonFormatter(logging.Formatter):
+    """
+    The original formatter, kept here as the benchmark baseline.
+    """
+
+    def format(self, record):
+        log_record = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "request_id"):
+            log_record["request_id"] = record.request_id
+        if hasattr(record, "extra"):
+            log_record.update(record.extra)
+        return json.dumps(log_record)
+
+
+def make_record() -> logging.LogRecord:
+    """
+    A record shaped like the router's `request_completed` line.
+    """
+    record = logging.LogRecord("app.api.router", logging.INFO, __file__, 1, "request_completed", None, None)
+    record.request_id = "a7f2b8d4-4e9e-4a77-9c8b-4c0b8d77e2a1"
+    record.latency_seconds = 0.003
+    record.status = 200
+    return record
+
+
+def records_per_second(formatter: logging.Formatter, records: int) -> float:
+    record = make_record()
+    fmt = formatter.format
+    for _ in range(1000):  # warm-up
+        fmt(record)
+    start = time.perf_counter()
+    for _ in range(records):
+        fmt(record)
+    return records / (time.perf_counter() - start)
+
+
+def main(records: int = 200_000) -> None:
+    legacy = records_per_second(LegacyJsonFormatter(), records)
+    current = records_per_second(JsonFormatter(), records)
+    print(f"{'formatter':<12} {'records/s':>12}")
+    print(f"{'legacy':<12} {legacy:>12.0f}")
+    print(f"{'current':<12} {current:>12.0f}  ({current / legacy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Purpose: Compare request throughput of the legacy BaseHTTPMiddleware request-ID
+middleware with the pure ASGI implementation.
+
+Usage:
+    python -m benchmarks.bench_middleware
+"""
+
+import asyncio
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.request import RequestIDMiddleware
+from benchmarks.asgi import call
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """
+    The original implementation, kept here as the benchmark baseline.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+def build_app(middleware) -> FastAPI:
+    """
+    A minimal app so the measurement is dominated by middleware cost.
+    """
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return PlainTextResponse(request.state.request_id)
+
+    return app
+
+
+def requests_per_second(app, requests: int, headers=None) -> float:
+    """
+    Drive `requests` sequential requests through the app and return the achieved rate.
+    """
+    async def run():
+        for _ in range(requests):
+            status, _, _ = await call(app, "GET", "/ping", headers)
+            assert status == 200
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())  # warm-up
+        start = time.perf_counter()
+        loop.run_until_complete(run())
+        return requests / (time.perf_counter() - start)
+    finally:
+        loop.close()
+
+
+def main(requests: int = 5000) -> None:
+    legacy = build_app(LegacyRequestIDMiddleware)
+    current = build_app(RequestIDMiddleware)
+
+    print(f"{'case':<24} {'legacy_rps':>12} {'asgi_rps':>12} {'speedup':>8}")
+    for case, headers in (("generated id", None), ("client id", {"X-Request-ID": "bench-id"})):
+        before = requests_per_second(legacy, requests, headers)
+        after = requests_per_second(current, requests, headers)
+        print(f"{case:<24} {before:>12.0f} {after:>12.0f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Purpose: Compare the legacy per-item coroutine range path with the batched range engine.
+
+Usage:
+    python -m benchmarks.bench_range
+"""
+
+import asyncio
+import timeit
+
+from app.api.router import build_range, service
+
+# Range sizes to compare: small, medium and the full supported domain.
+SIZES = [10, 100, service.max_value]
+
+
+async def legacy_range(min_value: int, max_value: int) -> list[dict]:
+    """
+    The original implementation: one coroutine per item, awaited with asyncio.gather.
+    """
+    async def convert_async(n: int):
+        return {
+            "input": str(n),
+            "output": service.convert(n),
+        }
+
+    tasks = [convert_async(i) for i in range(min_value, max_value + 1)]
+    return await asyncio.gather(*tasks)
+
+
+async def batched_range(min_value: int, max_value: int) -> list[dict]:
+    """
+    The current implementation, wrapped in a coroutine so both paths pay the same await cost.
+    """
+    return build_range(min_value, max_value)
+
+
+def _time(loop: asyncio.AbstractEventLoop, fn, size: int, number: int) -> float:
+    """
+    Return the mean time in microseconds for one call of fn over a range of `size` items.
+    """
+    timer = timeit.Timer(lambda: loop.run_until_complete(fn(1, size)))
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / number * 1e6
+
+
+def main(number: int = 2000) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(legacy_range(1, 10)) == build_range(1, 10)
+
+        print(f"{'size':>6} {'legacy_us':>12} {'batched_us':>12} {'speedup':>8}")
+        for size in SIZES:
+            legacy = _time(loop, legacy_range, size, number)
+            batched = _time(loop, batched_range, size, number)
+            print(f"{size:>6} {legacy:>12.2f} {batched:>12.2f} {legacy / batched:>7.1f}x")
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
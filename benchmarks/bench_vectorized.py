@@ -0,0 +1,50 @@
+"""
+Purpose: Compare a Python loop over convert() with the vectorized convert_array() for a large column.
+
+Usage:
+    python -m benchmarks.bench_vectorized
+"""
+
+import time
+
+import numpy as np
+
+from app.service.roman import RomanNumeralTranslateService
+
+
+def main(rows: int = 1_000_000) -> None:
+    service = RomanNumeralTranslateService()
+    values = np.random.default_rng(0).integers(0, service.max_value + 2, size=rows)
+
+    start = time.perf_counter()
+    looped = []
+    for value in values.tolist():
+        try:
+            looped.append(service.convert(value))
+        except ValueError:
+            looped.append(None)
+    loop_seconds = time.perf_counter() - start
+
+    service.convert_array(values[:10])  # warm-up: lazy imports and table construction
+    start = time.perf_counter()
+    service.convert_array(values)
+    numpy_seconds = time.perf_counter() - start
+
+    print(f"{'path':<10} {'rows/s':>14}")
+    print(f"{'loop':<10} {rows / loop_seconds:>14,.0f}")
+    print(f"{'numpy':<10} {rows / numpy_seconds:>14,.0f}  ({loop_seconds / numpy_seconds:.1f}x)")
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return
+    column = pa.array(values)
+    service.convert_array(column[:10])
+    start = time.perf_counter()
+    service.convert_array(column)
+    arrow_seconds = time.perf_counter() - start
+    print(f"{'arrow':<10} {rows / arrow_seconds:>14,.0f}  ({loop_seconds / arrow_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Purpose: Performance regression gate.
+
+Runs the micro-benchmarks and the traffic replay, compares every metric with
+the stored baseline and exits non-zero when any metric regresses by more
+than the threshold. Runs fully offline and in-process.
+
+Usage:
+    python -m benchmarks.check                  # compare with benchmarks/baseline.json
+    python -m benchmarks.check --threshold 0.1  # fail on >10% regressions
+    python -m benchmarks.check --update         # record a new baseline on this machine
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+
+from benchmarks import micro, replay
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_TRAFFIC = os.path.join(BENCH_DIR, "traffic.jsonl")
+
+# Metrics where a larger value is a regression; every other metric is a rate.
+LOWER_IS_BETTER = {"replay_p50_seconds", "replay_p95_seconds", "replay_p99_seconds"}
+
+
+def collect(traffic: str = DEFAULT_TRAFFIC, scale: float = 1.0, repeat: int = 50, concurrency: int = 4,
+            rounds: int = 3) -> dict[str, float]:
+    """
+    Purpose: Run every benchmark and gather the gated metrics.
+    Returns: a dict of metric name to value. The replay keeps its best of `rounds` runs to damp noise.
+    """
+    from app.main import app
+    replay.silence_logs()
+
+    metrics = micro.run_all(scale)
+    requests = replay.load_requests(traffic)
+    result = max(
+        (replay.replay(requests, max(1, int(repeat * scale)), concurrency, app) for _ in range(rounds)),
+        key=lambda run: run["throughput"],
+    )
+    metrics.update({
+        "replay_throughput": result["throughput"],
+        "replay_p50_seconds": result["p50"],
+        "replay_p95_seconds": result["p95"],
+        "replay_p99_seconds": result["p99"],
+    })
+    return metrics
+
+
+def compare(baseline: dict[str, float], current: dict[str, float], threshold: float) -> list[str]:
+    """
+    Purpose: Find metrics that regressed past the threshold.
+    Args:
+        baseline (dict): Stored metric values.
+        current (dict): Freshly measured metric values.
+        threshold (float): Allowed relative regression, e.g. 0.2 for 20%.
+    Returns: a list of human-readable regression descriptions (empty when the gate passes).
+    """
+    regressions = []
+    for name, expected in baseline.items():
+        if name not in current or not expected:
+            continue
+        actual = current[name]
+        if name in LOWER_IS_BETTER:
+            change = (actual - expected) / expected
+        else:
+            change = (expected - actual) / expected
+        if change > threshold:
+            regressions.append(f"{name}: {expected:.6g} -> {actual:.6g} ({change:+.1%} worse)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fail when performance regresses past the stored baseline.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--traffic", default=DEFAULT_TRAFFIC)
+    parser.add_argument("--threshold", type=float, default=float(os.environ.get("BENCH_THRESHOLD", 0.25)),
+                        help="allowed relative regression (default 0.25, or $BENCH_THRESHOLD)")
+    parser.add_argument("--scale", type=float, default=1.0, help="iteration multiplier for quicker runs")
+    parser.add_argument("--update", action="store_true", help="write the measured values as the new baseline")
+    args = parser.parse_args(argv)
+
+    current = collect(args.traffic, args.scale)
+    for name, value in current.items():
+        print(f"{name:<34} {value:>16.6g}")
+
+    if args.update:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(), "metrics": current},
+                      handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)["metrics"]
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"\nOK: no metric regressed by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Purpose: Micro-benchmarks for the hot paths: numeral conversion, JSON log
+formatting and the request ID middleware.
+
+Usage:
+    python -m benchmarks.micro
+"""
+
+import time
+
+from app.logs.config import JsonFormatter
+from app.service.roman import RomanNumeralTranslateService
+from benchmarks.bench_logging import make_record
+from app.middleware.request import RequestIDMiddleware
+from benchmarks.bench_middleware import build_app, requests_per_second
+
+
+def _ops_per_second(fn, iterations: int, rounds: int = 5) -> float:
+    """
+    Best rate over several rounds, like timeit: slower rounds are noise from other processes.
+    """
+    fn()  # warm-up
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = max(best, iterations / (time.perf_counter() - start))
+    return best
+
+
+def bench_convert(iterations: int = 200_000) -> float:
+    service = RomanNumeralTranslateService()
+    convert = service.convert
+    values = list(range(service.min_value, service.max_value + 1))
+
+    def run():
+        for value in values:
+            convert(value)
+
+    return _ops_per_second(run, max(1, iterations // len(values) // 5)) * len(values)
+
+
+def bench_formatter(iterations: int = 100_000) -> float:
+    formatter = JsonFormatter()
+    record = make_record()
+    return _ops_per_second(lambda: formatter.format(record), max(1, iterations // 5))
+
+
+def bench_middleware(requests: int = 3000) -> float:
+    return requests_per_second(build_app(RequestIDMiddleware), requests)
+
+
+def run_all(scale: float = 1.0) -> dict[str, float]:
+    """
+    Purpose: Run every micro-benchmark.
+    Args: scale (float): Multiplier for iteration counts (lower for quick smoke runs).
+    Returns: a dict of metric name to operations per second (higher is better).
+    """
+    return {
+        "convert_ops_per_second": bench_convert(int(200_000 * scale)),
+        "formatter_records_per_second": bench_formatter(int(100_000 * scale)),
+        "middleware_requests_per_second": bench_middleware(max(10, int(3000 * scale))),
+    }
+
+
+def main() -> None:
+    for name, value in run_all().items():
+        print(f"{name:<34} {value:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Purpose: In-process load generator that replays a JSONL request log against
+app.main.app and reports throughput and latency percentiles.
+
+Each log line is a JSON object:
+    {"method": "GET", "path": "/v1/romannumeral?query=10"}
+    {"method": "POST", "path": "/v1/romannumeral/batch", "body": [1, "IV"], "headers": {"X-Request-ID": "abc"}}
+
+Usage:
+    python -m benchmarks.replay benchmarks/traffic.jsonl --repeat 50 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+
+from benchmarks.asgi import call
+
+
+def load_requests(path: str) -> list[dict]:
+    """
+    Purpose: Read a JSONL request log, skipping blank and malformed lines.
+    Args: path (str): Log file path.
+    Returns: a list of request dicts with method, path, headers and encoded body.
+    """
+    requests = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict) or "path" not in entry:
+                continue
+
+            headers = dict(entry.get("headers") or {})
+            body = b""
+            if "body" in entry:
+                body = json.dumps(entry["body"]).encode("utf-8")
+                headers.setdefault("Content-Type", "application/json")
+            requests.append({
+                "method": entry.get("method", "GET").upper(),
+                "path": entry["path"],
+                "headers": headers,
+                "body": body,
+            })
+    return requests
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _replay(app, requests: list[dict], repeat: int, concurrency: int) -> tuple[list[float], dict[int, int], float]:
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(repeat):
+        for request in requests:
+            queue.put_nowait(request)
+
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+
+    async def worker():
+        while True:
+            try:
+                request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            status, _, _ = await call(app, request["method"], request["path"], request["headers"], request["body"])
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - start
+
+
+def replay(requests: list[dict], repeat: int = 1, concurrency: int = 1, app=None) -> dict:
+    """
+    Purpose: Replay requests against the application in-process.
+    Args:
+        requests (list[dict]): Requests as returned by load_requests.
+        repeat (int): Number of passes over the request list.
+        concurrency (int): Number of concurrent in-flight requests.
+        app: ASGI app to drive, defaults to app.main.app.
+    Returns: a dict with requests, throughput (requests/s), p50/p95/p99 latency (seconds) and status counts.
+    """
+    if app is None:
+        from app.main import app
+
+    loop = asyncio.new_event_loop()
+    try:
+        latencies, statuses, elapsed = loop.run_until_complete(_replay(app, requests, repeat, concurrency))
+    finally:
+        loop.close()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "statuses": statuses,
+    }
+
+
+def silence_logs() -> None:
+    """
+    Send application logs to /dev/null so the terminal does not bottleneck the run.
+    Formatting still happens, so logging cost stays part of the measurement.
+    """
+    devnull = open(os.devnull, "w")
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(devnull)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a JSONL request log against the app in-process.")
+    parser.add_argument("log", nargs="?", default=os.path.join(os.path.dirname(__file__), "traffic.jsonl"))
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the log")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent in-flight requests")
+    args = parser.parse_args()
+
+    from app.main import app
+    silence_logs()
+
+    result = replay(load_requests(args.log), args.repeat, args.concurrency, app)
+    print(f"requests    {result['requests']}")
+    print(f"throughput  {result['throughput']:,.0f} req/s")
+    for name in ("p50", "p95", "p99"):
+        print(f"{name:<11} {result[name] * 1000:.3f} ms")
+    print(f"statuses    {result['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
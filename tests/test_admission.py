@@ -0,0 +1,147 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from starlette.websockets import WebSocketDisconnect
+
+from app.middleware.admission import AdmissionControlMiddleware
+from app.service.lag import LoopLagMonitor
+
+
+def build_app(monitor, max_lag=0.5, max_in_flight=0):
+    app = FastAPI()
+
+    @app.get("/v1/romannumeral")
+    async def convert():
+        return {"output": "X"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.websocket("/v1/romannumeral/ws")
+    async def socket(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text(await websocket.receive_text())
+        await websocket.close()
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        monitor=monitor,
+        max_lag=max_lag,
+        max_in_flight=max_in_flight,
+        retry_after=2,
+    )
+    return app
+
+
+def test_sheds_api_requests_while_lagging():
+    """
+    Check: Does high event-loop lag turn /v1/* requests into 503 with Retry-After
+    Purpose: Validates lag-based shedding while /health keeps being served
+
+    """
+    monitor = SimpleNamespace(lag=0.0)
+    client = TestClient(build_app(monitor))
+    before = REGISTRY.get_sample_value("http_requests_shed_total", {"reason": "lag"}) or 0
+
+    assert client.get("/v1/romannumeral").status_code == 200
+
+    monitor.lag = 1.0
+    shed = client.get("/v1/romannumeral")
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "2"
+    assert client.get("/health").status_code == 200
+    assert REGISTRY.get_sample_value("http_requests_shed_total", {"reason": "lag"}) == before + 1
+
+
+def test_sheds_api_requests_over_in_flight_limit():
+    """
+    Check: Are requests beyond the in-flight limit rejected and the slot released afterwards
+    Purpose: Validates concurrency-based shedding and in-flight accounting
+
+    """
+    monitor = SimpleNamespace(lag=0.0)
+    middleware = AdmissionControlMiddleware(None, monitor, max_lag=0, max_in_flight=1)
+    started, release = asyncio.Event(), asyncio.Event()
+    statuses = []
+
+    async def slow_app(scope, receive, send):
+        started.set()
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware.app = slow_app
+
+    async def call():
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+        await middleware({"type": "http", "path": "/v1/integer"}, None, send)
+
+    async def scenario():
+        first = asyncio.create_task(call())
+        await started.wait()
+        await call()              # rejected: one request already in flight
+        release.set()
+        await first
+        await call()              # admitted again once the slot is free
+
+    asyncio.run(scenario())
+    assert statuses == [503, 200, 200]
+    assert middleware.in_flight == 0
+
+
+def test_websocket_connections_are_shed_and_counted():
+    """
+    Check: Is a WebSocket handshake refused with close code 1013 while shedding, and does an open connection hold an in-flight slot
+    Purpose: Ensures the WebSocket channel is covered by the same admission control as the other /v1/* routes
+
+    """
+    monitor = SimpleNamespace(lag=0.0)
+    client = TestClient(build_app(monitor, max_in_flight=1))
+    before = REGISTRY.get_sample_value("http_requests_shed_total", {"reason": "in_flight"}) or 0
+
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        # The open connection takes the only slot, so HTTP requests and new connections are shed.
+        assert client.get("/v1/romannumeral").status_code == 503
+        with pytest.raises(WebSocketDisconnect) as refused:
+            with client.websocket_connect("/v1/romannumeral/ws"):
+                pass
+        assert refused.value.code == 1013
+        ws.send_text("ping")
+        assert ws.receive_text() == "ping"
+
+    assert REGISTRY.get_sample_value("http_requests_shed_total", {"reason": "in_flight"}) == before + 2
+    assert client.get("/v1/romannumeral").status_code == 200
+
+    monitor.lag = 1.0
+    with pytest.raises(WebSocketDisconnect) as refused:
+        with client.websocket_connect("/v1/romannumeral/ws"):
+            pass
+    assert refused.value.code == 1013
+
+
+def test_lag_monitor_measures_blocked_loop():
+    """
+    Check: Does the probe report lag when the event loop is blocked
+    Purpose: Validates the measurement feeding admission control and the lag metrics
+
+    """
+    async def scenario():
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)           # block the loop
+        await asyncio.sleep(0.005)  # the overdue probe runs first and records the lag
+        lag = monitor.lag
+        await monitor.stop()
+        return lag
+
+    assert asyncio.run(scenario()) >= 0.05
+    assert REGISTRY.get_sample_value("event_loop_lag_sample_seconds_count") > 0
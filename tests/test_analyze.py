@@ -0,0 +1,156 @@
+import json
+import random
+
+import pytest
+
+from app.logs.analyze import analyze_files, analyze_lines, main, read_range
+from app.logs.sketch import QuantileSketch
+
+
+def _line(message: str, second: float, request_id: str, **extra) -> bytes:
+    minutes, seconds = divmod(second, 60)
+    stamp = f"2025-01-22T20:{int(minutes):02d}:{int(seconds):02d}.{int(round(second % 1 * 1000)):03d}Z"
+    record = {"timestamp": stamp, "level": "INFO", "logger": "app.middleware.logging",
+              "message": message, "request_id": request_id, **extra}
+    return (json.dumps(record) + "\n").encode()
+
+
+def _request(second: float, request_id: str, latency: float, status: int = 200, received: bool = True) -> list[bytes]:
+    lines = [_line("request_received", second, request_id)] if received else []
+    return lines + [_line("request_completed", second + latency, request_id,
+                          latency_seconds=latency, status=status)]
+
+
+def test_sketch_quantiles_within_accuracy_and_merge_exactly():
+    """
+    Check: Are sketch percentiles within the configured relative error, and does merging two halves equal one sketch
+    Purpose: Validates the mergeable sketch used for per-window and cross-process latency percentiles
+
+    """
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-5, 1.5) for _ in range(20_000)]
+    whole, left, right = QuantileSketch(0.01), QuantileSketch(0.01), QuantileSketch(0.01)
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i % 2 else right).add(value)
+    left.merge(right)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99, 0.999):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(whole.quantile(q) - exact) <= 0.01 * exact
+        assert left.quantile(q) == whole.quantile(q)
+    assert left.count == whole.count and left.max == whole.max
+
+
+def test_analyze_pairs_requests_and_survives_malformed_lines():
+    """
+    Check: Are received/completed pairs correlated, sampled-out and unfinished requests counted, and bad lines skipped
+    Purpose: Validates the analyser tolerates truncated logs and log sampling without aborting
+
+    """
+    lines = (
+        _request(0.0, "a", 0.010)
+        + _request(1.0, "b", 0.500, status=500)
+        + _request(2.0, "c", 0.020, received=False)
+        + [_line("request_received", 3.0, "d")]
+        + [b'{"timestamp": "2025-01-22T20:00:04.000Z", "message": "request_compl\n',
+           b"\x00\xffgarbage\n",
+           b'{"message": "request_completed", "timestamp": "nope", "latency_seconds": 1}\n',
+           _line("server_starting", 5.0, "-")]
+        + _request(70.0, "e", 0.030, status=400)
+    )
+
+    summary = analyze_lines(lines, window=60, top=2).finalize()
+
+    assert summary.paired == 3
+    assert summary.completed_only == 1
+    assert summary.incomplete == 1
+    assert summary.malformed == 2
+    assert summary.overall.statuses == {"200": 2, "400": 1, "500": 1}
+    assert [len(summary.windows[key].slowest) for key in sorted(summary.windows)] == [2, 1]
+    first = summary.to_dict()["windows"][0]
+    assert first["start"] == "2025-01-22T20:00:00Z"
+    assert [item["request_id"] for item in first["slowest"]] == ["b", "c"]
+
+
+def test_non_finite_latencies_are_malformed_with_stdlib_parser(monkeypatch):
+    """
+    Check: With the stdlib JSON parser, are NaN, Infinity and overflowing latencies counted as malformed instead of aborting
+    Purpose: Ensures the run survives tokens json.loads accepts but no latency can hold
+
+    """
+    from app.logs import analyze
+
+    monkeypatch.setattr(analyze, "_loads", json.loads)
+    bad = [
+        _line("request_completed", 1.0, f"bad-{i}", status=200).replace(b'"status"', token + b', "status"')
+        for i, token in enumerate((b'"latency_seconds": NaN', b'"latency_seconds": Infinity', b'"latency_seconds": 1e999'))
+    ]
+
+    summary = analyze_lines(_request(0.0, "a", 0.010) + bad).finalize()
+
+    assert summary.malformed == 3
+    assert summary.paired == 1
+    assert summary.overall.sketch.count == 1
+
+
+def test_parallel_chunks_match_serial(tmp_path):
+    """
+    Check: Does analysing several files in small chunks across processes give the same totals and percentiles as one pass
+    Purpose: Validates merging of partial results, including pairs split across chunk boundaries
+
+    """
+    rng = random.Random(3)
+    paths = []
+    for name in ("one.log", "two.log"):
+        lines = []
+        for i in range(400):
+            lines += _request(i * 0.5, f"{name}-{i}", rng.uniform(0.001, 0.2), rng.choice((200, 400)),
+                              received=rng.random() > 0.2)
+        path = tmp_path / name
+        path.write_bytes(b"".join(lines))
+        paths.append(str(path))
+
+    serial = analyze_files(paths, window=60, top=3)
+    parallel = analyze_files(paths, workers=2, chunk_bytes=4096, window=60, top=3)
+
+    expected, actual = serial.to_dict(), parallel.to_dict()
+    # Means are sums of floats added in a different order; everything else merges exactly.
+    for report in (expected, actual):
+        means = [stats["latency_seconds"].pop("mean") for stats in [report["overall"], *report["windows"]]]
+        report["means"] = means
+    assert actual.pop("means") == pytest.approx(expected.pop("means"))
+    assert actual == expected
+    assert serial.paired + serial.completed_only == 800
+
+
+def test_read_range_assigns_each_line_to_one_chunk(tmp_path):
+    """
+    Check: Do byte chunks together yield every line exactly once, wherever the boundaries fall
+    Purpose: Validates chunk splitting for the process pool
+
+    """
+    path = tmp_path / "lines.log"
+    path.write_bytes(b"".join(f"line {i}\n".encode() for i in range(100)))
+    size = path.stat().st_size
+
+    for chunk in (1, 7, 8, 64, size):
+        with open(path, "rb") as stream:
+            lines = [line for start in range(0, size, chunk) for line in read_range(stream, start, min(start + chunk, size))]
+        assert lines == path.read_bytes().splitlines(keepends=True)
+
+
+def test_cli_prints_json_report(tmp_path, capsys):
+    """
+    Check: Does `python -m app.logs.analyze --json` print the summary as JSON
+    Purpose: Validates the command-line entry point
+
+    """
+    path = tmp_path / "service.log"
+    path.write_bytes(b"".join(_request(0.0, "a", 0.010)))
+
+    assert main([str(path), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["paired"] == 1
+    assert report["overall"]["statuses"] == {"200": 1}
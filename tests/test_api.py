@@ -1,3 +1,7 @@
+import json
+from prometheus_client import REGISTRY
+
+
 def test_single_conversion(client):
     """
     
@@ -67,4 +71,252 @@ def test_range_invalid_min_greater_than_max(client):
     """
     response = client.get("/v1/romannumeral?min=5&max=3")
     
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+def test_range_conversion_full_domain(client):
+    """
+
+    Check: Does a full-domain range query return every value in ascending order
+    Purpose: Validates the batched range engine end to end
+
+    """
+    response = client.get("/v1/romannumeral?min=1&max=255")
+
+    assert response.status_code == 200
+    conversions = response.json()["conversions"]
+    assert len(conversions) == 255
+    assert conversions[0] == {"input": "1", "output": "I"}
+    assert conversions[-1] == {"input": "255", "output": "CCLV"}
+
+
+def test_repeated_conversion_served_from_cache(client):
+    """
+
+    Check: Does a repeated request return identical bytes and count as a cache hit
+    Purpose: Validates the pre-serialized response cache on the conversion route
+
+    """
+    first = client.get("/v1/romannumeral?min=10&max=20")
+    hits = REGISTRY.get_sample_value("response_cache_hits_total", {"cache": "response"})
+    second = client.get("/v1/romannumeral?min=10&max=20")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+    assert REGISTRY.get_sample_value("response_cache_hits_total", {"cache": "response"}) == hits + 1
+
+
+def test_range_streaming_ndjson(client):
+    """
+
+    Check: Does a range with stream=true (or Accept: application/x-ndjson) return one JSON object per line
+    Purpose: Validates the streaming mode and that request metrics are recorded once the body is sent
+
+    """
+    labels = {"method": "GET", "endpoint": "/v1/romannumeral", "status": "200"}
+    before = REGISTRY.get_sample_value("http_requests_total", labels) or 0
+
+    response = client.get("/v1/romannumeral?min=1&max=255&stream=true")
+    negotiated = client.get(
+        "/v1/romannumeral?min=1&max=3",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 255
+    assert lines[3] == {"input": "4", "output": "IV"}
+    assert negotiated.text.splitlines() == [
+        '{"input":"1","output":"I"}',
+        '{"input":"2","output":"II"}',
+        '{"input":"3","output":"III"}',
+    ]
+    assert REGISTRY.get_sample_value("http_requests_total", labels) == before + 2
+
+
+def test_range_streaming_invalid(client):
+    """
+
+    Check: Is an invalid streamed range still rejected with HTTP 400 before any body is sent
+    Purpose: Ensures streaming keeps the same validation semantics as the buffered response
+
+    """
+    response = client.get("/v1/romannumeral?min=1&max=300&stream=true")
+
+    assert response.status_code == 400
+    assert "Input must be between" in response.json()["detail"]
+
+
+def test_reverse_conversion(client):
+    """
+
+    Check: Does a valid numeral return the correct integer
+    Purpose: Verifies the Roman numeral to integer endpoint and its JSON response format
+
+    """
+    response = client.get("/v1/integer?numeral=CXCIX")
+
+    assert response.status_code == 200
+    assert response.json() == {"input": "CXCIX", "output": "199"}
+
+
+def test_reverse_conversion_invalid(client):
+    """
+
+    Check: Do malformed, non-canonical, out-of-range or missing numerals trigger a HTTP 400 code
+    Purpose: Validates the strict canonical-form parser and shared error semantics
+
+    """
+    for numeral in ["IIII", "VX", "iv", "ABC", "CCLVI", "X" * 10_000]:
+        response = client.get(f"/v1/integer?numeral={numeral}")
+        assert response.status_code == 400
+        assert "detail" in response.json()
+
+    assert client.get("/v1/integer").status_code == 400
+
+
+def test_batch_conversion(client):
+    """
+
+    Check: Does a mixed batch return results in order with per-item errors
+    Purpose: Validates the batch endpoint reports bad items without failing the whole request
+
+    """
+    response = client.post("/v1/romannumeral/batch", json=[10, "XIV", 300, "IIII", 4])
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {"input": "10", "output": "X"},
+            {"input": "XIV", "output": "14"},
+            {"input": "300", "error": "Input must be between 1 and 255"},
+            {"input": "IIII", "error": "Invalid Roman numeral"},
+            {"input": "4", "output": "IV"},
+        ]
+    }
+    assert REGISTRY.get_sample_value("roman_conversions_total", {"type": "batch"}) >= 1
+    assert REGISTRY.get_sample_value("roman_batch_items_count") >= 1
+
+
+def test_batch_conversion_invalid(client):
+    """
+
+    Check: Do empty and oversized batches trigger a HTTP 400 code
+    Purpose: Validates the configurable batch size limit
+
+    """
+    assert client.post("/v1/romannumeral/batch", json=[]).status_code == 400
+    assert client.post("/v1/romannumeral/batch", json=[1] * 1001).status_code == 400
+
+
+def test_caching_headers(client):
+    """
+
+    Check: Do conversion responses carry a deterministic ETag and Cache-Control
+    Purpose: Lets clients and CDNs cache results that never change for a deploy
+
+    """
+    first = client.get("/v1/romannumeral?query=10")
+    second = client.get("/v1/romannumeral?query=10")
+    other = client.get("/v1/romannumeral?query=11")
+    reverse = client.get("/v1/integer?numeral=X")
+
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"] != other.headers["etag"]
+    assert first.headers["cache-control"].startswith("public, max-age=")
+    assert reverse.headers["etag"] not in (first.headers["etag"], other.headers["etag"])
+
+    json_range = client.get("/v1/romannumeral?min=1&max=3")
+    ndjson_range = client.get("/v1/romannumeral?min=1&max=3&stream=true")
+    assert json_range.headers["etag"] != ndjson_range.headers["etag"]
+    assert json_range.headers["vary"] == "Accept, Accept-Encoding"
+
+
+def test_if_none_match_returns_304(client):
+    """
+
+    Check: Does a matching If-None-Match return 304 and get counted under status="304"
+    Purpose: Validates revalidation skips the work and is measurable in REQUEST_COUNT
+
+    """
+    labels = {"method": "GET", "endpoint": "/v1/romannumeral", "status": "304"}
+    before = REGISTRY.get_sample_value("http_requests_total", labels) or 0
+
+    etag = client.get("/v1/romannumeral?min=1&max=5").headers["etag"]
+    exact = client.get("/v1/romannumeral?min=1&max=5", headers={"If-None-Match": etag})
+    listed = client.get(
+        "/v1/romannumeral?min=1&max=5",
+        headers={"If-None-Match": f'"stale", W/{etag}'},
+    )
+    stale = client.get("/v1/romannumeral?min=1&max=5", headers={"If-None-Match": '"stale"'})
+
+    assert exact.status_code == 304
+    assert exact.content == b""
+    assert exact.headers["etag"] == etag
+    assert listed.status_code == 304
+    assert stale.status_code == 200
+    assert REGISTRY.get_sample_value("http_requests_total", labels) == before + 2
+
+    numeral_etag = client.get("/v1/integer?numeral=XIV").headers["etag"]
+    assert client.get("/v1/integer?numeral=XIV", headers={"If-None-Match": numeral_etag}).status_code == 304
+
+
+def test_if_none_match_star_does_not_hide_invalid_input(client):
+    """
+
+    Check: Does invalid input return 400 even with If-None-Match: *, while valid input returns 304
+    Purpose: Ensures a wildcard revalidation only matches inputs that have a representation
+
+    """
+    star = {"If-None-Match": "*"}
+
+    assert client.get("/v1/romannumeral?query=300", headers=star).status_code == 400
+    assert client.get("/v1/romannumeral?min=1&max=300", headers=star).status_code == 400
+    assert client.get("/v1/romannumeral?min=1&max=300&stream=true", headers=star).status_code == 400
+    assert client.get("/v1/integer?numeral=XYZ", headers=star).status_code == 400
+    assert client.get("/v1/romannumeral/export?format=csv&max=300", headers=star).status_code == 400
+
+    assert client.get("/v1/romannumeral?query=10", headers=star).status_code == 304
+    assert client.get("/v1/romannumeral?min=1&max=10", headers=star).status_code == 304
+    assert client.get("/v1/integer?numeral=X", headers=star).status_code == 304
+
+
+def test_range_compression(client):
+    """
+
+    Check: Is a large range gzip-compressed once and served from cache afterwards
+    Purpose: Validates Accept-Encoding negotiation, the per-encoding ETag and compression metrics
+
+    """
+    labels = {"encoding": "gzip"}
+    url = "/v1/romannumeral?min=1&max=200"
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    before = REGISTRY.get_sample_value("http_response_compression_seconds_count", labels) or 0
+    first = client.get(url, headers={"Accept-Encoding": "gzip"})
+    second = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert int(first.headers["content-length"]) < len(plain.content)
+    assert first.json() == plain.json()
+    assert first.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert second.content == first.content
+    assert REGISTRY.get_sample_value("http_response_compression_seconds_count", labels) == before + 1
+
+    revalidated = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+
+    # Each tag only matches the representation it was sent with.
+    identity = client.get(url, headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]})
+    assert identity.status_code == 200
+    assert identity.headers["etag"] == plain.headers["etag"]
+    gzip_with_plain_tag = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]})
+    assert gzip_with_plain_tag.status_code == 200
+    assert gzip_with_plain_tag.headers["etag"] == first.headers["etag"]
+
+    small = client.get("/v1/romannumeral?min=1&max=3", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
@@ -0,0 +1,38 @@
+import os
+
+from benchmarks.check import compare
+from benchmarks.replay import load_requests, percentile, replay
+
+TRAFFIC = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "traffic.jsonl")
+
+
+def test_regression_gate():
+    """
+    Check: Does the gate flag rates that drop and latencies that rise past the threshold, and nothing else
+    Purpose: Validates the direction-aware comparison against the stored baseline
+
+    """
+    baseline = {"replay_throughput": 1000.0, "replay_p99_seconds": 0.010, "convert_ops_per_second": 100.0}
+
+    assert compare(baseline, {"replay_throughput": 900.0, "replay_p99_seconds": 0.011, "convert_ops_per_second": 150.0}, 0.2) == []
+
+    regressions = compare(baseline, {"replay_throughput": 700.0, "replay_p99_seconds": 0.015, "convert_ops_per_second": 100.0}, 0.2)
+    assert [line.split(":")[0] for line in regressions] == ["replay_throughput", "replay_p99_seconds"]
+
+
+def test_replay_traffic_log(tmp_path):
+    """
+    Check: Does the in-process replay serve every logged request and skip malformed lines
+    Purpose: Smoke-tests the load generator against the real application
+
+    """
+    log = tmp_path / "traffic.jsonl"
+    log.write_text(open(TRAFFIC).read() + '{"truncated": \nnot json\n')
+    requests = load_requests(str(log))
+
+    result = replay(requests, repeat=1, concurrency=2)
+
+    assert result["requests"] == len(requests) == 14
+    assert result["statuses"][200] > 0
+    assert 0 < result["p50"] <= result["p95"] <= result["p99"]
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
@@ -0,0 +1,62 @@
+from app.service.cache import ResponseCache
+from app.service.compression import ENCODINGS, negotiate
+
+
+def test_cache_hit_and_miss():
+    """
+    Check: Does the cache return stored bytes on a hit and None on a miss
+    Purpose: Validates the basic contract relied on by the conversion route
+
+    """
+    cache = ResponseCache(max_bytes=1024)
+    assert cache.get(("single", 1)) is None
+
+    cache.put(("single", 1), b'{"input":"1","output":"I"}')
+    assert cache.get(("single", 1)) == b'{"input":"1","output":"I"}'
+
+
+def test_cache_evicts_least_recently_used():
+    """
+    Check: When the byte budget is exceeded is the least recently used entry evicted
+    Purpose: Ensures memory stays bounded while hot entries survive
+
+    """
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")              # "a" is now most recently used
+    cache.put("c", b"cccc")     # 12 bytes > 10, so "b" goes
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.size == 8
+
+
+def test_cache_skips_oversized_and_disabled():
+    """
+    Check: Are values larger than the budget (or any value with a zero budget) left uncached
+    Purpose: Ensures a single large response cannot flush the whole cache
+
+    """
+    cache = ResponseCache(max_bytes=4)
+    cache.put("big", b"too large")
+    assert len(cache) == 0
+
+    disabled = ResponseCache(max_bytes=0)
+    disabled.put("a", b"a")
+    assert disabled.get("a") is None
+
+
+def test_negotiate_encoding():
+    """
+    Check: Does Accept-Encoding negotiation honour q-values, wildcards and refusals
+    Purpose: Ensures bodies are only compressed with an encoding the client accepts
+
+    """
+    assert negotiate("") is None
+    assert negotiate("identity") is None
+    assert negotiate("gzip, deflate") == "gzip"
+    assert negotiate("gzip;q=0") is None
+    assert negotiate("*") == ENCODINGS[0]
+    assert negotiate("*, gzip;q=0") == ("br" if "br" in ENCODINGS else None)
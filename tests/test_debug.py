@@ -0,0 +1,67 @@
+from prometheus_client import REGISTRY
+
+from app.settings import settings
+
+
+def test_profile_disabled_by_default(client):
+    """
+    Check: Is the profiling endpoint hidden (404) unless explicitly enabled
+    Purpose: Ensures diagnostics are not exposed in a default deployment
+
+    """
+    response = client.get("/debug/profile?seconds=0.1")
+
+    assert response.status_code == 404
+
+
+def test_profile_collapsed_stacks(client, monkeypatch):
+    """
+    Check: When enabled, does the profiler return collapsed stacks sampled from the event loop
+    Purpose: Validates the sampling profiler output format
+
+    """
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_interval_seconds", 0.001)
+
+    response = client.get("/debug/profile?seconds=0.2")
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) >= 1
+    assert ";" in stack
+
+
+def test_profile_pstats_and_guards(client, monkeypatch):
+    """
+    Check: Does format=pstats return a cProfile report, and are the token and duration limits enforced
+    Purpose: Validates the alternate output format and the endpoint's guards
+
+    """
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_token", "secret")
+
+    assert client.get("/debug/profile?seconds=0.1").status_code == 403
+    assert client.get("/debug/profile?seconds=0.1", headers={"X-Debug-Token": "secreT"}).status_code == 403
+    assert client.get(
+        "/debug/profile?seconds=3600", headers={"X-Debug-Token": "secret"}
+    ).status_code == 400
+
+    response = client.get("/debug/profile?seconds=0.1&format=pstats", headers={"X-Debug-Token": "secret"})
+    assert response.status_code == 200
+    assert "function calls" in response.text
+
+
+def test_stage_latency_recorded(client):
+    """
+    Check: Are conversion requests broken down into validation, conversion, serialization and logging stages
+    Purpose: Validates per-stage latency instrumentation
+
+    """
+    # A value no other test requests, so the conversion is not served from the cache.
+    client.get("/v1/romannumeral?query=137")
+
+    for stage in ("validation", "conversion", "serialization", "logging"):
+        labels = {"endpoint": "/v1/romannumeral", "stage": stage}
+        assert REGISTRY.get_sample_value("http_request_stage_latency_seconds_count", labels) > 0
@@ -0,0 +1,151 @@
+import io
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.router import export_cache, response_cache
+from app.service.export import parse_range
+from app.settings import settings
+
+
+def test_csv_export_full_domain(client):
+    """
+    Check: Does the default export return every value of the domain as CSV
+    Purpose: Validates the header row, row count and download headers
+    """
+    response = client.get("/v1/romannumeral/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(response.content))
+    assert "roman-1-255.csv" in response.headers["content-disposition"]
+
+    lines = response.text.splitlines()
+    assert lines[0] == "input,output"
+    assert lines[1] == "1,I"
+    assert lines[-1] == "255,CCLV"
+    assert len(lines) == 256
+
+
+def test_csv_export_sub_range(client):
+    """
+    Check: Does min/max restrict the export to an inclusive sub-range
+    Purpose: Ensures partial table downloads match the range endpoint
+    """
+    response = client.get("/v1/romannumeral/export?format=csv&min=3&max=5")
+
+    assert response.status_code == 200
+    assert response.text == "input,output\n3,III\n4,IV\n5,V\n"
+
+
+def test_export_rejects_bad_input(client):
+    """
+    Check: Do an unknown format and an out-of-range bound return HTTP 400
+    Purpose: Ensures export validation matches the other conversion routes
+    """
+    assert client.get("/v1/romannumeral/export?format=xml").status_code == 400
+    assert client.get("/v1/romannumeral/export?format=csv&max=300").status_code == 400
+
+
+def test_export_etag_revalidation(client):
+    """
+    Check: Does a matching If-None-Match return 304 with no body
+    Purpose: Lets clients revalidate a cached download without transferring it again
+    """
+    first = client.get("/v1/romannumeral/export?format=csv&min=1&max=10")
+    etag = first.headers["etag"]
+
+    second = client.get(
+        "/v1/romannumeral/export?format=csv&min=1&max=10",
+        headers={"If-None-Match": etag},
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+
+    other = client.get("/v1/romannumeral/export?format=csv&min=1&max=11")
+    assert other.headers["etag"] != etag
+
+
+def test_export_byte_range(client):
+    """
+    Check: Does a Range header return the requested slice with 206 and Content-Range
+    Purpose: Supports resuming interrupted downloads
+    """
+    full = client.get("/v1/romannumeral/export?format=csv").content
+
+    partial = client.get("/v1/romannumeral/export?format=csv", headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == full[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(full)}"
+
+    tail = client.get("/v1/romannumeral/export?format=csv", headers={"Range": "bytes=-5"})
+    assert tail.content == full[-5:]
+
+    beyond = client.get("/v1/romannumeral/export?format=csv", headers={"Range": f"bytes={len(full)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(full)}"
+
+
+def test_parse_range():
+    """
+    Check: Are open, suffix, multi-range and unsatisfiable ranges interpreted per RFC 9110
+    Purpose: Validates the Range parser independently of the endpoint
+    """
+    assert parse_range("bytes=0-99", 50) == (0, 49)
+    assert parse_range("bytes=40-", 50) == (40, 49)
+    assert parse_range("bytes=-10", 50) == (40, 49)
+    assert parse_range("bytes=0-1,5-6", 50) is None
+    assert parse_range("items=0-1", 50) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=60-70", 50)
+    with pytest.raises(ValueError):
+        parse_range("bytes=abc", 50)
+
+
+def test_arrow_and_parquet_exports(client):
+    """
+    Check: Do the Arrow and Parquet exports round-trip to the same columns as CSV
+    Purpose: Validates the columnar formats when pyarrow is installed
+    """
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    arrow = client.get("/v1/romannumeral/export?format=arrow&min=1&max=4")
+    assert arrow.status_code == 200
+    table = pa.ipc.open_stream(arrow.content).read_all()
+    assert table.column("input").to_pylist() == [1, 2, 3, 4]
+    assert table.column("output").to_pylist() == ["I", "II", "III", "IV"]
+
+    parquet = client.get("/v1/romannumeral/export?format=parquet&min=1&max=4")
+    assert parquet.status_code == 200
+    assert pq.read_table(io.BytesIO(parquet.content)).equals(table)
+
+
+def test_export_rejects_too_many_rows(client, monkeypatch):
+    """
+    Check: Does an export wider than export_max_rows return HTTP 400 while a narrower one succeeds
+    Purpose: Ensures a single request cannot serialize an unbounded file
+    """
+    monkeypatch.setattr(settings, "export_max_rows", 100)
+
+    assert client.get("/v1/romannumeral/export?format=csv").status_code == 400
+    assert client.get("/v1/romannumeral/export?format=csv&min=1&max=100").status_code == 200
+
+
+def test_export_cache_has_its_own_metrics(client):
+    """
+    Check: Are export cache lookups and sizes reported under cache="export", leaving the response cache metrics alone
+    Purpose: Ensures large export files do not distort the conversion response cache metrics
+    """
+    def sample(name, cache):
+        return REGISTRY.get_sample_value(name, {"cache": cache}) or 0
+
+    response_misses = sample("response_cache_misses_total", "response")
+    export_misses = sample("response_cache_misses_total", "export")
+    client.get("/v1/romannumeral/export?format=csv&min=1&max=42")
+
+    assert sample("response_cache_misses_total", "export") == export_misses + 1
+    assert sample("response_cache_misses_total", "response") == response_misses
+    assert sample("response_cache_bytes", "export") == export_cache.size
+    assert sample("response_cache_bytes", "response") == response_cache.size
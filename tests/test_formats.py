@@ -0,0 +1,128 @@
+import struct
+
+import pytest
+
+from app.service import formats
+
+
+def decode_binary_range(body: bytes) -> list[tuple[int, str]]:
+    (count,), offset, items = struct.unpack_from(">I", body), 4, []
+    for _ in range(count):
+        number, size = struct.unpack_from(">IB", body, offset)
+        offset += 5
+        items.append((number, body[offset:offset + size].decode("utf-8")))
+        offset += size
+    assert offset == len(body)
+    return items
+
+
+def test_negotiate_format():
+    """
+    Check: Does Accept negotiation pick binary formats only when preferred, defaulting to JSON
+    Purpose: Ensures existing JSON clients are unaffected
+
+    """
+    assert formats.negotiate("") == "json"
+    assert formats.negotiate("*/*") == "json"
+    assert formats.negotiate("text/html") == "json"
+    assert formats.negotiate("application/msgpack") == "msgpack"
+    assert formats.negotiate("application/x-msgpack") == "msgpack"
+    assert formats.negotiate("application/vnd.roman.binary") == "binary"
+    assert formats.negotiate("application/json, application/msgpack") == "json"
+    assert formats.negotiate("application/json;q=0.5, application/msgpack") == "msgpack"
+    assert formats.negotiate("application/msgpack;q=0") == "json"
+
+
+def test_msgpack_matches_json_shape():
+    """
+    Check: Is the MessagePack encoding the JSON document written in MessagePack
+    Purpose: Validates the hand-written encoder byte for byte on a small response
+
+    """
+    assert formats.encode_single("msgpack", 4, "IV") == (
+        b"\x82\xa5input\xa14\xa6output\xa2IV"
+    )
+    msgpack = pytest.importorskip("msgpack")
+    outputs = tuple(f"N{n}" * (n % 40) for n in range(1, 300))
+    assert msgpack.unpackb(formats.encode_range("msgpack", 1, outputs)) == {
+        "conversions": [{"input": str(n), "output": o} for n, o in zip(range(1, 300), outputs)]
+    }
+
+
+def test_binary_range_round_trip():
+    """
+    Check: Does the length-prefixed range encoding decode back to the same pairs, including vinculum numerals
+    Purpose: Validates the record layout documented in app.service.formats
+
+    """
+    outputs = ("MMMCMXCIX", "I̅V̅")
+    body = formats.encode_range("binary", 3999, outputs)
+    assert decode_binary_range(body) == [(3999, "MMMCMXCIX"), (4000, "I̅V̅")]
+
+
+def test_range_endpoint_negotiates_formats(client):
+    """
+    Check: Do msgpack and binary Accept headers return the same conversions as JSON
+    Purpose: Validates negotiation, media types and per-format caching on /v1/romannumeral
+
+    """
+    json_body = client.get("/v1/romannumeral?min=1&max=255").json()["conversions"]
+
+    binary = client.get("/v1/romannumeral?min=1&max=255", headers={"Accept": formats.BINARY_MEDIA_TYPE})
+    assert binary.headers["content-type"] == formats.BINARY_MEDIA_TYPE
+    assert decode_binary_range(binary.content) == [
+        (int(item["input"]), item["output"]) for item in json_body
+    ]
+
+    single = client.get("/v1/romannumeral?query=4", headers={"Accept": formats.MSGPACK_MEDIA_TYPE})
+    assert single.headers["content-type"] == formats.MSGPACK_MEDIA_TYPE
+    assert single.content == b"\x82\xa5input\xa14\xa6output\xa2IV"
+    assert single.headers["etag"] != client.get("/v1/romannumeral?query=4").headers["etag"]
+
+
+def test_batch_endpoint_negotiates_formats(client):
+    """
+    Check: Does the batch endpoint encode outputs and errors in the binary format
+    Purpose: Validates the flag byte and field lengths of batch records
+
+    """
+    response = client.post(
+        "/v1/romannumeral/batch",
+        json=[4, "XIV", 300],
+        headers={"Accept": formats.BINARY_MEDIA_TYPE},
+    )
+    body = response.content
+    assert struct.unpack_from(">I", body) == (3,)
+    assert body[4:] == (
+        b"\x00" + b"\x00\x00\x00\x014" + b"\x00\x00\x00\x02IV"
+        + b"\x00" + b"\x00\x00\x00\x03XIV" + b"\x00\x00\x00\x0214"
+        + b"\x01" + b"\x00\x00\x00\x03300" + b"\x00\x00\x00\x1fInput must be between 1 and 255"
+    )
+
+
+def test_binary_batch_echoes_long_inputs(client):
+    """
+    Check: Does a batch item longer than 65535 bytes encode in the binary format instead of failing
+    Purpose: Ensures client-controlled input lengths cannot turn a 200 into a 500
+
+    """
+    item = "X" * 70000
+    response = client.post("/v1/romannumeral/batch", json=[item], headers={"Accept": formats.BINARY_MEDIA_TYPE})
+
+    assert response.status_code == 200
+    body = response.content
+    assert struct.unpack_from(">IBI", body) == (1, 1, 70000)
+    assert body[9:9 + 70000].decode() == item
+
+
+def test_msgpack_range_with_vinculum_numerals():
+    """
+    Check: Do overlined numerals (non-ASCII) take the general MessagePack path and decode correctly
+    Purpose: Guards the ASCII fast path in encode_range
+
+    """
+    msgpack = pytest.importorskip("msgpack")
+    outputs = ("MMMCMXCIX", "I̅V̅")
+    assert msgpack.unpackb(formats.encode_range("msgpack", 3999, outputs)) == {
+        "conversions": [{"input": "3999", "output": "MMMCMXCIX"}, {"input": "4000", "output": "I̅V̅"}]
+    }
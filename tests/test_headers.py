@@ -19,3 +19,32 @@ def test_request_id_propagation(client):
     response = client.get("/v1/romannumeral?query=5", headers=headers)
     
     assert response.headers["X-Request-ID"] == "test-id-123"
+
+
+def test_request_id_not_generated_when_supplied(client, monkeypatch):
+    """
+    Check: Is uuid4 skipped entirely when the client supplies a request ID
+    Purpose: Ensures the middleware only pays for ID generation when it needs a new ID
+
+    """
+    import app.middleware.request as request_middleware
+
+    def fail():
+        raise AssertionError("uuid4 should not be called")
+
+    monkeypatch.setattr(request_middleware.uuid, "uuid4", fail)
+    response = client.get("/v1/romannumeral?query=5", headers={"X-Request-ID": "client-id"})
+
+    assert response.headers["X-Request-ID"] == "client-id"
+
+
+def test_request_id_streaming(client):
+    """
+    Check: Does a streamed response carry the request ID header and its full body
+    Purpose: Verifies the ASGI middleware passes streaming responses through untouched
+
+    """
+    response = client.get("/v1/romannumeral?min=1&max=255&stream=true", headers={"X-Request-ID": "stream-id"})
+
+    assert response.headers["X-Request-ID"] == "stream-id"
+    assert len(response.text.splitlines()) == 255
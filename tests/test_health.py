@@ -1,3 +1,9 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.main import app
+
+
 def test_health_endpoint(client):
     """
     Check: Does the health endpoint respond with the correct status of 200 and 'ok'
@@ -8,3 +14,23 @@ def test_health_endpoint(client):
     
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_ready_only_after_warm_up(client):
+    """
+    Check: Does /ready return 503 until the lifespan has warmed up, 200 while running, and 503 after shutdown
+    Purpose: Validates the readiness probe is separate from liveness
+    
+    """
+    # The shared client never runs the lifespan, so the app is live but not ready.
+    assert client.get("/health").status_code == 200
+    assert client.get("/ready").status_code == 503
+
+    with TestClient(app) as running:
+        response = running.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+
+    assert client.get("/ready").status_code == 503
+    assert REGISTRY.get_sample_value("app_import_seconds") > 0
+    assert REGISTRY.get_sample_value("app_startup_seconds") >= REGISTRY.get_sample_value("app_import_seconds")
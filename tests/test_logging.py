@@ -0,0 +1,209 @@
+import io
+import json
+import logging
+import os
+import signal
+import threading
+import time
+
+from prometheus_client import REGISTRY
+
+from app.logs.config import AsyncLogHandler, JsonFormatter
+from app.logs.context import LogSampler, RequestContextFilter, request_id_var
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class StalledStream(io.StringIO):
+    """A stream whose first write blocks until released, so the queue fills up."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def test_async_handler_writes_all_records_on_close():
+    """
+    Check: Are all queued records written, in order, once the handler is closed
+    Purpose: Validates that shutdown flushes the background writer cleanly
+
+    """
+    stream = io.StringIO()
+    handler = AsyncLogHandler(stream, maxsize=100, overflow="block", batch_size=8)
+    handler.setFormatter(JsonFormatter())
+
+    for i in range(50):
+        handler.handle(_record(f"message-{i}"))
+    handler.close()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == [f"message-{i}" for i in range(50)]
+
+
+def test_async_handler_drops_and_counts_on_overflow():
+    """
+    Check: When the queue is full under the drop policy, are records discarded and counted, and is the full queue visible in log_queue_depth
+    Purpose: Ensures logging never blocks the request path when the writer falls behind
+
+    """
+
+    stream = StalledStream()
+    handler = AsyncLogHandler(stream, maxsize=2, overflow="drop", batch_size=1)
+    handler.setFormatter(JsonFormatter())
+    before = REGISTRY.get_sample_value("log_records_dropped_total") or 0
+
+    for i in range(20):
+        handler.handle(_record(f"message-{i}"))
+
+    dropped = REGISTRY.get_sample_value("log_records_dropped_total") - before
+    # The writer is stalled, yet the gauge shows the full queue.
+    assert REGISTRY.get_sample_value("log_queue_depth") == 2
+    stream.release.set()
+    handler.close()
+
+    written = len(stream.getvalue().splitlines())
+    assert dropped > 0
+    assert written + dropped == 20
+
+
+def test_async_handler_can_be_closed_in_forked_child():
+    """
+    Check: Can a forked child close an inherited async handler whose queue is full and whose writer is stalled
+    Purpose: Ensures prefork workers cannot hang at startup when replacing the master's log handler
+
+    """
+    stream = StalledStream()
+    handler = AsyncLogHandler(stream, maxsize=1, overflow="drop", batch_size=1)
+    handler.setFormatter(JsonFormatter())
+    for i in range(5):
+        handler.handle(_record(f"message-{i}"))
+    assert handler.queue.full()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: the writer thread is gone; closing must not wait on it.
+        handler.close()
+        os._exit(0)
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        finished, status = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            break
+        time.sleep(0.01)
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise AssertionError("forked child hung closing the inherited handler")
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    stream.release.set()
+    handler.close()
+
+
+def test_formatter_includes_extra_fields():
+    """
+    Check: Are fields passed with extra= (and the adapter's request_id) included in the JSON output
+    Purpose: Ensures latency_seconds and status reach request_completed log lines
+
+    """
+    from app.logs.utils import get_logger
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    logger = logging.getLogger("test.formatter")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        get_logger("test.formatter", "req-1").info(
+            "request_completed",
+            extra={"latency_seconds": 0.003, "status": 200},
+        )
+    finally:
+        logger.removeHandler(handler)
+
+    line = json.loads(stream.getvalue())
+    assert line["message"] == "request_completed"
+    assert line["request_id"] == "req-1"
+    assert line["latency_seconds"] == 0.003
+    assert line["status"] == 200
+
+
+def test_formatter_handles_integers_beyond_64_bits():
+    """
+    Check: Is a record whose extra fields hold an integer wider than 64 bits still written as JSON
+    Purpose: Ensures a client cannot suppress its own warning line by sending an oversized number
+
+    """
+    record = _record("invalid_input")
+    record.query = 10 ** 26
+
+    line = json.loads(JsonFormatter().format(record))
+    assert line["message"] == "invalid_input"
+    assert line["query"] == 10 ** 26
+
+
+def test_formatter_timestamp_format():
+    """
+    Check: Is the timestamp UTC ISO 8601 with millisecond precision and a Z suffix
+    Purpose: Keeps log output aligned with the documented log shape (log.json)
+
+    """
+    formatter = JsonFormatter()
+    record = _record("tick")
+    record.created = 1737577874.1239
+
+    assert json.loads(formatter.format(record))["timestamp"] == "2025-01-22T20:31:14.123Z"
+    # A second record within the same millisecond reuses the cached string.
+    assert formatter.formatTimestamp(1737577874.1231) is formatter.formatTimestamp(1737577874.1239)
+
+
+def test_request_context_reaches_router_logs(client):
+    """
+    Check: Do router log lines carry the request ID set by the middleware, without an adapter
+    Purpose: Validates the contextvar-based request context end to end
+
+    """
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    handler.addFilter(RequestContextFilter())
+    logger = logging.getLogger("app.api.router")
+    logger.addHandler(handler)
+    try:
+        client.get("/v1/romannumeral?query=7", headers={"X-Request-ID": "ctx-id"})
+    finally:
+        logger.removeHandler(handler)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["request_received", "request_completed"]
+    assert all(line["request_id"] == "ctx-id" for line in lines)
+    assert request_id_var.get() is None
+
+
+def test_log_sampler():
+    """
+    Check: Does the sampler keep failures and slow requests while thinning routine successes
+    Purpose: Validates the configurable sampling policy for request log lines
+
+    """
+    never = LogSampler(rate=0.0, slow_threshold=0.5)
+    assert never.sample() is False
+    assert never.should_log_completion(False, 200, 0.001) is False
+    assert never.should_log_completion(False, 400, 0.001) is True
+    assert never.should_log_completion(False, 200, 0.5) is True
+
+    always = LogSampler(rate=1.0)
+    assert always.sample() is True
+    assert always.should_log_completion(True, 200, 0.001) is True
+
+    half = LogSampler(rate=0.5)
+    kept = sum(half.sample() for _ in range(10_000))
+    assert 4000 < kept < 6000
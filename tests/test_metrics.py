@@ -8,3 +8,34 @@ def test_metrics_endpoint(client):
     
     assert response.status_code == 200
     assert "http_requests_total" in response.text
+
+
+def test_latency_histogram_has_sub_millisecond_buckets(client):
+    """
+    Check: Does the request latency histogram expose buckets below 1 ms
+    Purpose: Ensures percentiles are meaningful for requests that finish well under a millisecond
+
+    """
+    client.get("/v1/romannumeral?query=10")
+    response = client.get("/metrics")
+
+    assert 'http_request_latency_seconds_bucket{endpoint="/v1/romannumeral",le="0.0005"}' in response.text
+
+
+def test_slow_requests_carry_request_id_exemplar():
+    """
+    Check: Is the request ID attached as an exemplar to observations above the threshold
+    Purpose: Links the slowest latency buckets to concrete requests in OpenMetrics output
+
+    """
+    from prometheus_client import REGISTRY
+    from prometheus_client.openmetrics.exposition import generate_latest
+
+    from app.service.metrics import observe_request
+
+    observe_request("GET", "/v1/integer", 200, 0.75, "slow-request-id")
+    observe_request("GET", "/v1/integer", 200, 0.00001, "fast-request-id")
+    exposition = generate_latest(REGISTRY).decode()
+
+    assert 'request_id="slow-request-id"' in exposition
+    assert 'request_id="fast-request-id"' not in exposition
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+from app.service import multiproc
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Each "worker" serves one conversion request in its own interpreter.
+WORKER = """
+from fastapi.testclient import TestClient
+from app.main import app
+assert TestClient(app).get("/v1/romannumeral?query=10").status_code == 200
+"""
+
+# A separate process scrapes /metrics and prints the aggregated request count.
+SCRAPER = """
+from fastapi.testclient import TestClient
+from app.main import app
+for line in TestClient(app).get("/metrics").text.splitlines():
+    if line.startswith('http_requests_total{') and 'endpoint="/v1/romannumeral"' in line and 'status="200"' in line:
+        print("total", line.rsplit(" ", 1)[1])
+"""
+
+
+def _run(script: str, env: dict) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def test_metrics_aggregate_across_processes(tmp_path):
+    """
+    Check: With PROMETHEUS_MULTIPROC_DIR set, does /metrics aggregate requests served by other processes
+    Purpose: Validates multi-worker visibility of REQUEST_COUNT
+
+    """
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "counter_999999.db").write_bytes(b"stale")
+    multiproc.prepare_directory(str(metrics_dir))
+    assert list(metrics_dir.iterdir()) == []
+
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir)}
+    _run(WORKER, env)
+    _run(WORKER, env)
+
+    # Application logs share stdout, so pick out the scraper's own line.
+    totals = [line.split()[1] for line in _run(SCRAPER, env).splitlines() if line.startswith("total ")]
+    assert totals == ["2.0"]
+
+
+def test_mark_dead_removes_live_gauges(tmp_path, monkeypatch):
+    """
+    Check: Are a dead worker's live gauge files removed while its counters are kept
+    Purpose: Ensures replaced workers stop reporting gauges without losing counter totals
+
+    """
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    (tmp_path / "gauge_livesum_4242.db").write_bytes(b"")
+    (tmp_path / "counter_4242.db").write_bytes(b"")
+
+    multiproc.mark_dead(4242)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["counter_4242.db"]
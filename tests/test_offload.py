@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.router import render_json
+from app.service.offload import RangeOffloader
+from app.service.roman import RomanNumeralTranslateService
+from app.settings import settings
+
+
+def expected_body(service, start, stop):
+    return render_json({
+        "conversions": [
+            {"input": str(n), "output": service.convert(n)}
+            for n in range(start, stop)
+        ]
+    })
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_offloaded_range_matches_inline_rendering(kind):
+    """
+    Check: Do offloaded chunks reassemble into exactly the inline JSON body, in order
+    Purpose: Ensures the worker pool is a transparent replacement for the event-loop path
+
+    """
+    service = RomanNumeralTranslateService(max_value=3999, vinculum=False)
+    offloader = RangeOffloader(workers=2, kind=kind, chunk_size=97, max_pending=4)
+    try:
+        body = asyncio.run(offloader.render_range(service, 1, 1000))
+    finally:
+        offloader.shutdown()
+
+    assert body == expected_body(service, 1, 1000)
+
+
+def test_offloader_bounds_pending_chunks():
+    """
+    Check: Are at most max_pending chunks submitted at once, with the rest counted as waiting
+    Purpose: Validates the bounded queue and the saturation gauge
+
+    """
+    service = RomanNumeralTranslateService(max_value=3999)
+    offloader = RangeOffloader(workers=1, chunk_size=10, max_pending=2)
+    peak = {"in_flight": 0, "waiting": 0}
+    report = offloader._report
+
+    def tracking_report():
+        peak["in_flight"] = max(peak["in_flight"], offloader._in_flight)
+        peak["waiting"] = max(peak["waiting"], offloader._waiting)
+        report()
+
+    offloader._report = tracking_report
+    try:
+        asyncio.run(offloader.render_range(service, 1, 201))
+    finally:
+        offloader.shutdown()
+
+    assert peak["in_flight"] == 2
+    assert peak["waiting"] > 0
+    assert REGISTRY.get_sample_value("range_offload_saturation") == 0
+
+
+def test_offloader_validates_before_queueing():
+    """
+    Check: Does an invalid range raise ValueError without starting the pool
+    Purpose: Keeps the router's 400 handling unchanged for offloaded ranges
+
+    """
+    offloader = RangeOffloader(workers=1)
+    with pytest.raises(ValueError):
+        asyncio.run(offloader.render_range(RomanNumeralTranslateService(), 1, 300))
+    assert offloader._executor is None
+
+
+def test_range_endpoint_offloads_above_threshold(client, monkeypatch):
+    """
+    Check: Does a range wider than the threshold return the same response through the pool
+    Purpose: Validates the router wiring of the offload path
+
+    """
+    monkeypatch.setattr(settings, "offload_threshold", 10)
+    response = client.get("/v1/romannumeral?min=7&max=250")
+
+    assert response.status_code == 200
+    conversions = response.json()["conversions"]
+    assert len(conversions) == 244
+    assert conversions[0] == {"input": "7", "output": "VII"}
+    assert conversions[-1] == {"input": "250", "output": "CCL"}
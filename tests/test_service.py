@@ -1,5 +1,5 @@
 import pytest
-from app.service.roman import RomanNumeralTranslateService
+from app.service.roman import RomanNumeralTranslateService, STANDARD_MAX, VINCULUM_MAX
 
 # -------------------------
 # Fixture
@@ -86,3 +86,147 @@ def test_invalid_high(service):
     """
     with pytest.raises(ValueError):
         service.convert(256)
+
+
+def test_table_matches_greedy_reference(service):
+    """
+
+    Check: Does every entry of the precomputed table match the greedy reference algorithm.
+    Purpose: Guards the table-driven engine against drifting from the canonical conversion rules.
+
+    """
+    for number in range(service.min_value, service.max_value + 1):
+        assert service.convert(number) == service.convert_greedy(number)
+
+
+def test_convert_many(service):
+    """
+
+    Check: Does convert_many return the same numerals as single conversions, in order.
+    Purpose: Validates the slice-based range engine used by range requests.
+
+    """
+    assert service.convert_many(1, 4) == ("I", "II", "III")
+    assert list(service.convert_many(1, 256)) == [service.convert(n) for n in range(1, 256)]
+
+
+def test_convert_many_invalid(service):
+    """
+
+    Check: Does convert_many raise a ValueError for empty or out-of-range blocks.
+    Purpose: Ensures range conversions honour the same bounds as single conversions.
+
+    """
+    with pytest.raises(ValueError):
+        service.convert_many(0, 5)
+    with pytest.raises(ValueError):
+        service.convert_many(250, 258)
+    with pytest.raises(ValueError):
+        service.convert_many(5, 5)
+
+
+def test_standard_domain_matches_greedy_reference():
+    """
+
+    Check: With the bound raised to 3999, does every value match the greedy reference algorithm.
+    Purpose: Validates the digit-decomposition engine across the whole standard domain.
+
+    """
+    extended = RomanNumeralTranslateService(max_value=STANDARD_MAX)
+    for number in range(1, STANDARD_MAX + 1):
+        assert extended.convert(number) == extended.convert_greedy(number)
+    assert extended.convert(3999) == "MMMCMXCIX"
+    with pytest.raises(ValueError):
+        extended.convert(4000)
+
+
+def test_vinculum_notation():
+    """
+
+    Check: With vinculum enabled, are thousands above 3999 written with a combining overline.
+    Purpose: Validates the opt-in notation for values into the millions.
+
+    """
+    extended = RomanNumeralTranslateService(max_value=VINCULUM_MAX, vinculum=True)
+    assert extended.convert(4000) == "I\u0305V\u0305"
+    assert extended.convert(1_000_000) == "M\u0305"
+    assert extended.convert(3_999_999) == "M\u0305M\u0305M\u0305C\u0305M\u0305X\u0305C\u0305I\u0305X\u0305CMXCIX"
+    assert extended.convert_many(3998, 4002) == (
+        "MMMCMXCVIII",
+        "MMMCMXCIX",
+        "I\u0305V\u0305",
+        "I\u0305V\u0305I",
+    )
+
+
+def test_invalid_configuration():
+    """
+
+    Check: Is a bound beyond what the chosen notation can express rejected.
+    Purpose: Prevents configuring a domain with undefined numerals.
+
+    """
+    with pytest.raises(ValueError):
+        RomanNumeralTranslateService(max_value=4000)
+    with pytest.raises(ValueError):
+        RomanNumeralTranslateService(max_value=VINCULUM_MAX + 1, vinculum=True)
+
+
+def test_range_width_limit():
+    """
+
+    Check: Does convert_many refuse blocks wider than the configured limit.
+    Purpose: Ensures a single range request cannot exhaust memory.
+
+    """
+    limited = RomanNumeralTranslateService(max_value=STANDARD_MAX, max_range_width=100)
+    assert len(limited.convert_many(1, 101)) == 100
+    with pytest.raises(ValueError):
+        limited.convert_many(1, 102)
+
+
+def test_parse_round_trip(service):
+    """
+
+    Check: Does parsing every converted numeral return the original integer.
+    Purpose: Ensures the reverse dictionary stays in sync with the conversion table.
+
+    """
+    for number in range(service.min_value, service.max_value + 1):
+        assert service.parse(service.convert(number)) == number
+
+    extended = RomanNumeralTranslateService(max_value=VINCULUM_MAX, vinculum=True)
+    for number in (3999, 4000, 4001, 12_345, 999_999, 3_999_999):
+        assert extended.parse(extended.convert(number)) == number
+
+
+def test_parse_rejects_non_canonical(service):
+    """
+
+    Check: Are malformed, non-canonical and out-of-range numerals rejected with a ValueError.
+    Purpose: Validates that only canonical spellings within the domain are accepted.
+
+    """
+    for numeral in ["", "IIII", "IM", "VX", "XXXX", "iv", "MMMM", "CCLVI", "I\u0305V\u0305", "X" * 1000]:
+        with pytest.raises(ValueError):
+            service.parse(numeral)
+
+    extended = RomanNumeralTranslateService(max_value=VINCULUM_MAX, vinculum=True)
+    for numeral in ["I\u0305", "M\u0305\u0305", "\u0305I", "I\u0305V\u0305M", "I\u0305V\u0305IIII"]:
+        with pytest.raises(ValueError):
+            extended.parse(numeral)
+
+
+def test_convert_batch(service):
+    """
+
+    Check: Does convert_batch convert integers and numerals in order, reporting errors per item.
+    Purpose: Validates the single service call used by the batch endpoint.
+
+    """
+    assert service.convert_batch([1, "IV", 0, "bad"]) == [
+        ("I", None),
+        ("4", None),
+        (None, "Input must be between 1 and 255"),
+        (None, "Invalid Roman numeral"),
+    ]
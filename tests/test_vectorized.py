@@ -0,0 +1,81 @@
+import pytest
+
+from app.service.roman import RomanNumeralTranslateService, VINCULUM_MAX
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def service():
+    return RomanNumeralTranslateService()
+
+
+def test_numpy_column_matches_scalar_conversion(service):
+    """
+    Check: Does converting a NumPy column give the same numerals as per-value conversion
+    Purpose: Validates the table-gather path against the scalar engine
+
+    """
+    values = np.arange(1, 256)
+    result = service.convert_array(values)
+
+    assert not result.mask.any()
+    assert result.tolist() == [service.convert(int(v)) for v in values]
+
+
+def test_numpy_invalid_values_are_masked(service):
+    """
+    Check: Are out-of-range values masked instead of raising
+    Purpose: Ensures one bad row does not fail a whole column
+
+    """
+    result = service.convert_array(np.array([0, 1, 256, 4, -7], dtype=np.int32))
+
+    assert result.mask.tolist() == [True, False, True, False, True]
+    assert result.compressed().tolist() == ["I", "IV"]
+
+
+def test_numpy_vinculum_and_type_check():
+    """
+    Check: Are vinculum values gathered correctly, and are non-integer columns rejected
+    Purpose: Covers the extended domain and input validation
+
+    """
+    extended = RomanNumeralTranslateService(max_value=VINCULUM_MAX, vinculum=True)
+    values = np.array([3999, 4000, 123_456, 3_999_999])
+
+    assert extended.convert_array(values).tolist() == [extended.convert(int(v)) for v in values]
+    with pytest.raises(TypeError):
+        extended.convert_array(np.array([1.5, 2.0]))
+
+
+def test_arrow_column_with_nulls(service):
+    """
+    Check: Does an Arrow column convert with nulls for null and invalid inputs
+    Purpose: Validates the pyarrow compute path when pyarrow is installed
+
+    """
+    pa = pytest.importorskip("pyarrow")
+
+    result = service.convert_array(pa.array([1, None, 300, 9]))
+    assert result.to_pylist() == ["I", None, None, "IX"]
+
+    chunked = service.convert_array(pa.chunked_array([[1, 2], [3]]))
+    assert chunked.to_pylist() == ["I", "II", "III"]
+
+    extended = RomanNumeralTranslateService(max_value=VINCULUM_MAX, vinculum=True)
+    values = [4000, 12_345, 3_999_999]
+    assert extended.convert_array(pa.array(values)).to_pylist() == [extended.convert(v) for v in values]
+
+
+def test_unsigned_64_bit_columns_beyond_int64(service):
+    """
+    Check: Are uint64 values above the int64 range nulled (Arrow) or masked (NumPy) instead of raising
+    Purpose: Ensures the full range of every integer type is handled without an overflow error
+
+    """
+    pa = pytest.importorskip("pyarrow")
+    values = [1, 2**63 + 5, 2**64 - 1, 10]
+
+    assert service.convert_array(pa.array(values, type=pa.uint64())).to_pylist() == ["I", None, None, "X"]
+    assert service.convert_array(np.array(values, dtype=np.uint64)).mask.tolist() == [False, True, True, False]
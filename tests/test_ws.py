@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from prometheus_client import REGISTRY
+from starlette.websockets import WebSocketDisconnect
+
+from app.settings import settings
+
+
+def test_pipelined_frames_answered_in_order(client):
+    """
+    Check: Are pipelined single, range and batch frames answered in order with HTTP-identical bodies
+    Purpose: Validates the frame protocol against the equivalent HTTP responses
+
+    """
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text(json.dumps({"id": 1, "query": 10}))
+        ws.send_text(json.dumps({"id": 2, "min": 1, "max": 3}))
+        ws.send_text(json.dumps({"id": "b", "batch": [4, "XIV", 300]}))
+        replies = [ws.receive_json() for _ in range(3)]
+
+    assert [reply["id"] for reply in replies] == [1, 2, "b"]
+    assert [reply["status"] for reply in replies] == [200, 200, 200]
+    assert replies[0]["body"] == client.get("/v1/romannumeral?query=10").json()
+    assert replies[1]["body"] == client.get("/v1/romannumeral?min=1&max=3").json()
+    assert replies[2]["body"] == client.post("/v1/romannumeral/batch", json=[4, "XIV", 300]).json()
+
+
+def test_frame_errors_match_http(client):
+    """
+    Check: Do invalid frames get the same status and detail as the HTTP route, without closing the connection
+    Purpose: Ensures validation and error semantics are shared between transports
+
+    """
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text(json.dumps({"id": 1, "query": 300}))
+        ws.send_text(json.dumps({"id": 2, "min": 5, "max": 1}))
+        ws.send_text(json.dumps({"id": 3, "query": 1, "min": 1}))
+        ws.send_text(json.dumps({"id": 4, "query": "ten"}))
+        ws.send_text("not json")
+        ws.send_text(json.dumps({"id": 5, "query": 1}))
+        replies = [ws.receive_json() for _ in range(6)]
+
+    http = client.get("/v1/romannumeral?query=300")
+    assert replies[0] == {"id": 1, "status": 400, "body": http.json()}
+    assert replies[1]["body"] == {"detail": "min must be less than max"}
+    assert replies[2]["status"] == 400
+    assert replies[3]["status"] == 422
+    assert replies[4] == {"id": None, "status": 422, "body": {"detail": "Frame is not valid JSON"}}
+    assert replies[5]["status"] == 200
+
+
+def test_non_finite_frame_id_is_rejected(client):
+    """
+    Check: Do frames whose id is NaN, Infinity or an overflowing number get a 422 reply instead of closing the connection
+    Purpose: Ensures every parseable frame is answered, and counted under the status it was answered with
+
+    """
+    labels = {"method": "WS", "endpoint": "/v1/romannumeral/ws", "status": "422"}
+    before = REGISTRY.get_sample_value("http_requests_total", labels) or 0
+
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text('{"id": 1e999, "query": 10}')
+        ws.send_text('{"id": NaN, "query": 10}')
+        ws.send_text(json.dumps({"id": 3, "query": 10}))
+        replies = [ws.receive_json() for _ in range(3)]
+
+    assert replies[0] == replies[1] == {"id": None, "status": 422, "body": {"detail": "'id' must be a JSON-compliant value"}}
+    assert replies[2]["status"] == 200
+    assert REGISTRY.get_sample_value("http_requests_total", labels) == before + 2
+
+
+def test_frame_coercion_matches_http(client):
+    """
+    Check: Are integral floats, numeric strings and booleans coerced in frames exactly as the HTTP route coerces them
+    Purpose: Ensures a value accepted over HTTP is not rejected over the WebSocket, and vice versa
+
+    """
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text(json.dumps({"id": 1, "query": 10.0}))
+        ws.send_text(json.dumps({"id": 2, "batch": [True, 1.0, "XIV"]}))
+        ws.send_text(json.dumps({"id": 3, "query": 10.5}))
+        replies = [ws.receive_json() for _ in range(3)]
+
+    assert replies[0] == {"id": 1, "status": 200, "body": client.get("/v1/romannumeral?query=10.0").json()}
+    assert replies[1] == {"id": 2, "status": 200, "body": client.post("/v1/romannumeral/batch", json=[True, 1.0, "XIV"]).json()}
+    assert replies[2]["status"] == client.get("/v1/romannumeral?query=10.5").status_code == 422
+
+
+def test_frame_size_limit_counts_bytes(client, monkeypatch):
+    """
+    Check: Is a text frame whose characters fit the limit but whose UTF-8 bytes do not rejected with 1009
+    Purpose: Ensures ws_max_message_bytes is a byte limit for text frames too
+
+    """
+    monkeypatch.setattr(settings, "ws_max_message_bytes", 64)
+    frame = json.dumps({"batch": ["\u2160" * 20]}, ensure_ascii=False)
+    assert len(frame) <= 64 < len(frame.encode("utf-8"))
+
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text(frame)
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_json()
+    assert closed.value.code == 1009
+
+
+def test_oversized_frame_closes_connection(client, monkeypatch):
+    """
+    Check: Does a frame above the size limit close the connection with 1009 after earlier replies
+    Purpose: Validates the per-connection maximum message size
+
+    """
+    monkeypatch.setattr(settings, "ws_max_message_bytes", 64)
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        ws.send_text(json.dumps({"id": 1, "query": 1}))
+        ws.send_text(json.dumps({"id": 2, "batch": list(range(1, 50))}))
+        assert ws.receive_json()["id"] == 1
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_json()
+    assert closed.value.code == 1009
+
+
+def test_messages_recorded_in_request_metrics(client):
+    """
+    Check: Is every WebSocket message counted and timed in the request metrics
+    Purpose: Ensures per-message latency appears next to the HTTP routes
+
+    """
+    labels = {"method": "WS", "endpoint": "/v1/romannumeral/ws", "status": "200"}
+    before = REGISTRY.get_sample_value("http_requests_total", labels) or 0
+
+    with client.websocket_connect("/v1/romannumeral/ws") as ws:
+        for n in range(1, 6):
+            ws.send_text(json.dumps({"query": n}))
+        for _ in range(5):
+            ws.receive_json()
+
+    assert REGISTRY.get_sample_value("http_requests_total", labels) == before + 5
+    assert REGISTRY.get_sample_value(
+        "http_request_latency_seconds_count", {"endpoint": "/v1/romannumeral/ws"}
+    ) >= 5